@@ -52,6 +52,7 @@ from ._ntcore import (
     NetworkTableType,
     PubSubOptions,
     Publisher,
+    PublisherGroup,
     RawEntry,
     RawPublisher,
     RawSubscriber,
@@ -73,6 +74,7 @@ from ._ntcore import (
     StructSubscriber,
     StructTopic,
     Subscriber,
+    SubscriberGroup,
     TimeSyncEventData,
     TimestampedBoolean,
     TimestampedBooleanArray,
@@ -144,6 +146,7 @@ __all__ = [
     "NetworkTableType",
     "PubSubOptions",
     "Publisher",
+    "PublisherGroup",
     "RawEntry",
     "RawPublisher",
     "RawSubscriber",
@@ -165,6 +168,7 @@ __all__ = [
     "StructSubscriber",
     "StructTopic",
     "Subscriber",
+    "SubscriberGroup",
     "TimeSyncEventData",
     "TimestampedBoolean",
     "TimestampedBooleanArray",
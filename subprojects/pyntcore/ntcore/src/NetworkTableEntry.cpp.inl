@@ -45,4 +45,25 @@ cls_NetworkTableEntry
     .def("setDefaultValue", [](nt::NetworkTableEntry *self, py::sequence value) {
         return self->SetDefaultValue(pyntcore::py2ntvalue(value));
     }, py::arg("value"))
+
+    .def("getBooleanArrayNp", &pyntcore::GetBooleanArrayEntryNp, py::arg("defaultValue"),
+        py::doc("Gets the entry's value as a numpy array of bool. If the entry does not\n"
+                "exist or is of different type, it will return the default value.\n"
+                "\n"
+                ".. note:: numpy must be installed to use this function"))
+    .def("getDoubleArrayNp", &pyntcore::GetDoubleArrayEntryNp, py::arg("defaultValue"),
+        py::doc("Gets the entry's value as a numpy array of float64. If the entry does not\n"
+                "exist or is of different type, it will return the default value.\n"
+                "\n"
+                ".. note:: numpy must be installed to use this function"))
+    .def("getFloatArrayNp", &pyntcore::GetFloatArrayEntryNp, py::arg("defaultValue"),
+        py::doc("Gets the entry's value as a numpy array of float32. If the entry does not\n"
+                "exist or is of different type, it will return the default value.\n"
+                "\n"
+                ".. note:: numpy must be installed to use this function"))
+    .def("getIntegerArrayNp", &pyntcore::GetIntegerArrayEntryNp, py::arg("defaultValue"),
+        py::doc("Gets the entry's value as a numpy array of int64. If the entry does not\n"
+                "exist or is of different type, it will return the default value.\n"
+                "\n"
+                ".. note:: numpy must be installed to use this function"))
 ;
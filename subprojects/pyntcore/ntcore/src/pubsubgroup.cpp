@@ -0,0 +1,309 @@
+
+#include "pubsubgroup.h"
+#include "py2value.h"
+
+#include <networktables/BooleanArrayTopic.h>
+#include <networktables/BooleanTopic.h>
+#include <networktables/DoubleArrayTopic.h>
+#include <networktables/DoubleTopic.h>
+#include <networktables/FloatArrayTopic.h>
+#include <networktables/FloatTopic.h>
+#include <networktables/GenericEntry.h>
+#include <networktables/IntegerArrayTopic.h>
+#include <networktables/IntegerTopic.h>
+#include <networktables/NetworkTableInstance.h>
+#include <networktables/RawTopic.h>
+#include <networktables/StringArrayTopic.h>
+#include <networktables/StringTopic.h>
+
+#include <pybind11/stl.h>
+#include <wpi_span_type_caster.h>
+
+namespace pyntcore {
+
+template <typename T>
+static std::span<const T> loadSpan(py::detail::make_caster<std::span<const T>> &conv,
+                                   py::handle value) {
+    if (!conv.load(value, true)) {
+        throw py::cast_error();
+    }
+    return py::detail::cast_op<std::span<const T>>(conv);
+}
+
+PublisherGroup::PublisherGroup(const py::sequence &publishers) {
+    m_items.reserve(publishers.size());
+    for (auto pub : publishers) {
+        auto handle = pub.cast<const nt::Publisher&>().GetHandle();
+        if (handle == 0) {
+            throw py::value_error(fmt::format(
+                "publisher {} is not valid", m_items.size()));
+        }
+
+        NT_Type type;
+        std::string typeString;
+        {
+            py::gil_scoped_release release;
+            auto topic = nt::GetTopicFromHandle(handle);
+            type = nt::GetTopicType(topic);
+            typeString = nt::GetTopicTypeString(topic);
+        }
+
+        Item item{handle, type, Kind::kValue};
+        if (type == NT_RAW && typeString.starts_with("struct:")) {
+            if (typeString.ends_with("[]")) {
+                item.kind = Kind::kStructArray;
+                typeString.resize(typeString.size() - 2);
+            } else {
+                item.kind = Kind::kStruct;
+            }
+            item.structTypeString = std::move(typeString);
+        }
+
+        m_items.push_back(std::move(item));
+        m_publishers.append(pub);
+    }
+}
+
+// The value must be of a type that is serialized as the struct type of
+// the topic. The info for the last type is kept, so this is usually just
+// an identity check
+const WPyStructInfo &PublisherGroup::getStructInfo(Item &item, py::handle value) {
+    auto t = py::type::of(value);
+    if (!item.structType.is(t)) {
+        WPyStructInfo info(t);
+        if (info->GetTypeString() != item.structTypeString) {
+            throw py::type_error(fmt::format(
+                "{} is serialized as {}, but the topic type is {}",
+                pytypename(t), info->GetTypeString(), item.structTypeString));
+        }
+        item.structType = t;
+        item.structInfo = info;
+    }
+    return item.structInfo;
+}
+
+nt::Value PublisherGroup::convert(Item &item, py::handle value, int64_t time) {
+    switch (item.type) {
+    case NT_BOOLEAN:
+        return nt::Value::MakeBoolean(value.cast<bool>(), time);
+    case NT_INTEGER:
+        return nt::Value::MakeInteger(value.cast<int64_t>(), time);
+    case NT_FLOAT:
+        return nt::Value::MakeFloat(value.cast<float>(), time);
+    case NT_DOUBLE:
+        return nt::Value::MakeDouble(value.cast<double>(), time);
+    case NT_STRING:
+        return nt::Value::MakeString(value.cast<std::string>(), time);
+    case NT_RAW: {
+        if (item.kind == Kind::kStruct) {
+            auto &info = getStructInfo(item, value);
+            std::vector<uint8_t> buf(info->GetSize());
+            info->Pack(buf, WPyStruct(py::reinterpret_borrow<py::object>(value)));
+            return nt::Value::MakeRaw(std::move(buf), time);
+        } else if (item.kind == Kind::kStructArray) {
+            if (!py::isinstance<py::sequence>(value)) {
+                throw py::cast_error();
+            }
+            auto values = py::reinterpret_borrow<py::sequence>(value);
+            std::vector<uint8_t> buf;
+            size_t i = 0;
+            for (auto v : values) {
+                auto &info = getStructInfo(item, v);
+                auto size = info->GetSize();
+                if (buf.empty()) {
+                    buf.resize(size * values.size());
+                }
+                info->Pack(std::span{buf}.subspan(i * size, size),
+                           WPyStruct(py::reinterpret_borrow<py::object>(v)));
+                i++;
+            }
+            return nt::Value::MakeRaw(std::move(buf), time);
+        }
+        return nt::Value::MakeRaw(value.cast<std::span<const uint8_t>>(), time);
+    }
+    case NT_BOOLEAN_ARRAY: {
+        py::detail::make_caster<std::span<const bool>> conv;
+        return nt::Value::MakeBooleanArray(loadSpan<bool>(conv, value), time);
+    }
+    case NT_INTEGER_ARRAY: {
+        py::detail::make_caster<std::span<const int64_t>> conv;
+        return nt::Value::MakeIntegerArray(loadSpan<int64_t>(conv, value), time);
+    }
+    case NT_FLOAT_ARRAY: {
+        py::detail::make_caster<std::span<const float>> conv;
+        return nt::Value::MakeFloatArray(loadSpan<float>(conv, value), time);
+    }
+    case NT_DOUBLE_ARRAY: {
+        py::detail::make_caster<std::span<const double>> conv;
+        return nt::Value::MakeDoubleArray(loadSpan<double>(conv, value), time);
+    }
+    case NT_STRING_ARRAY:
+        return nt::Value::MakeStringArray(value.cast<std::vector<std::string>>(), time);
+    default:
+        throw py::cast_error();
+    }
+}
+
+void PublisherGroup::set(const py::sequence &values, int64_t time) {
+    if (values.size() != m_items.size()) {
+        throw py::value_error(fmt::format(
+            "expected {} values, got {}", m_items.size(), values.size()));
+    }
+
+    std::vector<nt::Value> converted;
+    converted.reserve(m_items.size());
+    for (size_t i = 0; i < m_items.size(); i++) {
+        auto &item = m_items[i];
+        try {
+            converted.push_back(convert(item, values[i], time));
+        } catch (py::cast_error &) {
+            throw py::type_error(fmt::format(
+                "value {} cannot be converted to {}", i, nttype2str(item.type)));
+        } catch (py::type_error &e) {
+            throw py::type_error(fmt::format("value {}: {}", i, e.what()));
+        }
+    }
+
+    // StructPublisher.set publishes the schema before the first value, and
+    // so does the group
+    for (auto &item : m_items) {
+        if (item.structType && !item.schemaPublished) {
+            nt::NetworkTableInstance inst{nt::GetInstanceFromHandle(item.handle)};
+            inst.AddStructSchema<WPyStruct>(item.structInfo);
+            item.schemaPublished = true;
+        }
+    }
+
+    py::gil_scoped_release release;
+    for (size_t i = 0; i < m_items.size(); i++) {
+        nt::SetEntryValue(m_items[i].handle, converted[i]);
+    }
+}
+
+size_t PublisherGroup::size() const {
+    return m_items.size();
+}
+
+// NT_UNASSIGNED is used for generic subscribers, which accept any type
+static NT_Type subscriberType(py::handle sub) {
+    if (py::isinstance<nt::BooleanSubscriber>(sub)) {
+        return NT_BOOLEAN;
+    } else if (py::isinstance<nt::IntegerSubscriber>(sub)) {
+        return NT_INTEGER;
+    } else if (py::isinstance<nt::FloatSubscriber>(sub)) {
+        return NT_FLOAT;
+    } else if (py::isinstance<nt::DoubleSubscriber>(sub)) {
+        return NT_DOUBLE;
+    } else if (py::isinstance<nt::StringSubscriber>(sub)) {
+        return NT_STRING;
+    } else if (py::isinstance<nt::RawSubscriber>(sub)) {
+        return NT_RAW;
+    } else if (py::isinstance<nt::BooleanArraySubscriber>(sub)) {
+        return NT_BOOLEAN_ARRAY;
+    } else if (py::isinstance<nt::IntegerArraySubscriber>(sub)) {
+        return NT_INTEGER_ARRAY;
+    } else if (py::isinstance<nt::FloatArraySubscriber>(sub)) {
+        return NT_FLOAT_ARRAY;
+    } else if (py::isinstance<nt::DoubleArraySubscriber>(sub)) {
+        return NT_DOUBLE_ARRAY;
+    } else if (py::isinstance<nt::StringArraySubscriber>(sub)) {
+        return NT_STRING_ARRAY;
+    } else if (py::isinstance<nt::GenericSubscriber>(sub)) {
+        return NT_UNASSIGNED;
+    }
+    throw py::type_error(fmt::format(
+        "{} cannot be used in a SubscriberGroup",
+        py::repr(py::type::handle_of(sub)).cast<std::string>()));
+}
+
+SubscriberGroup::SubscriberGroup(const py::sequence &subscribers) {
+    m_items.reserve(subscribers.size());
+    for (auto sub : subscribers) {
+        auto type = subscriberType(sub);
+        auto handle = sub.cast<const nt::Subscriber&>().GetHandle();
+        if (handle == 0) {
+            throw py::value_error(fmt::format(
+                "subscriber {} is not valid", m_items.size()));
+        }
+
+        m_items.push_back(Item{handle, type});
+        m_subscribers.append(sub);
+    }
+}
+
+std::vector<nt::Value> SubscriberGroup::readAll() const {
+    std::vector<nt::Value> values;
+    values.reserve(m_items.size());
+
+    py::gil_scoped_release release;
+    for (auto &item : m_items) {
+        values.push_back(nt::GetEntryValue(item.handle));
+    }
+    return values;
+}
+
+bool SubscriberGroup::isValid(const Item &item, const nt::Value &value) const {
+    return value && (item.type == NT_UNASSIGNED || value.type() == item.type);
+}
+
+py::tuple SubscriberGroup::getAll() {
+    auto values = readAll();
+
+    py::tuple result(m_items.size());
+    for (size_t i = 0; i < m_items.size(); i++) {
+        py::object v;
+        if (isValid(m_items[i], values[i])) {
+            v = ntvalue2py(values[i]);
+        } else {
+            // no value, so this returns the default value
+            v = m_subscribers[i].attr("get")();
+        }
+        PyTuple_SET_ITEM(result.ptr(), i, v.release().ptr());
+    }
+    return result;
+}
+
+py::array_t<double> SubscriberGroup::getAllNp() {
+    for (auto &item : m_items) {
+        if (item.type != NT_BOOLEAN && item.type != NT_INTEGER &&
+            item.type != NT_FLOAT && item.type != NT_DOUBLE) {
+            throw py::type_error(fmt::format(
+                "getAllNp cannot be used with {} subscribers",
+                item.type == NT_UNASSIGNED ? "generic" : nttype2str(item.type)));
+        }
+    }
+
+    auto values = readAll();
+
+    auto result = empty1d<double>(m_items.size());
+    auto data = result.mutable_data();
+    for (size_t i = 0; i < m_items.size(); i++) {
+        auto &value = values[i];
+        if (!isValid(m_items[i], value)) {
+            data[i] = m_subscribers[i].attr("get")().cast<double>();
+            continue;
+        }
+
+        switch (value.type()) {
+        case NT_BOOLEAN:
+            data[i] = value.GetBoolean() ? 1.0 : 0.0;
+            break;
+        case NT_INTEGER:
+            data[i] = static_cast<double>(value.GetInteger());
+            break;
+        case NT_FLOAT:
+            data[i] = value.GetFloat();
+            break;
+        default:
+            data[i] = value.GetDouble();
+            break;
+        }
+    }
+    return result;
+}
+
+size_t SubscriberGroup::size() const {
+    return m_items.size();
+}
+
+}; // namespace pyntcore
@@ -0,0 +1,132 @@
+#pragma once
+
+#include <robotpy_build.h>
+#include <ntcore_cpp.h>
+#include <networktables/Topic.h>
+#include <pybind11/numpy.h>
+#include <wpystruct.h>
+
+#include <vector>
+
+namespace pyntcore {
+
+/**
+    Sets the values of a fixed group of publishers in a single call.
+
+    Publishing a value through each publisher individually converts it,
+    releases the GIL and enters ntcore once per publisher. The group instead
+    converts every value first and then publishes all of them with the GIL
+    released once, which is much cheaper when a robot publishes many values
+    every loop.
+
+    The group keeps a reference to each publisher, so they will not be
+    unpublished while the group exists.
+*/
+class PublisherGroup {
+public:
+  /**
+      :param publishers: Publishers to set. Any typed publisher (including
+                         struct publishers) or GenericPublisher may be used.
+
+      .. note:: Like :meth:`.StructPublisher.set`, the schema of a struct
+                topic is published the first time that a value is set,
+                because it depends on the type of the value
+  */
+  PublisherGroup(const py::sequence &publishers);
+
+  /**
+      Publish a new value for each publisher in the group.
+
+      All values are converted before any of them are published, so if a
+      value cannot be converted an exception is raised and nothing is
+      published.
+
+      :param values: One value for each publisher, in the same order as the
+                     publishers were passed to the constructor
+      :param time:   timestamp; 0 indicates current NT time should be used
+  */
+  void set(const py::sequence &values, int64_t time = 0);
+
+  /**
+      Returns the number of publishers in the group
+  */
+  size_t size() const;
+
+private:
+  enum class Kind { kValue, kStruct, kStructArray };
+
+  struct Item {
+    NT_Publisher handle;
+    NT_Type type;
+    Kind kind;
+
+    // only used for struct topics
+    std::string structTypeString;
+    py::object structType;
+    WPyStructInfo structInfo;
+    bool schemaPublished = false;
+  };
+
+  nt::Value convert(Item &item, py::handle value, int64_t time);
+  const WPyStructInfo &getStructInfo(Item &item, py::handle value);
+
+  std::vector<Item> m_items;
+  py::list m_publishers;
+};
+
+/**
+    Reads the values of a fixed group of subscribers in a single call.
+
+    Reading each subscriber individually enters ntcore and releases the GIL
+    once per subscriber, and the values may change between the reads. The
+    group instead reads the current value of every subscriber in one pass
+    with the GIL released once, and then converts them.
+
+    Boolean, integer, float, double, string, raw and their array subscribers
+    (and entries) may be used, as well as GenericSubscriber.
+*/
+class SubscriberGroup {
+public:
+  /**
+      :param subscribers: Subscribers to read
+  */
+  SubscriberGroup(const py::sequence &subscribers);
+
+  /**
+      Get the last published value of each subscriber in the group. If a
+      subscriber has no value, its default value is used.
+
+      :returns: tuple containing a value for each subscriber, in the same
+                order as the subscribers were passed to the constructor
+  */
+  py::tuple getAll();
+
+  /**
+      Get the last published value of each subscriber in the group as a
+      numpy array of float64. Every subscriber must be a boolean, integer,
+      float or double subscriber. If a subscriber has no value, its default
+      value is used.
+
+      .. note:: numpy must be installed to use this function
+  */
+  py::array_t<double> getAllNp();
+
+  /**
+      Returns the number of subscribers in the group
+  */
+  size_t size() const;
+
+private:
+  struct Item {
+    NT_Subscriber handle;
+    NT_Type type;
+  };
+
+  std::vector<nt::Value> readAll() const;
+  bool isValid(const Item &item, const nt::Value &value) const;
+
+  std::vector<Item> m_items;
+  py::list m_subscribers;
+};
+
+}; // namespace pyntcore
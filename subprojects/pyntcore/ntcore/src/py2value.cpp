@@ -1,6 +1,7 @@
 
 #include "py2value.h"
 
+#include <cstring>
 #include <vector>
 
 // type casters
@@ -109,6 +110,88 @@ py::object ntvalue2py(const nt::Value &ntvalue) {
   }
 }
 
+template <typename T>
+static py::array copy2np(std::span<const T> v) {
+  auto a = empty1d<T>(v.size());
+  if (!v.empty()) {
+    std::memcpy(a.mutable_data(), v.data(), v.size() * sizeof(T));
+  }
+  return std::move(a);
+}
+
+py::array span2np(std::span<const int> v) {
+  auto a = empty1d<bool>(v.size());
+  auto data = a.mutable_data();
+  for (size_t i = 0; i < v.size(); i++) {
+    data[i] = v[i] != 0;
+  }
+  return std::move(a);
+}
+
+py::array span2np(std::span<const int64_t> v) {
+  return copy2np(v);
+}
+
+py::array span2np(std::span<const float> v) {
+  return copy2np(v);
+}
+
+py::array span2np(std::span<const double> v) {
+  return copy2np(v);
+}
+
+py::object ntvalue2np(const nt::Value &ntvalue) {
+  switch (ntvalue.type()) {
+  case NT_BOOLEAN_ARRAY:
+    return span2np(ntvalue.GetBooleanArray());
+  case NT_INTEGER_ARRAY:
+    return span2np(ntvalue.GetIntegerArray());
+  case NT_FLOAT_ARRAY:
+    return span2np(ntvalue.GetFloatArray());
+  case NT_DOUBLE_ARRAY:
+    return span2np(ntvalue.GetDoubleArray());
+  default:
+    return py::none();
+  }
+}
+
+template <typename T>
+static std::span<const T> buffer2span(const py::buffer_info &info) {
+  return std::span<const T>(static_cast<const T*>(info.ptr), info.size);
+}
+
+// Converts contiguous 1-d buffers (numpy arrays, array.array) of bool,
+// 64-bit integers, float or double directly to an array value. Returns
+// false if the buffer isn't one of those
+static bool buffer2ntvalue(py::handle h, nt::Value *v) {
+  Py_buffer view;
+  if (PyObject_GetBuffer(h.ptr(), &view, PyBUF_ND | PyBUF_FORMAT) != 0) {
+    PyErr_Clear();
+    return false;
+  }
+
+  py::detail::view_release release{&view};
+
+  py::buffer_info info(&view, false);
+  if (info.ndim != 1 || info.size == 0) {
+    return false;
+  }
+
+  if (info.item_type_is_equivalent_to<bool>()) {
+    auto b = buffer2span<bool>(info);
+    *v = nt::Value::MakeBooleanArray(std::vector<int>(b.begin(), b.end()));
+  } else if (info.item_type_is_equivalent_to<double>()) {
+    *v = nt::Value::MakeDoubleArray(buffer2span<double>(info));
+  } else if (info.item_type_is_equivalent_to<float>()) {
+    *v = nt::Value::MakeFloatArray(buffer2span<float>(info));
+  } else if (info.item_type_is_equivalent_to<int64_t>()) {
+    *v = nt::Value::MakeIntegerArray(buffer2span<int64_t>(info));
+  } else {
+    return false;
+  }
+  return true;
+}
+
 nt::Value py2ntvalue(py::handle h) {
   if (py::isinstance<py::bool_>(h)) {
     return nt::Value::MakeBoolean(h.cast<bool>());
@@ -122,6 +205,11 @@ nt::Value py2ntvalue(py::handle h) {
     return nt::Value::MakeRaw(h.cast<std::span<const uint8_t>>());
   } else if (py::isinstance<py::none>(h)) {
     throw py::value_error("Cannot put None into NetworkTable");
+  } else if (PyObject_CheckBuffer(h.ptr())) {
+    nt::Value v;
+    if (buffer2ntvalue(h, &v)) {
+      return v;
+    }
   }
 
   auto seq = h.cast<py::sequence>();
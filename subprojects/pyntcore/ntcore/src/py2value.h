@@ -1,8 +1,11 @@
-
+#pragma once
 #include <robotpy_build.h>
 #include <networktables/NetworkTableValue.h>
 #include <networktables/NetworkTableType.h>
 #include <fmt/format.h>
+#include <pybind11/numpy.h>
+
+#include <span>
 
 namespace pyntcore {
 
@@ -10,6 +13,25 @@ const char * nttype2str(NT_Type type);
 
 py::object ntvalue2py(const nt::Value &ntvalue);
 
+// creates an uninitialized 1-d numpy array. The shape and strides are
+// passed explicitly, the (count) constructor creates arrays with strides
+// of (0,)
+template <typename T>
+py::array_t<T> empty1d(size_t n) {
+  return py::array_t<T>({static_cast<py::ssize_t>(n)},
+                        {static_cast<py::ssize_t>(sizeof(T))});
+}
+
+// copies array data into a new numpy array
+py::array span2np(std::span<const int> v); // boolean array
+py::array span2np(std::span<const int64_t> v);
+py::array span2np(std::span<const float> v);
+py::array span2np(std::span<const double> v);
+
+// converts boolean/integer/float/double array values to a numpy array, or
+// returns None for other types
+py::object ntvalue2np(const nt::Value &ntvalue);
+
 nt::Value py2ntvalue(py::handle h);
 
 py::function valueFactoryByType(nt::NetworkTableType type);
@@ -138,4 +138,30 @@ py::object GetValueEntry(const nt::NetworkTableEntry &entry, py::object defaultV
 }
 
 
+static py::object GetArrayEntryNp(const nt::NetworkTableEntry &entry, NT_Type type, py::object defaultValue) {
+    nt::Value value;
+    {
+        py::gil_scoped_release release;
+        value = nt::GetEntryValue(entry.GetHandle());
+    }
+    if (!value || value.type() != type) return defaultValue;
+    return ntvalue2np(value);
+}
+
+py::object GetBooleanArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue) {
+    return GetArrayEntryNp(entry, NT_BOOLEAN_ARRAY, defaultValue);
+}
+
+py::object GetDoubleArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue) {
+    return GetArrayEntryNp(entry, NT_DOUBLE_ARRAY, defaultValue);
+}
+
+py::object GetFloatArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue) {
+    return GetArrayEntryNp(entry, NT_FLOAT_ARRAY, defaultValue);
+}
+
+py::object GetIntegerArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue) {
+    return GetArrayEntryNp(entry, NT_INTEGER_ARRAY, defaultValue);
+}
+
 }; // pyntcore
@@ -1,8 +1,14 @@
+#pragma once
 
 #include <robotpy_build.h>
 #include <networktables/NetworkTableEntry.h>
 #include <networktables/NetworkTableValue.h>
 
+#include "py2value.h"
+
+#include <type_traits>
+#include <vector>
+
 namespace pyntcore {
 
 py::object GetBooleanEntry(const nt::NetworkTableEntry &entry, py::object defaultValue);
@@ -18,4 +24,84 @@ py::object GetIntegerArrayEntry(const nt::NetworkTableEntry &entry, py::object d
 py::object GetStringArrayEntry(const nt::NetworkTableEntry &entry, py::object defaultValue);
 py::object GetValueEntry(const nt::NetworkTableEntry &entry, py::object defaultValue);
 
+py::object GetBooleanArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue);
+py::object GetDoubleArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue);
+py::object GetFloatArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue);
+py::object GetIntegerArrayEntryNp(const nt::NetworkTableEntry &entry, py::object defaultValue);
+
+// Retrieves the value of an array subscriber as a numpy array. If there is
+// no value, the subscriber's default value is returned
+template <typename S>
+py::object GetSubscriberNp(const S &self, NT_Type type) {
+    nt::Value value;
+    {
+        py::gil_scoped_release release;
+        value = nt::GetEntryValue(self.GetHandle());
+    }
+    if (value && value.type() == type) {
+        return ntvalue2np(value);
+    }
+
+    typename S::ValueType v;
+    {
+        py::gil_scoped_release release;
+        v = self.Get();
+    }
+    return span2np(std::span<const typename S::ValueType::value_type>(v));
+}
+
+// Retrieves the value of an array subscriber as a numpy array, or the
+// specified default value if there is no value
+template <typename S>
+py::object GetSubscriberNp(const S &self, NT_Type type, py::object defaultValue) {
+    nt::Value value;
+    {
+        py::gil_scoped_release release;
+        value = nt::GetEntryValue(self.GetHandle());
+    }
+    if (!value || value.type() != type) return defaultValue;
+    return ntvalue2np(value);
+}
+
+// Reads the subscriber's queue and returns (times, serverTimes, values). For
+// scalar subscribers values is a numpy array, for array subscribers it is a
+// list containing a numpy array for each value
+template <typename S>
+py::tuple ReadQueueArrays(S &self) {
+    using ValueType = typename S::ValueType;
+
+    std::vector<typename S::TimestampedValueType> queue;
+    {
+        py::gil_scoped_release release;
+        queue = self.ReadQueue();
+    }
+
+    auto n = queue.size();
+    auto times = empty1d<int64_t>(n);
+    auto serverTimes = empty1d<int64_t>(n);
+    auto t = times.mutable_data();
+    auto st = serverTimes.mutable_data();
+    for (size_t i = 0; i < n; i++) {
+        t[i] = queue[i].time;
+        st[i] = queue[i].serverTime;
+    }
+
+    if constexpr (std::is_arithmetic_v<ValueType>) {
+        auto values = empty1d<ValueType>(n);
+        auto v = values.mutable_data();
+        for (size_t i = 0; i < n; i++) {
+            v[i] = queue[i].value;
+        }
+        return py::make_tuple(times, serverTimes, values);
+    } else {
+        py::list values(n);
+        for (size_t i = 0; i < n; i++) {
+            auto a = span2np(
+                std::span<const typename ValueType::value_type>(queue[i].value));
+            PyList_SET_ITEM(values.ptr(), i, a.release().ptr());
+        }
+        return py::make_tuple(times, serverTimes, values);
+    }
+}
+
 };
@@ -2,6 +2,9 @@
 # Ensure that the NetworkTableEntry objects work
 #
 
+import ntcore
+import pytest
+
 
 def test_entry_string(nt):
     e = nt.getEntry("/k1")
@@ -50,3 +53,105 @@ def test_entry_publish_empty_double_array(nt):
     topic = nt.getDoubleArrayTopic("/Topic")
     pub = topic.publish()
     pub.set([])
+
+
+def test_entry_array_np(nt):
+    np = pytest.importorskip("numpy")
+
+    e = nt.getEntry("/k1")
+    assert e.getDoubleArrayNp(None) is None
+
+    e.setDoubleArray([1.0, 2.0, 3.0])
+    a = e.getDoubleArrayNp(None)
+    assert a.dtype == np.float64
+    assert a.strides == (a.itemsize,)
+    assert a.tolist() == [1.0, 2.0, 3.0]
+
+    # wrong type returns the default
+    assert e.getIntegerArrayNp(None) is None
+
+    e = nt.getEntry("/k2")
+    e.setBooleanArray([True, False])
+    a = e.getBooleanArrayNp(None)
+    assert a.dtype == np.bool_
+    assert a.tolist() == [True, False]
+
+
+def test_subscriber_array_np(nt):
+    np = pytest.importorskip("numpy")
+
+    topic = nt.getIntegerArrayTopic("/ints")
+    sub = topic.subscribe([4, 5])
+    pub = topic.publish()
+
+    a = sub.getNp()
+    assert a.dtype == np.int64
+    assert a.tolist() == [4, 5]
+    assert sub.getNp(None) is None
+
+    pub.set([1, 2, 3])
+    assert sub.getNp().tolist() == [1, 2, 3]
+    assert sub.getNp(None).tolist() == [1, 2, 3]
+
+    ftopic = nt.getFloatArrayTopic("/floats")
+    fsub = ftopic.subscribe([])
+    assert fsub.getNp().dtype == np.float32
+    assert len(fsub.getNp()) == 0
+
+
+def test_publish_array_np(nt):
+    np = pytest.importorskip("numpy")
+
+    topic = nt.getDoubleArrayTopic("/doubles")
+    sub = topic.subscribe([])
+    pub = topic.publish()
+    pub.set(np.linspace(0, 1, 5))
+    assert sub.get() == [0, 0.25, 0.5, 0.75, 1]
+
+    e = nt.getEntry("/ints")
+    e.setIntegerArray(np.arange(4, dtype=np.int64))
+    assert e.getIntegerArray(None) == [0, 1, 2, 3]
+
+
+def test_read_queue_arrays(nt):
+    np = pytest.importorskip("numpy")
+
+    topic = nt.getDoubleTopic("/d")
+    sub = topic.subscribe(0, ntcore.PubSubOptions(pollStorage=10))
+    pub = topic.publish()
+
+    times, serverTimes, values = sub.readQueueArrays()
+    assert len(times) == 0 and len(serverTimes) == 0 and len(values) == 0
+
+    pub.set(1.0, 10)
+    pub.set(2.0, 20)
+    pub.set(3.0, 30)
+
+    times, serverTimes, values = sub.readQueueArrays()
+    assert times.dtype == np.int64
+    assert serverTimes.dtype == np.int64
+    assert values.dtype == np.float64
+    assert times.strides == serverTimes.strides == values.strides == (8,)
+    assert times.tolist() == [10, 20, 30]
+    assert values.tolist() == [1.0, 2.0, 3.0]
+
+    # queue is drained
+    assert len(sub.readQueueArrays()[0]) == 0
+
+
+def test_read_queue_arrays_array(nt):
+    np = pytest.importorskip("numpy")
+
+    topic = nt.getBooleanArrayTopic("/b")
+    sub = topic.subscribe([], ntcore.PubSubOptions(pollStorage=10))
+    pub = topic.publish()
+
+    pub.set([True], 10)
+    pub.set([False, True], 20)
+
+    times, _, values = sub.readQueueArrays()
+    assert times.tolist() == [10, 20]
+    assert len(values) == 2
+    assert values[0].dtype == np.bool_
+    assert values[0].tolist() == [True]
+    assert values[1].tolist() == [False, True]
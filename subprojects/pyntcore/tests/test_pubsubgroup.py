@@ -0,0 +1,171 @@
+import dataclasses
+
+import ntcore
+import pytest
+from wpiutil import wpistruct
+
+
+@wpistruct.make_wpistruct
+@dataclasses.dataclass
+class GroupStruct:
+    x: int
+    y: wpistruct.double
+
+
+@wpistruct.make_wpistruct
+@dataclasses.dataclass
+class OtherStruct:
+    x: int
+    y: wpistruct.double
+
+
+def test_publisher_group(nt: ntcore.NetworkTableInstance):
+    dtopic = nt.getDoubleTopic("/d")
+    itopic = nt.getIntegerTopic("/i")
+    stopic = nt.getStringTopic("/s")
+    atopic = nt.getDoubleArrayTopic("/a")
+    sttopic = nt.getStructTopic("/st", GroupStruct)
+    satopic = nt.getStructArrayTopic("/sa", GroupStruct)
+
+    group = ntcore.PublisherGroup(
+        [
+            dtopic.publish(),
+            itopic.publish(),
+            stopic.publish(),
+            atopic.publish(),
+            sttopic.publish(),
+            satopic.publish(),
+        ]
+    )
+    assert len(group) == 6
+
+    dsub = dtopic.subscribe(0)
+    isub = itopic.subscribe(0)
+    ssub = stopic.subscribe("")
+    asub = atopic.subscribe([])
+    stsub = sttopic.subscribe(GroupStruct(0, 0))
+    sasub = satopic.subscribe([])
+
+    group.set(
+        [
+            1.5,
+            2,
+            "three",
+            [4.0, 5.0],
+            GroupStruct(6, 7.0),
+            [GroupStruct(8, 9.0)],
+        ],
+        100,
+    )
+
+    assert dsub.get() == 1.5
+    assert isub.get() == 2
+    assert ssub.get() == "three"
+    assert asub.get() == [4.0, 5.0]
+    assert stsub.get() == GroupStruct(6, 7.0)
+    assert sasub.get() == [GroupStruct(8, 9.0)]
+
+    assert dsub.getAtomic().time == 100
+
+    # the group bypasses StructPublisher.set, so it publishes the schema
+    assert nt.getTopic("/.schema/struct:GroupStruct").exists()
+
+
+def test_publisher_group_errors(nt: ntcore.NetworkTableInstance):
+    dtopic = nt.getDoubleTopic("/d")
+    itopic = nt.getIntegerTopic("/i")
+    group = ntcore.PublisherGroup([dtopic.publish(), itopic.publish()])
+    dsub = dtopic.subscribe(0)
+
+    with pytest.raises(ValueError):
+        group.set([1.0])
+
+    # nothing is published when a value cannot be converted
+    with pytest.raises(TypeError):
+        group.set([1.0, "x"])
+
+    assert dsub.get() == 0
+
+
+def test_publisher_group_struct_type(nt: ntcore.NetworkTableInstance):
+    topic = nt.getStructTopic("/st", GroupStruct)
+    atopic = nt.getStructArrayTopic("/sa", GroupStruct)
+    group = ntcore.PublisherGroup([topic.publish(), atopic.publish()])
+    sub = topic.subscribe(GroupStruct(0, 0))
+
+    # values must be serialized as the struct type of the topic
+    with pytest.raises(TypeError):
+        group.set([OtherStruct(1, 2.0), []])
+    with pytest.raises(TypeError):
+        group.set([GroupStruct(1, 2.0), [GroupStruct(3, 4.0), OtherStruct(5, 6.0)]])
+    with pytest.raises(TypeError):
+        group.set([1, []])
+
+    assert sub.get() == GroupStruct(0, 0)
+    assert not nt.getTopic("/.schema/struct:OtherStruct").exists()
+
+    group.set([GroupStruct(1, 2.0), []])
+    assert sub.get() == GroupStruct(1, 2.0)
+
+
+def test_subscriber_group(nt: ntcore.NetworkTableInstance):
+    dtopic = nt.getDoubleTopic("/d")
+    stopic = nt.getStringTopic("/s")
+    atopic = nt.getIntegerArrayTopic("/a")
+
+    group = ntcore.SubscriberGroup(
+        [
+            dtopic.subscribe(1.0),
+            stopic.subscribe("default"),
+            atopic.subscribe([1]),
+            nt.getTopic("/d").genericSubscribe(),
+        ]
+    )
+    assert len(group) == 4
+
+    # defaults are returned when there are no values
+    assert group.getAll()[:3] == (1.0, "default", [1])
+
+    dpub = dtopic.publish()
+    spub = stopic.publish()
+    apub = atopic.publish()
+    dpub.set(2.5)
+    spub.set("s")
+    apub.set([3, 4])
+
+    d, s, a, g = group.getAll()
+    assert d == 2.5
+    assert s == "s"
+    assert a == [3, 4]
+    assert g == 2.5
+
+
+def test_subscriber_group_np(nt: ntcore.NetworkTableInstance):
+    np = pytest.importorskip("numpy")
+
+    group = ntcore.SubscriberGroup(
+        [
+            nt.getDoubleTopic("/d").subscribe(1.0),
+            nt.getIntegerTopic("/i").subscribe(2),
+            nt.getBooleanTopic("/b").subscribe(True),
+        ]
+    )
+
+    values = group.getAllNp()
+    assert values.dtype == np.float64
+    assert values.strides == (values.itemsize,)
+    assert values.tolist() == [1.0, 2.0, 1.0]
+
+    pub = nt.getIntegerTopic("/i").publish()
+    pub.set(5)
+    assert group.getAllNp().tolist() == [1.0, 5.0, 1.0]
+
+
+def test_subscriber_group_errors(nt: ntcore.NetworkTableInstance):
+    group = ntcore.SubscriberGroup([nt.getStringTopic("/s").subscribe("")])
+    with pytest.raises(TypeError):
+        group.getAllNp()
+
+    topic = nt.getStructTopic("/st", GroupStruct)
+    with pytest.raises(TypeError):
+        ntcore.SubscriberGroup([topic.subscribe(GroupStruct(0, 0))])
@@ -24,9 +24,9 @@ def test_mystruct(nt: ntcore.NetworkTableInstance):
     val = sub.get()
     assert val == default
 
-    # val2 = MyStruct(0, False, 0)
-    # sub.getInto(val2)
-    # assert val2 == default
+    val2 = MyStruct(0, False, 0)
+    assert sub.getInto(val2)
+    assert val2 == default
 
     vals = sub.readQueue()
     assert len(vals) == 1
@@ -1,3 +1,5 @@
+import array
+
 import ntcore
 import pytest
 
@@ -169,7 +171,46 @@ def test_value_float_list():
 
 
 def test_mkvalue_float_list():
-    pass  # not possible to use makeValue to make a float list
+    pass  # not possible to use makeValue to make a float list, except buffers
+
+
+def test_value_array_buffers():
+    v = ntcore.Value.makeDoubleArray(array.array("d", [1.5, 2.5]))
+    assert v.getDoubleArray() == [1.5, 2.5]
+
+    v = ntcore.Value.makeFloatArray(array.array("f", [1.5, 2.5]))
+    assert v.getFloatArray() == [1.5, 2.5]
+
+    v = ntcore.Value.makeIntegerArray(array.array("q", [1, -2]))
+    assert v.getIntegerArray() == [1, -2]
+
+
+def test_mkvalue_buffers():
+    v = ntcore.Value.makeValue(array.array("d", [1.5, 2.5]))
+    assert v.type() == ntcore.NetworkTableType.kDoubleArray
+    assert v.getDoubleArray() == [1.5, 2.5]
+
+    v = ntcore.Value.makeValue(array.array("f", [1.5, 2.5]))
+    assert v.type() == ntcore.NetworkTableType.kFloatArray
+    assert v.getFloatArray() == [1.5, 2.5]
+
+    v = ntcore.Value.makeValue(array.array("q", [1, -2]))
+    assert v.type() == ntcore.NetworkTableType.kIntegerArray
+    assert v.getIntegerArray() == [1, -2]
+
+
+def test_mkvalue_numpy():
+    np = pytest.importorskip("numpy")
+
+    v = ntcore.Value.makeValue(np.array([True, False]))
+    assert v.getBooleanArray() == [True, False]
+
+    v = ntcore.Value.makeValue(np.arange(3, dtype=np.int64))
+    assert v.getIntegerArray() == [0, 1, 2]
+
+    # non-contiguous arrays use the sequence conversion
+    v = ntcore.Value.makeValue(np.arange(6, dtype=np.float64)[::2])
+    assert v.getDoubleArray() == [0, 2, 4]
 
 
 def test_float_list_factory():
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+#
+# Measures the cost of logging through wpilib.DataLogManager from python,
+# simulating a robot that logs a set of signals and a few messages every
+# 20ms loop. Reported:
+#
+#   * the cost of each DataLogManager.log call, p50 and p99
+#   * the cost of each loop of appends to entries on DataLogManager.getLog(),
+#     p50 and p99, and the p50 loop cost divided by the number of values
+#   * how long DataLogManager.stop takes (which waits for the background
+#     writer to write everything to disk)
+#   * the size of the log, and how many bytes per second of robot time it
+#     needs
+#
+# By default the log is written to /dev/shm (when it exists) so that disk
+# speed does not affect the results. Loops are run every 20ms like on a
+# robot, which gives the background writer time to write the log; when they
+# are run back to back (--no-pace) DataLog pauses logging once its buffers
+# fill up, and everything after that is dropped.
+#
+#   ./bench_datalogmanager.py --json before.json
+#   ... rebuild ...
+#   ./bench_datalogmanager.py --compare before.json
+#
+# The JSON and comparison support is shared with the wpiutil benchmarks, in
+# robotpy-wpiutil/benchmarks/benchutil.py
+#
+
+import argparse
+import gc
+import math
+import os
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "robotpy-wpiutil", "benchmarks"
+    ),
+)
+
+import benchutil
+from wpiutil.log import DoubleArrayLogEntry, DoubleLogEntry, StructLogEntry
+
+try:
+    import wpilib
+except ImportError:
+    print("wpilib not found, skipping DataLogManager benchmark", file=sys.stderr)
+    sys.exit(0)
+
+LOOP_PERIOD = 0.02
+
+
+def run(args) -> dict:
+    filename = f"bench_{os.getpid()}.wpilog"
+    path = os.path.join(args.dir, filename)
+
+    wpilib.DataLogManager.logNetworkTables(False)
+    wpilib.DataLogManager.start(args.dir, filename, args.period)
+    log = wpilib.DataLogManager.getLog()
+
+    doubles = [DoubleLogEntry(log, f"/d/{i}", 1) for i in range(args.doubles)]
+    arrays = [DoubleArrayLogEntry(log, f"/a/{i}", 1) for i in range(10)]
+
+    try:
+        from wpimath.geometry import Pose2d
+
+        poses = [StructLogEntry(log, f"/pose/{i}", Pose2d, 1) for i in range(5)]
+    except ImportError:
+        print("wpimath not found, not logging structs", file=sys.stderr)
+        Pose2d = None
+        poses = []
+
+    count = len(doubles) + len(arrays) + len(poses)
+
+    log_ns = []
+    loop_ns = []
+
+    gc.disable()
+    try:
+        nextLoop = time.perf_counter()
+        for n in range(args.loops):
+            t = n * LOOP_PERIOD
+            dvalues = [math.sin(t + i) for i in range(len(doubles))]
+            avalues = [[t, t + 1, t + 2, t + 3]] * len(arrays)
+            pvalues = [Pose2d(t, i, t * 0.1) for i in range(len(poses))]
+            messages = [f"loop {n} message {i}" for i in range(args.messages)]
+
+            start = time.perf_counter_ns()
+            for e, v in zip(doubles, dvalues):
+                e.append(v, 0)
+            for e, v in zip(arrays, avalues):
+                e.append(v, 0)
+            for e, v in zip(poses, pvalues):
+                e.append(v, 0)
+            loop_ns.append(time.perf_counter_ns() - start)
+
+            for msg in messages:
+                start = time.perf_counter_ns()
+                wpilib.DataLogManager.log(msg)
+                log_ns.append(time.perf_counter_ns() - start)
+
+            if args.pace:
+                nextLoop += LOOP_PERIOD
+                delay = nextLoop - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+    finally:
+        gc.enable()
+
+    # entries must be finished before the log is stopped
+    del doubles, arrays, poses, log
+    gc.collect()
+
+    start = time.perf_counter()
+    wpilib.DataLogManager.stop()
+    stop_ms = (time.perf_counter() - start) * 1e3
+
+    size = os.path.getsize(path)
+    if not args.keep:
+        os.unlink(path)
+
+    loop_p50 = benchutil.percentile(loop_ns, 0.5)
+    results = {
+        "log_ns_p50": benchutil.percentile(log_ns, 0.5) if log_ns else 0,
+        "log_ns_p99": benchutil.percentile(log_ns, 0.99) if log_ns else 0,
+        "loop_us_p50": loop_p50 / 1e3,
+        "loop_us_p99": benchutil.percentile(loop_ns, 0.99) / 1e3,
+        "value_ns_p50": loop_p50 / count,
+        "stop_ms": stop_ms,
+        "file_bytes": size,
+        "bytes_per_sec": size / (args.loops * LOOP_PERIOD),
+    }
+
+    print(
+        f"{count} values and {args.messages} messages per loop, {args.loops} loops "
+        f"({args.loops * LOOP_PERIOD:.1f}s of robot time) in {args.dir}"
+    )
+    print()
+    for name, value in results.items():
+        print(f"{name:20} {value:14.1f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-l", "--loops", type=int, default=3000)
+    parser.add_argument(
+        "--doubles", type=int, default=250, help="Number of double signals"
+    )
+    parser.add_argument(
+        "--messages", type=int, default=2, help="Number of messages per loop"
+    )
+    parser.add_argument(
+        "--period", type=float, default=0.25, help="DataLog flush period"
+    )
+    parser.add_argument(
+        "--dir", default=benchutil.default_dir(), help="Directory to write logs to"
+    )
+    parser.add_argument(
+        "--no-pace",
+        dest="pace",
+        action="store_false",
+        default=True,
+        help="Run loops back to back instead of every 20ms",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", default=False, help="Don't delete the log"
+    )
+    benchutil.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = run(args)
+    benchutil.finish(
+        args,
+        results,
+        lambda results: {name: results[name] for name in ("log_ns_p50", "loop_us_p50")},
+        loops=args.loops,
+    )
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+#
+# Measures the cost of writing a data log from python, using a signal set
+# similar to what a robot logs every 20ms loop (scalars, arrays, structs).
+#
+# Each mode logs the same signals using a different API. For each mode the
+# following are reported:
+#
+#   * the cost of each loop, p50 and p99, and the p50 loop cost divided by
+#     the number of values logged in each loop. Appends are not timed
+#     individually, because timing each one would cost more than the append
+#   * how long it takes to close the log (which waits for the background
+#     writer to write everything to disk)
+#   * the size of the log, and how many bytes per second of robot time it
+#     needs
+#
+# By default the log is written to /dev/shm (when it exists) so that disk
+# speed does not affect the results. Loops are run every 20ms like on a
+# robot, which gives the background writer time to write the log; when they
+# are run back to back (--no-pace) DataLog pauses logging once its buffers
+# fill up, and everything after that is dropped.
+#
+#   ./bench_datalog.py --json before.json
+#   ... rebuild ...
+#   ./bench_datalog.py --compare before.json
+#
+
+import argparse
+import dataclasses
+import gc
+import math
+import os
+import time
+
+from wpiutil import wpistruct
+from wpiutil.log import (
+    BooleanLogEntry,
+    DataLog,
+    DoubleArrayLogEntry,
+    DoubleLogEntry,
+    IntegerLogEntry,
+    StringLogEntry,
+    StructArrayLogEntry,
+    StructLogEntry,
+)
+
+import benchutil
+
+LOOP_PERIOD = 0.02
+
+
+@wpistruct.make_wpistruct(name="BenchState")
+@dataclasses.dataclass
+class State:
+    x: wpistruct.double
+    y: wpistruct.double
+    heading: wpistruct.double
+    valid: bool
+
+
+@dataclasses.dataclass
+class Signals:
+    doubles: int
+    integers: int
+    booleans: int
+    strings: int
+    arrays: int
+    arrayLen: int
+    structs: int
+    structArrays: int
+    structArrayLen: int
+
+    @property
+    def count(self) -> int:
+        return (
+            self.doubles
+            + self.integers
+            + self.booleans
+            + self.strings
+            + self.arrays
+            + self.structs
+            + self.structArrays
+        )
+
+
+def _values(signals: Signals, loop: int) -> dict:
+    # generated before each loop is timed
+    t = loop * LOOP_PERIOD
+    return {
+        "doubles": [math.sin(t + i) for i in range(signals.doubles)],
+        "integers": [loop + i for i in range(signals.integers)],
+        "booleans": [(loop + i) % 7 == 0 for i in range(signals.booleans)],
+        "strings": [f"state {loop // 50}" for _ in range(signals.strings)],
+        "arrays": [
+            [t + j for j in range(signals.arrayLen)] for _ in range(signals.arrays)
+        ],
+        "structs": [State(t, i, t * 0.1, True) for i in range(signals.structs)],
+        "structArrays": [
+            [State(t, j, 0, j % 2 == 0) for j in range(signals.structArrayLen)]
+            for _ in range(signals.structArrays)
+        ],
+    }
+
+
+def _handles(log: DataLog, signals: Signals):
+    def _start(prefix: str, typ: str, n: int):
+        return [log.start(f"/{prefix}/{i}", typ, "", 1) for i in range(n)]
+
+    log.addStructSchema(State, 1)
+    return (
+        _start("d", "double", signals.doubles),
+        _start("i", "int64", signals.integers),
+        _start("b", "boolean", signals.booleans),
+        _start("s", "string", signals.strings),
+        _start("a", "double[]", signals.arrays),
+        _start("st", "struct:BenchState", signals.structs),
+        _start("sa", "struct:BenchState[]", signals.structArrays),
+    )
+
+
+def mode_append(log: DataLog, signals: Signals):
+    """DataLog.append* with entry handles from DataLog.start"""
+    d, i, b, s, a, st, sa = _handles(log, signals)
+
+    appendDouble = log.appendDouble
+    appendInteger = log.appendInteger
+    appendBoolean = log.appendBoolean
+    appendString = log.appendString
+    appendDoubleArray = log.appendDoubleArray
+    appendRaw = log.appendRaw
+    pack = wpistruct.pack
+    packArray = wpistruct.packArray
+
+    def _loop(v):
+        for e, x in zip(d, v["doubles"]):
+            appendDouble(e, x, 0)
+        for e, x in zip(i, v["integers"]):
+            appendInteger(e, x, 0)
+        for e, x in zip(b, v["booleans"]):
+            appendBoolean(e, x, 0)
+        for e, x in zip(s, v["strings"]):
+            appendString(e, x, 0)
+        for e, x in zip(a, v["arrays"]):
+            appendDoubleArray(e, x, 0)
+        for e, x in zip(st, v["structs"]):
+            appendRaw(e, pack(x), 0)
+        for e, x in zip(sa, v["structArrays"]):
+            appendRaw(e, packArray(x), 0)
+
+    return _loop
+
+
+def _entries(log: DataLog, signals: Signals):
+    return (
+        [DoubleLogEntry(log, f"/d/{i}", 1) for i in range(signals.doubles)],
+        [IntegerLogEntry(log, f"/i/{i}", 1) for i in range(signals.integers)],
+        [BooleanLogEntry(log, f"/b/{i}", 1) for i in range(signals.booleans)],
+        [StringLogEntry(log, f"/s/{i}", 1) for i in range(signals.strings)],
+        [DoubleArrayLogEntry(log, f"/a/{i}", 1) for i in range(signals.arrays)],
+        [StructLogEntry(log, f"/st/{i}", State, 1) for i in range(signals.structs)],
+        [
+            StructArrayLogEntry(log, f"/sa/{i}", State, 1)
+            for i in range(signals.structArrays)
+        ],
+    )
+
+
+# keys of the values for each list of entries returned by _entries
+_keys = (
+    "doubles",
+    "integers",
+    "booleans",
+    "strings",
+    "arrays",
+    "structs",
+    "structArrays",
+)
+
+
+def mode_entries(log: DataLog, signals: Signals):
+    """Typed log entries (DoubleLogEntry.append, etc)"""
+    entries = _entries(log, signals)
+
+    def _loop(v):
+        for es, k in zip(entries, _keys):
+            for e, x in zip(es, v[k]):
+                e.append(x, 0)
+
+    return _loop
+
+
+def mode_update(log: DataLog, signals: Signals):
+    """Typed log entries with change detection (DoubleLogEntry.update, etc)"""
+    entries = _entries(log, signals)
+
+    def _loop(v):
+        for es, k in zip(entries, _keys):
+            for e, x in zip(es, v[k]):
+                e.update(x, 0)
+
+    return _loop
+
+
+def mode_batch(log: DataLog, signals: Signals):
+    """DataLog.append*Batch for scalars and structs"""
+    d, i, b, s, a, st, sa = _handles(log, signals)
+
+    def _loop(v):
+        log.appendDoubleBatch(d, v["doubles"], 0)
+        log.appendIntegerBatch(i, v["integers"], 0)
+        log.appendBooleanBatch(b, v["booleans"], 0)
+        for e, x in zip(s, v["strings"]):
+            log.appendString(e, x, 0)
+        for e, x in zip(a, v["arrays"]):
+            log.appendDoubleArray(e, x, 0)
+        log.appendStructBatch(st, v["structs"], 0)
+        log.appendStructArrayBatch(sa, v["structArrays"], 0)
+
+    return _loop
+
+
+MODES = {
+    "append": mode_append,
+    "entries": mode_entries,
+    "update": mode_update,
+    "batch": mode_batch,
+}
+
+
+def run_mode(name: str, args, signals: Signals) -> dict:
+    filename = f"bench_{name}_{os.getpid()}.wpilog"
+    path = os.path.join(args.dir, filename)
+
+    log = DataLog(args.dir, filename, args.period)
+    loop = MODES[name](log, signals)
+
+    loop_ns = []
+    gc.disable()
+    try:
+        nextLoop = time.perf_counter()
+        for n in range(args.loops):
+            values = _values(signals, n)
+            start = time.perf_counter_ns()
+            loop(values)
+            loop_ns.append(time.perf_counter_ns() - start)
+
+            if args.pace:
+                nextLoop += LOOP_PERIOD
+                delay = nextLoop - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+    finally:
+        gc.enable()
+
+    # the destructor stops the background writer once everything is written
+    start = time.perf_counter()
+    del loop, log
+    gc.collect()
+    close_ms = (time.perf_counter() - start) * 1e3
+
+    size = os.path.getsize(path)
+    if not args.keep:
+        os.unlink(path)
+
+    loop_p50 = benchutil.percentile(loop_ns, 0.5)
+    robot_time = args.loops * LOOP_PERIOD
+    return {
+        "loop_us_p50": loop_p50 / 1e3,
+        "loop_us_p99": benchutil.percentile(loop_ns, 0.99) / 1e3,
+        "value_ns_p50": loop_p50 / signals.count,
+        "close_ms": close_ms,
+        "file_bytes": size,
+        "bytes_per_sec": size / robot_time,
+    }
+
+
+def run(args) -> dict:
+    signals = Signals(
+        doubles=args.doubles,
+        integers=20,
+        booleans=20,
+        strings=2,
+        arrays=10,
+        arrayLen=4,
+        structs=10,
+        structArrays=2,
+        structArrayLen=4,
+    )
+
+    print(
+        f"{signals.count} values per loop, {args.loops} loops "
+        f"({args.loops * LOOP_PERIOD:.1f}s of robot time) in {args.dir}"
+    )
+    print()
+    print(
+        f"{'mode':10} {'p50 us/loop':>12} {'p99 us/loop':>12} "
+        f"{'p50 ns/value':>13} {'close ms':>9} "
+        f"{'file bytes':>11} {'bytes/s':>10}"
+    )
+
+    results = {}
+    for name in MODES:
+        if args.filter and args.filter not in name:
+            continue
+
+        r = run_mode(name, args, signals)
+        results[name] = r
+        print(
+            f"{name:10} {r['loop_us_p50']:12.1f} {r['loop_us_p99']:12.1f} "
+            f"{r['value_ns_p50']:13.1f} "
+            f"{r['close_ms']:9.1f} {r['file_bytes']:11} {r['bytes_per_sec']:10.0f}"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-l", "--loops", type=int, default=3000)
+    parser.add_argument(
+        "--doubles", type=int, default=250, help="Number of double signals"
+    )
+    parser.add_argument(
+        "--period", type=float, default=0.25, help="DataLog flush period"
+    )
+    parser.add_argument(
+        "--dir", default=benchutil.default_dir(), help="Directory to write logs to"
+    )
+    parser.add_argument(
+        "--no-pace",
+        dest="pace",
+        action="store_false",
+        default=True,
+        help="Run loops back to back instead of every 20ms",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", default=False, help="Don't delete the logs"
+    )
+    parser.add_argument(
+        "-k", "--filter", default=None, help="Only run modes containing this"
+    )
+    benchutil.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = run(args)
+    benchutil.finish(
+        args,
+        results,
+        lambda results: {name: r["loop_us_p50"] for name, r in results.items()},
+        loops=args.loops,
+    )
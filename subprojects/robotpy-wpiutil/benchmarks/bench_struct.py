@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+#
+# Measures the per-call cost of the wpiutil.wpistruct serialization functions,
+# and the memory allocated by each call.
+#
+# Run this against two different builds of robotpy-wpiutil to compare them:
+#
+#   ./bench_struct.py --json before.json
+#   ... rebuild ...
+#   ./bench_struct.py --compare before.json
+#
+# When comparing, the exit code is non-zero if any benchmark is slower than
+# the baseline by more than the threshold.
+#
+
+import argparse
+import dataclasses
+import sys
+import timeit
+import tracemalloc
+
+from wpiutil import wpistruct
+
+import benchutil
+
+
+@wpistruct.make_wpistruct
+@dataclasses.dataclass
+class Flat:
+    x: wpistruct.double
+    y: wpistruct.double
+    flag: bool
+
+
+@wpistruct.make_wpistruct
+@dataclasses.dataclass
+class Nested:
+    a: Flat
+    b: Flat
+    count: int
+
+
+@wpistruct.make_wpistruct(native=True)
+@dataclasses.dataclass
+class FlatNative:
+    x: wpistruct.double
+    y: wpistruct.double
+    flag: bool
+
+
+@wpistruct.make_wpistruct(native=True)
+@dataclasses.dataclass
+class NestedNative:
+    a: FlatNative
+    b: FlatNative
+    count: int
+
+
+ARRAY_LEN = 100
+
+
+def _types():
+    types = []
+
+    try:
+        from wpimath.geometry import Pose2d, Pose3d, Rotation3d
+        from wpimath.kinematics import SwerveModuleState
+
+        types.append(("Pose2d", Pose2d, Pose2d(1, 2, 0.5)))
+        types.append(("Pose3d", Pose3d, Pose3d(1, 2, 3, Rotation3d(0.1, 0.2, 0.3))))
+        types.append(
+            ("SwerveModuleState", SwerveModuleState, SwerveModuleState(1.5, 0.5))
+        )
+    except ImportError:
+        print("wpimath not found, skipping C++ types", file=sys.stderr)
+
+    types.append(("Flat", Flat, Flat(1.0, 2.0, True)))
+    types.append(("Nested", Nested, Nested(Flat(1, 2, True), Flat(3, 4, False), 5)))
+    types.append(("FlatNative", FlatNative, FlatNative(1.0, 2.0, True)))
+    types.append(
+        (
+            "NestedNative",
+            NestedNative,
+            NestedNative(FlatNative(1, 2, True), FlatNative(3, 4, False), 5),
+        )
+    )
+
+    if sys.version_info >= (3, 10):
+
+        @wpistruct.make_wpistruct(slots=True, frozen=True)
+        class FlatSlots:
+            x: wpistruct.double
+            y: wpistruct.double
+            flag: bool
+
+        types.append(("FlatSlots", FlatSlots, FlatSlots(1.0, 2.0, True)))
+
+    return types
+
+
+def _cases():
+    for name, cls, value in _types():
+        data = wpistruct.pack(value)
+        buf = bytearray(len(data))
+
+        values = [value] * ARRAY_LEN
+        adata = wpistruct.packArray(values)
+        abuf = bytearray(len(adata))
+
+        stmts = {
+            "getSize": lambda: wpistruct.getSize(cls),
+            "pack": lambda: wpistruct.pack(value),
+            "packInto": lambda: wpistruct.packInto(value, buf),
+            "unpack": lambda: wpistruct.unpack(cls, data),
+            f"packArray[{ARRAY_LEN}]": lambda: wpistruct.packArray(values),
+            f"packArrayInto[{ARRAY_LEN}]": lambda: wpistruct.packArrayInto(
+                values, abuf
+            ),
+            f"unpackArray[{ARRAY_LEN}]": lambda: wpistruct.unpackArray(cls, adata),
+            f"Unpacker[{ARRAY_LEN}]": lambda: list(wpistruct.Unpacker(cls, adata)),
+        }
+
+        for sname, stmt in stmts.items():
+            yield f"{name}.{sname}", stmt
+
+
+def _allocations(stmt):
+    """
+    Returns (memory blocks held by the result, peak bytes allocated) for a
+    single call. Temporary objects that are freed before the call returns
+    are only reflected in the peak.
+    """
+    stmt()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+        result = stmt()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    after = after.filter_traces(ignore)
+    before = before.filter_traces(ignore)
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+    return blocks, peak - start
+
+
+def run(args) -> dict:
+    results = {}
+    for name, stmt in _cases():
+        if args.filter and args.filter not in name:
+            continue
+
+        best = min(timeit.repeat(stmt, number=args.number, repeat=args.repeat))
+        ns = best / args.number * 1e9
+        blocks, peak = _allocations(stmt)
+
+        results[name] = {"ns": ns, "blocks": blocks, "peak_bytes": peak}
+        print(f"{name:40} {ns:12.1f} ns/op {blocks:6} blocks {peak:8} peak bytes")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=100000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-k", "--filter", default=None, help="Only run benchmarks containing this"
+    )
+    benchutil.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = run(args)
+    benchutil.finish(
+        args,
+        results,
+        lambda results: {name: r["ns"] for name, r in results.items()},
+        number=args.number,
+    )
@@ -0,0 +1,94 @@
+#
+# Support shared by the benchmarks: saving results as JSON, and comparing
+# them against results saved by an earlier run
+#
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import typing
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def default_dir() -> str:
+    """Directory to write logs to, so that disk speed does not matter"""
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the --json, --compare and --threshold arguments"""
+    parser.add_argument("--json", default=None, help="Write results to this file")
+    parser.add_argument(
+        "--compare", default=None, help="Compare against results from --json"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional slowdown that is considered a regression (default 0.1)",
+    )
+
+
+def compare(
+    current: typing.Dict[str, float],
+    baseline: typing.Dict[str, float],
+    threshold: float,
+) -> bool:
+    """
+    Prints each value next to its baseline value. Returns False if any value
+    is larger than the baseline by more than the threshold.
+    """
+    ok = True
+    print()
+    print(f"{'benchmark':40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, r in current.items():
+        b = baseline.get(name)
+        if not b:
+            continue
+
+        change = (r - b) / b
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{name:40} {b:12.1f} {r:12.1f} {change:+8.1%}{flag}")
+
+    return ok
+
+
+def finish(
+    args: argparse.Namespace,
+    results: dict,
+    compared: typing.Callable[[dict], typing.Dict[str, float]],
+    **info,
+) -> None:
+    """
+    Writes the results to the --json file, and compares them with the
+    results in the --compare file. Exits with a non-zero code when there is
+    a regression.
+
+    :param compared: Returns the values to compare from a results dict
+    :param info:     Stored in the JSON file next to the results
+    """
+    if args.json:
+        with open(args.json, "w") as fp:
+            json.dump(
+                {"python": platform.python_version(), **info, "results": results},
+                fp,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)["results"]
+        if not compare(compared(results), compared(baseline), args.threshold):
+            sys.exit(1)
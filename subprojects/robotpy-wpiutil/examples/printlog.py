@@ -8,6 +8,7 @@ import argparse
 import datetime
 
 from wpiutil.log import DataLogReader
+from wpiutil.wpistruct import StructRegistry
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -17,6 +18,7 @@ if __name__ == "__main__":
     reader = DataLogReader(args.infile)
 
     entries = {}
+    structs = StructRegistry()
     for record in reader:
         timestamp = record.getTimestamp() / 1000000
         if record.isStart():
@@ -88,5 +90,13 @@ if __name__ == "__main__":
                     print(f"  {arr}")
                 elif entry.type == "raw":
                     print(f"  {record.getRaw()}")
+                elif entry.type == "structschema":
+                    structs.addSchema(entry.name, record.getRaw())
+                    print(f"  '{record.getString()}'")
+                elif entry.type.startswith("struct:"):
+                    try:
+                        print(f"  {structs.unpackDict(entry.type, record.getRaw())}")
+                    except ValueError as e:
+                        print("  cannot decode", e)
             except TypeError as e:
                 print("  invalid", e)
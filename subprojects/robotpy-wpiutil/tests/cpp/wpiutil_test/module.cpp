@@ -53,6 +53,14 @@ std::span<std::vector<std::string>> load_span_vector(std::span<std::vector<std::
     return ref;
 }
 
+std::span<const double> load_span_double(std::span<const double> ref) {
+    return ref;
+}
+
+std::span<const int64_t> load_span_int64(std::span<const int64_t> ref) {
+    return ref;
+}
+
 std::span<const double, 3> load_span_fixed_double(std::span<const double, 3> ref) {
     return ref;
 }
@@ -164,6 +172,8 @@ RPYBUILD_PYBIND11_MODULE(m) {
     // span
     m.def("load_span_int", &load_span_int);
     m.def("load_span_bool", &load_span_bool);
+    m.def("load_span_double", &load_span_double);
+    m.def("load_span_int64", &load_span_int64);
     m.def("load_span_fixed_double", &load_span_fixed_double);
     m.def("load_span_string", &load_span_string);
     m.def("load_span_string_const", &load_span_string_const);
@@ -27,6 +27,31 @@ template <> struct wpi::Struct<ThingA> {
   }
 };
 
+//
+// Thing that can be modified in place
+//
+
+struct ThingB {
+  ThingB() = default;
+  ThingB(int x) : x(x) {}
+
+  int x = 0;
+
+  bool operator==(const ThingB &other) const { return x == other.x; }
+};
+
+template <> struct wpi::Struct<ThingB> {
+  static constexpr std::string_view GetTypeString() { return "struct:ThingB"; }
+  static constexpr size_t GetSize() { return 1; }
+  static constexpr std::string_view GetSchema() { return "uint8 value"; }
+  static ThingB Unpack(std::span<const uint8_t> data) {
+    return ThingB{data[0]};
+  }
+  static void Pack(std::span<uint8_t> data, const ThingB &value) {
+    data[0] = value.x;
+  }
+};
+
 struct Outer {
   Outer() = default;
   Outer(const ThingA &t, int c) : inner(t), c(c) {}
@@ -73,6 +98,14 @@ void struct_test(py::module &m) {
 
   SetupWPyStruct<ThingA>(thingCls);
 
+  py::class_<ThingB> thingBCls(m, "ThingB");
+  thingBCls.def(py::init<>());
+  thingBCls.def(py::init<int>());
+  thingBCls.def_readwrite("x", &ThingB::x);
+  thingBCls.def(py::self == py::self);
+
+  SetupWPyStruct<ThingB>(thingBCls);
+
   py::class_<Outer> outerCls(m, "Outer");
   outerCls.def(py::init<>());
   outerCls.def(py::init<ThingA, int>());
@@ -0,0 +1,749 @@
+import array
+import dataclasses
+import gc
+import mmap
+import os
+import pathlib
+
+import pytest
+
+from wpiutil.log import (
+    DataLog,
+    DataLogIndex,
+    DataLogReader,
+    DataLogStreamReader,
+    DoubleLogEntry,
+    IntegerArrayLogEntry,
+    IntegerLogEntry,
+    StructArrayLogEntry,
+    StructLogEntry,
+    compressLog,
+    openLog,
+    readLogColumns,
+)
+from wpiutil import wpistruct
+
+
+def write_log(path: pathlib.Path, fn) -> pathlib.Path:
+    """Calls fn with a DataLog that writes to path, then closes the log"""
+    log = DataLog(str(path.parent), path.name, 0.25)
+    fn(log)
+
+    # the log is written when it is destroyed
+    del log
+    gc.collect()
+    return path
+
+
+def write_scalars(log: DataLog):
+    d = log.start("d", "double", "", 1)
+    i = log.start("i", "int64", "", 1)
+    b = log.start("b", "boolean", "", 1)
+    f = log.start("f", "float", "", 1)
+    s = log.start("s", "string", "", 1)
+
+    for t in range(10):
+        log.appendDouble(d, t * 0.5, 100 + t)
+        log.appendInteger(i, t * 3, 200 + t)
+        log.appendBoolean(b, t % 2 == 0, 300 + t)
+        log.appendFloat(f, t * 0.25, 400 + t)
+        log.appendString(s, str(t), 500 + t)
+
+
+@pytest.fixture
+def scalar_log(tmp_path: pathlib.Path) -> pathlib.Path:
+    return write_log(tmp_path / "scalars.wpilog", write_scalars)
+
+
+#
+# toColumns
+#
+
+
+def test_to_columns(scalar_log: pathlib.Path):
+    pytest.importorskip("numpy")
+
+    reader = DataLogReader(str(scalar_log))
+    columns = reader.toColumns()
+
+    assert list(columns.keys()) == ["d", "i", "b", "f"]
+
+    ts, values = columns["d"]
+    assert ts.dtype == "int64"
+    assert values.dtype == "float64"
+    assert ts.tolist() == [100 + t for t in range(10)]
+    assert values.tolist() == [t * 0.5 for t in range(10)]
+
+    ts, values = columns["i"]
+    assert values.dtype == "int64"
+    assert values.tolist() == [t * 3 for t in range(10)]
+
+    ts, values = columns["b"]
+    assert values.dtype == "bool"
+    assert values.tolist() == [t % 2 == 0 for t in range(10)]
+
+    ts, values = columns["f"]
+    assert values.dtype == "float32"
+    assert values.tolist() == [t * 0.25 for t in range(10)]
+
+    for ts, values in columns.values():
+        assert ts.strides == (ts.itemsize,)
+        assert values.strides == (values.itemsize,)
+
+
+def test_to_columns_names(scalar_log: pathlib.Path):
+    pytest.importorskip("numpy")
+
+    reader = DataLogReader(str(scalar_log))
+    columns = reader.toColumns(["i", "s", "missing"])
+
+    # non-scalar and missing entries are not present
+    assert list(columns.keys()) == ["i"]
+    assert columns["i"][0].tolist() == [200 + t for t in range(10)]
+
+
+#
+# DataLogIndex
+#
+
+
+def write_restarted(log: DataLog):
+    a = log.start("a", "double", "", 1)
+    b = log.start("b", "int64", "", 1)
+    for t in range(5):
+        log.appendDouble(a, t, 10 + t)
+        log.appendInteger(b, t, 10 + t)
+    log.finish(a, 20)
+
+    a = log.start("a", "double", "", 30)
+    for t in range(5, 10):
+        log.appendDouble(a, t, 30 + t)
+
+
+def test_index_iter_entry(scalar_log: pathlib.Path):
+    reader = DataLogReader(str(scalar_log))
+    index = DataLogIndex.build(reader)
+
+    assert index.getEntryNames() == ["d", "i", "b", "f", "s"]
+    assert index.getEntries("d")[0].type == "double"
+
+    assert [(r.getTimestamp(), r.getDouble()) for r in index.iterEntry("d")] == [
+        (100 + t, t * 0.5) for t in range(10)
+    ]
+    assert [r.getString() for r in index.iterEntry("s")] == [str(t) for t in range(10)]
+
+    with pytest.raises(KeyError):
+        index.iterEntry("missing")
+
+
+def test_index_restarted_entry(tmp_path: pathlib.Path):
+    path = write_log(tmp_path / "restarted.wpilog", write_restarted)
+    index = DataLogIndex.build(DataLogReader(str(path)))
+
+    assert len(index.getEntries("a")) == 2
+    assert [r.getDouble() for r in index.iterEntry("a")] == list(range(10))
+    assert [r.getInteger() for r in index.iterEntry("b")] == list(range(5))
+
+
+def test_index_seek(tmp_path: pathlib.Path):
+    path = write_log(tmp_path / "restarted.wpilog", write_restarted)
+    index = DataLogIndex.build(DataLogReader(str(path)), interval=5)
+
+    data = [r.getTimestamp() for r in index.seek(33) if not r.isControl()]
+    assert data == [35, 36, 37, 38, 39]
+
+    # seeking before the first record returns everything
+    assert len(list(index.seek(0))) == len(index)
+
+
+def test_index_sidecar(tmp_path: pathlib.Path, scalar_log: pathlib.Path):
+    reader = DataLogReader(str(scalar_log))
+    index = DataLogIndex.cached(reader, scalar_log)
+
+    sidecar = pathlib.Path(str(scalar_log) + ".idx")
+    assert sidecar.exists()
+
+    loaded = DataLogIndex.load(reader, sidecar)
+    assert loaded.entries == index.entries
+    assert len(loaded) == len(index)
+    assert [r.getInteger() for r in loaded.iterEntry("i")] == [t * 3 for t in range(10)]
+
+    # an index of a different log is rejected
+    other = write_log(tmp_path / "restarted.wpilog", write_restarted)
+    with pytest.raises(ValueError):
+        DataLogIndex.load(DataLogReader(str(other)), sidecar)
+
+    with pytest.raises(ValueError):
+        DataLogIndex.load(reader, other)
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: data[:20],
+        lambda data: data[:-4],
+        lambda data: data.replace(b'"count"', b'"xount"'),
+        lambda data: data.replace(b"{", b"[", 1),
+    ],
+)
+def test_index_damaged_sidecar(scalar_log: pathlib.Path, damage):
+    reader = DataLogReader(str(scalar_log))
+    index = DataLogIndex.cached(reader, scalar_log)
+
+    sidecar = pathlib.Path(str(scalar_log) + ".idx")
+    sidecar.write_bytes(damage(sidecar.read_bytes()))
+
+    with pytest.raises(ValueError):
+        DataLogIndex.load(reader, sidecar)
+
+    # the index is rebuilt
+    rebuilt = DataLogIndex.cached(reader, scalar_log)
+    assert rebuilt.entries == index.entries
+    assert DataLogIndex.load(reader, sidecar).entries == index.entries
+
+
+@pytest.mark.parametrize("lastOffset", ["12", -1, 1, 2**64, 10**9, 1.5])
+def test_index_bad_last_offset(scalar_log: pathlib.Path, lastOffset):
+    reader = DataLogReader(str(scalar_log))
+    index = DataLogIndex.cached(reader, scalar_log)
+
+    sidecar = pathlib.Path(str(scalar_log) + ".idx")
+    good = index._lastOffset
+    index._lastOffset = lastOffset
+    index.save(sidecar)
+    index._lastOffset = good
+
+    with pytest.raises(ValueError):
+        DataLogIndex.load(reader, sidecar)
+
+    # the index is rebuilt
+    assert DataLogIndex.cached(reader, scalar_log).entries == index.entries
+    assert DataLogIndex.load(reader, sidecar).entries == index.entries
+
+
+def test_index_save_replaces(scalar_log: pathlib.Path):
+    reader = DataLogReader(str(scalar_log))
+    index = DataLogIndex.build(reader)
+
+    sidecar = scalar_log.parent / "saved.idx"
+    sidecar.write_bytes(b"old")
+    index.save(sidecar)
+
+    assert DataLogIndex.load(reader, sidecar).entries == index.entries
+    assert not list(scalar_log.parent.glob("*.tmp"))
+
+
+def test_index_offsets_out_of_range(scalar_log: pathlib.Path):
+    reader = DataLogReader(str(scalar_log))
+    size = scalar_log.stat().st_size
+
+    assert list(reader._iterFrom(size)) == []
+    assert list(reader._iterFrom(size + 100)) == []
+
+    with pytest.raises(IndexError):
+        list(reader._iterOffsets(array.array("Q", [size + 100])))
+
+
+def test_index_invalid_log():
+    reader = DataLogReader(memoryview(b"not a data log"), "invalid")
+    assert not reader.isValid()
+
+    with pytest.raises(ValueError):
+        reader._iterFrom(12)
+    with pytest.raises(ValueError):
+        reader._iterOffsets(array.array("Q", [12]))
+
+
+#
+# Zero-copy views
+#
+
+
+def write_arrays(log: DataLog):
+    d = log.start("d", "double[]", "", 1)
+    i = log.start("i", "int64[]", "", 1)
+    b = log.start("b", "boolean[]", "", 1)
+    f = log.start("f", "float[]", "", 1)
+    r = log.start("r", "raw", "", 1)
+
+    log.appendDoubleArray(d, [1.0, 2.5, 3.0], 10)
+    log.appendIntegerArray(i, [1, -2, 3], 10)
+    log.appendBooleanArray(b, [True, False, True], 10)
+    log.appendFloatArray(f, [0.5, 1.5], 10)
+    log.appendRaw(r, b"\x01\x02\x03", 10)
+
+
+def read_views(path: pathlib.Path) -> dict:
+    reader = DataLogReader(str(path))
+    entries = {}
+    views = {}
+    for record in reader:
+        if record.isStart():
+            data = record.getStartData()
+            entries[data.entry] = data.type
+            continue
+
+        typ = entries[record.getEntry()]
+        if typ == "double[]":
+            views[typ] = record.getDoubleArrayView()
+        elif typ == "int64[]":
+            views[typ] = record.getIntegerArrayView()
+        elif typ == "boolean[]":
+            views[typ] = record.getBooleanArrayView()
+        elif typ == "float[]":
+            views[typ] = record.getFloatArrayView()
+        elif typ == "raw":
+            views[typ] = record.getRawView()
+
+    return views
+
+
+def test_record_views(tmp_path: pathlib.Path):
+    pytest.importorskip("numpy")
+
+    path = write_log(tmp_path / "arrays.wpilog", write_arrays)
+
+    # the views remain valid after the reader goes out of scope
+    views = read_views(path)
+    gc.collect()
+
+    assert views["double[]"].tolist() == [1.0, 2.5, 3.0]
+    assert views["int64[]"].tolist() == [1, -2, 3]
+    assert views["boolean[]"].tolist() == [True, False, True]
+    assert views["float[]"].tolist() == [0.5, 1.5]
+    assert bytes(views["raw"]) == b"\x01\x02\x03"
+
+    assert not views["double[]"].flags.writeable
+    assert views["raw"].readonly
+
+
+def test_record_view_err(tmp_path: pathlib.Path):
+    pytest.importorskip("numpy")
+
+    def _write(log: DataLog):
+        r = log.start("r", "raw", "", 1)
+        log.appendRaw(r, b"\x01\x02\x03", 10)
+
+    path = write_log(tmp_path / "raw.wpilog", _write)
+    for record in DataLogReader(str(path)):
+        if not record.isControl():
+            with pytest.raises(TypeError):
+                record.getDoubleArrayView()
+
+
+#
+# readLogColumns
+#
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_read_log_columns(tmp_path: pathlib.Path, processes: bool):
+    pytest.importorskip("numpy")
+
+    paths = []
+    for n in range(4):
+
+        def _write(log: DataLog, n=n):
+            d = log.start("d", "double", "", 1)
+            for t in range(n + 1):
+                log.appendDouble(d, n, 10 + t)
+
+        paths.append(write_log(tmp_path / f"log{n}.wpilog", _write))
+
+    results = list(readLogColumns(paths, processes=processes, ordered=True))
+    assert [p for p, _ in results] == paths
+    for n, (_, columns) in enumerate(results):
+        assert columns["d"][1].tolist() == [n] * (n + 1)
+
+
+def test_read_log_columns_err(tmp_path: pathlib.Path):
+    bad = tmp_path / "bad.wpilog"
+    bad.write_bytes(b"not a log")
+
+    with pytest.raises(ValueError, match="not a valid data log"):
+        list(readLogColumns([bad]))
+
+
+#
+# DataLogStreamReader
+#
+
+
+def _record_key(record):
+    return record.getEntry(), record.getTimestamp(), record.getRaw()
+
+
+def test_stream_reader(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        write_scalars(log)
+        s = log.start("s2", "string", "md", 1000)
+        log.setMetadata(s, "md2", 1001)
+        log.appendString(s, "x" * 300, 1002)
+        log.finish(s, 1003)
+
+    path = write_log(tmp_path / "stream.wpilog", _write)
+    data = path.read_bytes()
+    expected = [_record_key(r) for r in DataLogReader(str(path))]
+
+    # feed in chunks that split records (and the header)
+    stream = DataLogStreamReader()
+    actual = []
+    seen = {}
+    for i in range(0, len(data), 7):
+        for record in stream.feed(data[i : i + 7]):
+            actual.append(_record_key(record))
+            if record.isFinish():
+                seen["finish"] = stream.entries[record.getFinishEntry()]
+            elif record.isSetMetadata():
+                seen["metadata"] = stream.entries[record.getSetMetadataData().entry]
+            elif not record.isControl():
+                seen[stream.entries[record.getEntry()].name] = True
+
+    assert actual == expected
+    assert stream.hasHeader()
+    assert stream.getOffset() == len(data)
+
+    assert seen["metadata"].metadata == "md2"
+    assert seen["finish"].name == "s2"
+    assert {"d", "i", "b", "f", "s", "s2"} <= seen.keys()
+
+    # s2 was finished, so only the entries from write_scalars remain
+    assert sorted(e.name for e in stream.entries.values()) == ["b", "d", "f", "i", "s"]
+
+
+def test_stream_reader_invalid():
+    stream = DataLogStreamReader()
+    assert list(stream.feed(b"WPI")) == []
+    with pytest.raises(ValueError):
+        list(stream.feed(b"NOTLOGxxxxxxxxxx"))
+
+
+def test_stream_reader_follow(scalar_log: pathlib.Path):
+    expected = [_record_key(r) for r in DataLogReader(str(scalar_log))]
+
+    stream = DataLogStreamReader()
+    actual = [
+        _record_key(r)
+        for r in stream.follow(scalar_log, interval=0.01, idleTimeout=0.05)
+    ]
+    assert actual == expected
+
+    # nothing new was written
+    assert list(stream.follow(scalar_log, interval=0.01, idleTimeout=0.05)) == []
+
+
+#
+# fromMmap
+#
+
+
+def test_from_mmap(scalar_log: pathlib.Path):
+    expected = [_record_key(r) for r in DataLogReader(str(scalar_log))]
+
+    reader = DataLogReader.fromMmap(scalar_log)
+    assert reader.isValid()
+    assert reader.getBufferIdentifier() == str(scalar_log)
+    assert [_record_key(r) for r in reader] == expected
+
+    index = DataLogIndex.build(reader)
+    assert [r.getDouble() for r in index.iterEntry("d")] == [t * 0.5 for t in range(10)]
+
+    # bytes paths are decoded for the name
+    reader = DataLogReader.fromMmap(os.fsencode(scalar_log))
+    assert reader.getBufferIdentifier() == str(scalar_log)
+    assert [_record_key(r) for r in reader] == expected
+
+
+def test_from_mmap_object(scalar_log: pathlib.Path):
+    expected = [_record_key(r) for r in DataLogReader(str(scalar_log))]
+
+    with open(scalar_log, "rb") as fp:
+        mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    reader = DataLogReader.fromMmap(mm, "name")
+    assert reader.getBufferIdentifier() == "name"
+    assert [_record_key(r) for r in reader] == expected
+
+    # the reader refers to the map
+    with pytest.raises(BufferError):
+        mm.close()
+
+    del reader
+    gc.collect()
+    mm.close()
+
+
+def test_from_mmap_missing(tmp_path: pathlib.Path):
+    with pytest.raises(FileNotFoundError):
+        DataLogReader.fromMmap(tmp_path / "missing.wpilog")
+
+
+#
+# Batch appends
+#
+
+
+@wpistruct.make_wpistruct(name="BatchPoint")
+@dataclasses.dataclass
+class BatchPoint:
+    x: int
+    y: float
+
+
+def read_values(path: pathlib.Path) -> dict:
+    """Returns a dict of entry name to a list of (timestamp, raw data)"""
+    names = {}
+    values = {}
+    for record in DataLogReader(str(path)):
+        if record.isStart():
+            data = record.getStartData()
+            names[data.entry] = data.name
+        elif not record.isControl():
+            name = names[record.getEntry()]
+            values.setdefault(name, []).append((record.getTimestamp(), record.getRaw()))
+    return values
+
+
+def test_append_batch(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        b = [log.start(f"b{i}", "boolean", "", 1) for i in range(2)]
+        i = [log.start(f"i{i}", "int64", "", 1) for i in range(2)]
+        f = [log.start(f"f{i}", "float", "", 1) for i in range(2)]
+        d = [log.start(f"d{i}", "double", "", 1) for i in range(2)]
+
+        log.appendBooleanBatch(b, [True, False], 10)
+        log.appendIntegerBatch(i, [1, -2], 10)
+        log.appendFloatBatch(f, [0.5, 1.5], 10)
+        log.appendDoubleBatch(d, [2.5, 3.5], 10)
+        log.appendDoubleBatch(d[:1], (4.5,), 20)
+
+    def _expected(log: DataLog):
+        b = [log.start(f"b{i}", "boolean", "", 1) for i in range(2)]
+        i = [log.start(f"i{i}", "int64", "", 1) for i in range(2)]
+        f = [log.start(f"f{i}", "float", "", 1) for i in range(2)]
+        d = [log.start(f"d{i}", "double", "", 1) for i in range(2)]
+
+        log.appendBoolean(b[0], True, 10)
+        log.appendBoolean(b[1], False, 10)
+        log.appendInteger(i[0], 1, 10)
+        log.appendInteger(i[1], -2, 10)
+        log.appendFloat(f[0], 0.5, 10)
+        log.appendFloat(f[1], 1.5, 10)
+        log.appendDouble(d[0], 2.5, 10)
+        log.appendDouble(d[1], 3.5, 10)
+        log.appendDouble(d[0], 4.5, 20)
+
+    actual = read_values(write_log(tmp_path / "batch.wpilog", _write))
+    expected = read_values(write_log(tmp_path / "expected.wpilog", _expected))
+    assert actual == expected
+
+
+def test_append_batch_now(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        n = 200
+        b = [log.start(f"b{i}", "boolean", "", 1) for i in range(n)]
+        i = [log.start(f"i{i}", "int64", "", 1) for i in range(n)]
+        f = [log.start(f"f{i}", "float", "", 1) for i in range(n)]
+        d = [log.start(f"d{i}", "double", "", 1) for i in range(n)]
+        s = [log.start(f"s{i}", "struct:BatchPoint", "", 1) for i in range(n)]
+        sa = [log.start(f"sa{i}", "struct:BatchPoint[]", "", 1) for i in range(n)]
+
+        log.appendBooleanBatch(b, [True] * n)
+        log.appendIntegerBatch(i, list(range(n)))
+        log.appendFloatBatch(f, [0.5] * n)
+        log.appendDoubleBatch(d, [0.5] * n)
+        log.appendStructBatch(s, [BatchPoint(1, 2)] * n)
+        log.appendStructArrayBatch(sa, [[BatchPoint(1, 2)]] * n)
+
+    values = read_values(write_log(tmp_path / "batch.wpilog", _write))
+    for prefix in ("b", "i", "f", "d", "s", "sa"):
+        timestamps = {values[f"{prefix}{i}"][0][0] for i in range(200)}
+        assert len(timestamps) == 1, prefix
+        assert timestamps != {0}
+
+
+def test_append_batch_numpy(tmp_path: pathlib.Path):
+    np = pytest.importorskip("numpy")
+
+    def _write(log: DataLog):
+        b = np.array([log.start(f"b{i}", "boolean", "", 1) for i in range(3)])
+        i = np.array([log.start(f"i{i}", "int64", "", 1) for i in range(3)])
+        d = np.array(
+            [log.start(f"d{i}", "double", "", 1) for i in range(3)], dtype=np.int32
+        )
+
+        log.appendBooleanBatch(b, np.array([True, False, True]), 10)
+        log.appendIntegerBatch(i, np.arange(3, dtype=np.int64), 10)
+        # strided and converted arrays work too
+        log.appendDoubleBatch(d, np.arange(6, dtype=np.float64)[::2], 10)
+        log.appendDoubleBatch(d, np.arange(3, dtype=np.float32), 20)
+
+    columns = DataLogReader(
+        str(write_log(tmp_path / "batch.wpilog", _write))
+    ).toColumns()
+
+    assert [columns[f"b{i}"][1].tolist() for i in range(3)] == [
+        [True],
+        [False],
+        [True],
+    ]
+    assert [columns[f"i{i}"][1].tolist() for i in range(3)] == [[0], [1], [2]]
+    assert [columns[f"d{i}"][1].tolist() for i in range(3)] == [
+        [0.0, 0.0],
+        [2.0, 1.0],
+        [4.0, 2.0],
+    ]
+
+
+def test_append_struct_batch(tmp_path: pathlib.Path):
+    p1 = BatchPoint(1, 1.5)
+    p2 = BatchPoint(2, 2.5)
+
+    def _write(log: DataLog):
+        s = [log.start(f"s{i}", "struct:BatchPoint", "", 1) for i in range(2)]
+        a = [log.start(f"a{i}", "struct:BatchPoint[]", "", 1) for i in range(2)]
+
+        log.appendStructBatch(s, [p1, p2], 10)
+        log.appendStructArrayBatch(a, [[p1, p2], []], 10)
+
+    values = read_values(write_log(tmp_path / "batch.wpilog", _write))
+    assert values["s0"] == [(10, wpistruct.pack(p1))]
+    assert values["s1"] == [(10, wpistruct.pack(p2))]
+    assert values["a0"] == [(10, wpistruct.packArray([p1, p2]))]
+    assert values["a1"] == [(10, b"")]
+
+
+def test_append_batch_err(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        d = log.start("d", "double", "", 1)
+        with pytest.raises(ValueError):
+            log.appendDoubleBatch([d, d], [1.0], 10)
+        with pytest.raises(TypeError):
+            log.appendDoubleBatch([d], ["x"], 10)
+        with pytest.raises(ValueError):
+            log.appendStructBatch([d], [], 10)
+
+    write_log(tmp_path / "batch.wpilog", _write)
+
+
+#
+# Typed entries
+#
+
+
+def test_entry_exports():
+    import wpiutil.log
+    from wpiutil._wpiutil import log as _log
+    from wpiutil.log import entries
+
+    for name in dir(entries):
+        if name.endswith("LogEntry"):
+            cls = getattr(wpiutil.log, name)
+            assert cls is getattr(entries, name)
+            assert issubclass(cls, getattr(_log, name))
+
+
+def test_entry_update(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        d = DoubleLogEntry(log, "d", 1)
+        assert not d.hasLastValue()
+        for t, v in enumerate([1.0, 1.0, 2.0, 2.0, 1.0]):
+            d.update(v, 10 + t)
+        assert d.hasLastValue()
+
+        # values passed to append are not tracked
+        d.append(1.0, 20)
+        d.update(1.0, 21)
+
+        a = IntegerArrayLogEntry(log, "a", 1)
+        arr = [1, 2]
+        a.update(arr, 10)
+        a.update(arr, 11)
+        arr.append(3)
+        a.update(arr, 12)
+
+        s = StructLogEntry(log, "s", BatchPoint, 1)
+        p = BatchPoint(1, 1.0)
+        s.update(p, 10)
+        s.update(BatchPoint(1, 1.0), 11)
+        p.x = 2
+        s.update(p, 12)
+
+        sa = StructArrayLogEntry(log, "sa", BatchPoint, 1)
+        sa.update([BatchPoint(1, 1.0)], 10)
+        sa.update([BatchPoint(1, 1.0)], 11)
+        sa.update([], 12)
+
+    values = read_values(write_log(tmp_path / "update.wpilog", _write))
+    assert [t for t, _ in values["d"]] == [10, 12, 14, 20]
+    assert [t for t, _ in values["a"]] == [10, 12]
+    assert [t for t, _ in values["s"]] == [10, 12]
+    assert values["s"][1][1] == wpistruct.pack(BatchPoint(2, 1.0))
+    assert [t for t, _ in values["sa"]] == [10, 12]
+
+
+def test_entry_deadband_decimation(tmp_path: pathlib.Path):
+    def _write(log: DataLog):
+        d = DoubleLogEntry(log, "d", 1)
+        d.setDeadband(0.5)
+        for t, v in enumerate([1.0, 1.25, 1.5, 1.75, 0.5, float("nan")]):
+            d.update(v, 10 + t)
+
+        i = IntegerLogEntry(log, "i", 1)
+        i.setDecimation(3)
+        for t in range(7):
+            i.update(t, 10 + t)
+
+        with pytest.raises(ValueError):
+            d.setDeadband(-1)
+        with pytest.raises(ValueError):
+            i.setDecimation(0)
+
+    values = read_values(write_log(tmp_path / "filter.wpilog", _write))
+    assert [t for t, _ in values["d"]] == [10, 13, 14, 15]
+    assert [t for t, _ in values["i"]] == [10, 13, 16]
+
+
+#
+# Compression
+#
+
+
+@pytest.mark.parametrize("method", ["gzip", "xz", "zstd", "lz4"])
+def test_compress_log(scalar_log: pathlib.Path, method: str):
+    if method == "zstd":
+        pytest.importorskip("zstandard")
+    elif method == "lz4":
+        pytest.importorskip("lz4")
+
+    expected = [_record_key(r) for r in DataLogReader(str(scalar_log))]
+
+    compressed = pathlib.Path(compressLog(scalar_log, method, remove=True))
+    assert not scalar_log.exists()
+    assert compressed.stat().st_size > 0
+    assert [p.name for p in compressed.parent.iterdir()] == [compressed.name]
+
+    reader = openLog(compressed)
+    assert reader.isValid()
+    assert reader.getBufferIdentifier() == str(compressed)
+    assert [_record_key(r) for r in reader] == expected
+
+    # parallel decoding also supports compressed logs
+    pytest.importorskip("numpy")
+    ((_, columns),) = readLogColumns([compressed])
+    assert columns["d"][1].tolist() == [t * 0.5 for t in range(10)]
+
+
+def test_compress_log_err(tmp_path: pathlib.Path, scalar_log: pathlib.Path):
+    with pytest.raises(ValueError):
+        compressLog(scalar_log, "bad")
+
+    bad = tmp_path / "bad.wpilog"
+    bad.write_bytes(b"not a log")
+    with pytest.raises(ValueError):
+        compressLog(bad)
+
+
+def test_open_log_uncompressed(scalar_log: pathlib.Path):
+    expected = [_record_key(r) for r in DataLogReader(str(scalar_log))]
+    assert [_record_key(r) for r in openLog(scalar_log)] == expected
@@ -60,6 +60,29 @@ def test_span_load_buffer_array():
     assert a2[0] == 1
 
 
+def test_span_load_double_buffer():
+    assert module.load_span_double(array.array("d", [1.5, 2, 3])) == [1.5, 2, 3]
+    assert module.load_span_double(array.array("d")) == []
+
+
+def test_span_load_int64_buffer():
+    assert module.load_span_int64(array.array("q", [1, -2, 3])) == [1, -2, 3]
+
+
+def test_span_load_buffer_other_type():
+    # buffers of another element type are converted item by item
+    assert module.load_span_double(array.array("i", [1, 2])) == [1, 2]
+    assert module.load_span_double(memoryview(b"\x01\x02")) == [1, 2]
+
+
+def test_span_load_buffer_noncontiguous():
+    np = pytest.importorskip("numpy")
+    a = np.arange(6, dtype=np.float64)
+    assert module.load_span_double(a) == [0, 1, 2, 3, 4, 5]
+    assert module.load_span_double(a[::2]) == [0, 2, 4]
+    assert module.load_span_double(a.astype(np.float32)) == [0, 1, 2, 3, 4, 5]
+
+
 def test_span_cast():
     assert module.cast_span() == [1, 2, 3]
 
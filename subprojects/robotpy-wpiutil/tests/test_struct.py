@@ -1,5 +1,10 @@
 import dataclasses
+import enum
+import gc
 import re
+import struct
+import sys
+import weakref
 
 import pytest
 
@@ -62,12 +67,24 @@ def test_unpack():
     assert wpistruct.unpack(module.ThingA, b"\x01") == module.ThingA(1)
 
 
-# def test_unpack_into():
-#     r1 = module.ThingA(1)
-#     r2 = module.ThingA(2)
-#     assert r1 != r2
-#     wpistruct.unpackInto(b"\x01", r2)
-#     assert r1 == r2
+def test_unpack_into():
+    r1 = module.ThingB(1)
+    r2 = module.ThingB(2)
+    assert r1 != r2
+    wpistruct.unpackInto(r2, b"\x01")
+    assert r1 == r2
+
+
+def test_unpack_into_err():
+    r = module.ThingB(2)
+    with pytest.raises(ValueError, match=re.escape("buffer must be 1 bytes")):
+        wpistruct.unpackInto(r, b"\x01\x02")
+
+
+def test_unpack_into_immutable():
+    r = module.ThingA(2)
+    with pytest.raises(TypeError, match="immutable"):
+        wpistruct.unpackInto(r, b"\x01")
 
 
 #
@@ -168,12 +185,27 @@ def test_user_unpack():
     assert wpistruct.unpack(MyStruct, b"\x02\x00\x00\x00\x01\x00\x00\x60\x40") == v
 
 
-# def test_user_unpack_into():
-#     v1 = MyStruct(2, True, 3.5)
-#     v2 = MyStruct(3, True, 4.5)
-#     assert v1 != v2
-#     wpistruct.unpackInto(b"\x02\x00\x00\x00\x01\x00\x00\x60\x40", v2)
-#     assert v1 == v2
+def test_user_unpack_into():
+    v1 = MyStruct(2, True, 3.5)
+    v2 = MyStruct(3, True, 4.5)
+    assert v1 != v2
+    wpistruct.unpackInto(v2, b"\x02\x00\x00\x00\x01\x00\x00\x60\x40")
+    assert v1 == v2
+
+
+@wpistruct.make_wpistruct
+@dataclasses.dataclass(frozen=True)
+class MyFrozenStruct:
+    x: int
+
+
+def test_user_unpack_into_frozen():
+    assert MyFrozenStruct.WPIStruct.unpackInto is None
+    assert wpistruct.unpack(MyFrozenStruct, b"\x02\x00\x00\x00") == MyFrozenStruct(2)
+
+    v = MyFrozenStruct(1)
+    with pytest.raises(TypeError, match="does not support unpackInto"):
+        wpistruct.unpackInto(v, b"\x02\x00\x00\x00")
 
 
 #
@@ -229,3 +261,699 @@ def test_user_nested_unpack():
     assert wpistruct.unpack(
         Outer, b"\x02\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x80\x40"
     ) == Outer(2, MyStruct(3, True, 4.0))
+
+
+def test_user_nested_unpack_into():
+    v = Outer(1, MyStruct(1, False, 1.0))
+    inner = v.inner
+    wpistruct.unpackInto(v, b"\x02\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x80\x40")
+    assert v == Outer(2, MyStruct(3, True, 4.0))
+    # nested struct is updated in place
+    assert v.inner is inner
+
+
+#
+# User defined serialization (native)
+#
+
+
+@wpistruct.make_wpistruct(name="mystruct", native=True)
+@dataclasses.dataclass
+class MyNativeStruct:
+    x: int
+    y: bool
+    z: float
+
+
+@wpistruct.make_wpistruct(native=True)
+@dataclasses.dataclass
+class NativeOuter:
+    x: wpistruct.uint16
+    inner: MyNativeStruct
+    thing: module.ThingA
+
+
+def test_native_layout():
+    assert MyNativeStruct.WPIStruct.layout is not None
+    assert MyStruct.WPIStruct.layout is None
+
+
+def test_native_pack():
+    v = MyNativeStruct(2, True, 3.5)
+    assert wpistruct.pack(v) == wpistruct.pack(MyStruct(2, True, 3.5))
+
+
+def test_native_pack_err():
+    v = MyNativeStruct(2**40, True, 3.5)
+    with pytest.raises(ValueError, match=re.escape("error packing data (field 'x')")):
+        wpistruct.pack(v)
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_native_matches_python(native: bool):
+    @wpistruct.make_wpistruct(native=native)
+    @dataclasses.dataclass
+    class Small:
+        x: float
+        y: wpistruct.int8
+
+    v = Small(1.5, -3)
+    assert wpistruct.pack(v) == b"\x00\x00\xc0\x3f\xfd"
+    assert wpistruct.unpack(Small, wpistruct.pack(v)) == v
+
+    # doubles that don't fit in a float are errors, infinity is not
+    assert wpistruct.pack(Small(float("inf"), 0)) == b"\x00\x00\x80\x7f\x00"
+    with pytest.raises(ValueError) as exc_info:
+        wpistruct.pack(Small(1e300, 0))
+    assert isinstance(exc_info.value.__cause__, OverflowError)
+
+
+def test_native_unpack():
+    v = MyNativeStruct(2, True, 3.5)
+    assert wpistruct.unpack(MyNativeStruct, wpistruct.pack(v)) == v
+
+
+def test_native_nested_schema():
+    assert wpistruct.getSchema(NativeOuter) == (
+        "uint16 x; mystruct inner; ThingA thing"
+    )
+    assert wpistruct.getSize(NativeOuter) == 2 + 9 + 1
+
+
+def test_native_nested_pack_unpack():
+    v = NativeOuter(7, MyNativeStruct(3, False, 4.0), module.ThingA(5))
+    data = wpistruct.pack(v)
+    assert data == b"\x07\x00\x03\x00\x00\x00\x00\x00\x00\x80\x40\x05"
+    assert wpistruct.unpack(NativeOuter, data) == v
+
+
+def test_native_unpack_into():
+    v1 = MyNativeStruct(2, True, 3.5)
+    v2 = MyNativeStruct(3, False, 4.5)
+    wpistruct.unpackInto(v2, wpistruct.pack(v1))
+    assert v1 == v2
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10")
+def test_native_slots():
+    @wpistruct.make_wpistruct(native=True, slots=True, frozen=True)
+    class Slotted:
+        x: int
+        y: float
+
+    v = Slotted(2, 3.5)
+    assert wpistruct.unpack(Slotted, wpistruct.pack(v)) == v
+    assert wpistruct.unpackArray(Slotted, wpistruct.packArray([v, v])) == [v, v]
+
+
+def test_native_nested_reassigned():
+    @wpistruct.make_wpistruct(native=True)
+    @dataclasses.dataclass
+    class Inner:
+        x: wpistruct.int16
+
+    @wpistruct.make_wpistruct(native=True)
+    @dataclasses.dataclass
+    class Outer:
+        inner: Inner
+
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class Bytes:
+        lo: wpistruct.uint8
+        hi: wpistruct.uint8
+
+    assert wpistruct.pack(Outer(Inner(1))) == b"\x01\x00"
+
+    # nested converters are looked up on each use, so they follow WPIStruct
+    Inner.WPIStruct = Bytes.WPIStruct
+    assert wpistruct.pack(Outer(Bytes(1, 2))) == b"\x01\x02"
+    assert wpistruct.unpack(Outer, b"\x03\x04") == Outer(Bytes(3, 4))
+
+    # but the layout of the outer struct cannot change
+    Inner.WPIStruct = MyStruct.WPIStruct
+    with pytest.raises(ValueError, match="size of field 'inner' changed"):
+        wpistruct.unpack(Outer, b"\x03\x04")
+
+
+#
+# Arrays
+#
+
+
+def test_pack_array():
+    assert wpistruct.packArray([module.ThingA(1), module.ThingA(2)]) == b"\x01\x02"
+
+
+def test_pack_array_empty():
+    assert wpistruct.packArray([]) == b""
+
+
+def test_pack_array_mixed_err():
+    with pytest.raises(TypeError, match="all objects must be the same type"):
+        wpistruct.packArray([module.ThingA(1), MyStruct(2, True, 3.5)])
+
+
+def test_pack_array_into():
+    buf = bytearray(4)
+    assert wpistruct.packArrayInto([module.ThingA(1), module.ThingA(2)], buf, 1) == 2
+    assert buf == b"\x00\x01\x02\x00"
+
+
+def test_pack_array_into_err():
+    buf = bytearray(2)
+    with pytest.raises(ValueError, match="buffer is too small"):
+        wpistruct.packArrayInto([module.ThingA(1), module.ThingA(2)], buf, 1)
+
+
+def test_unpack_array():
+    assert wpistruct.unpackArray(module.ThingA, b"\x01\x02") == [
+        module.ThingA(1),
+        module.ThingA(2),
+    ]
+
+
+def test_unpack_array_err():
+    with pytest.raises(ValueError, match=re.escape("multiple of 5 bytes")):
+        wpistruct.unpackArray(module.Outer, b"\x01\x02")
+
+
+def test_user_array_roundtrip():
+    values = [MyStruct(1, True, 1.5), MyStruct(2, False, 2.5)]
+    data = wpistruct.packArray(values)
+    assert len(data) == 18
+    assert wpistruct.unpackArray(MyStruct, memoryview(data)) == values
+
+
+#
+# Unpacker
+#
+
+
+def test_unpacker():
+    data = wpistruct.packArray([module.ThingB(1), module.ThingB(2), module.ThingB(3)])
+    u = wpistruct.Unpacker(module.ThingB, data)
+
+    assert len(u) == 3
+    assert u[0] == module.ThingB(1)
+    assert u[-1] == module.ThingB(3)
+    assert list(u) == [module.ThingB(1), module.ThingB(2), module.ThingB(3)]
+
+    with pytest.raises(IndexError):
+        u[3]
+
+    with pytest.raises(IndexError):
+        u[-4]
+
+
+def test_unpacker_user():
+    values = [MyStruct(i, i % 2 == 0, i / 2) for i in range(4)]
+    u = wpistruct.Unpacker(MyStruct, memoryview(wpistruct.packArray(values)))
+    assert list(u) == values
+
+
+def test_unpacker_user_unpack_from():
+    values = [MyStruct(i, i % 2 == 0, i / 2) for i in range(4)]
+    data = wpistruct.packArray(values)
+    assert MyStruct.WPIStruct.unpackFrom(data, 9) == values[1]
+
+    # descriptors without unpackFrom are unpacked one view at a time
+    class NoUnpackFrom(MyStruct):
+        WPIStruct = MyStruct.WPIStruct._replace(unpackFrom=None)
+
+    assert list(wpistruct.Unpacker(NoUnpackFrom, data)) == values
+    assert wpistruct.unpackArray(NoUnpackFrom, data) == values
+
+
+def test_unpacker_unpack_into():
+    data = wpistruct.packArray([module.ThingB(1), module.ThingB(2)])
+    u = wpistruct.Unpacker(module.ThingB, data)
+
+    v = module.ThingB(0)
+    u.unpackInto(1, v)
+    assert v == module.ThingB(2)
+
+    with pytest.raises(TypeError, match="expected"):
+        u.unpackInto(0, module.ThingA(0))
+
+
+def test_unpacker_err():
+    with pytest.raises(ValueError, match=re.escape("multiple of 9 bytes")):
+        wpistruct.Unpacker(MyStruct, b"\x00" * 10)
+
+
+def test_unpacker_keeps_buffer():
+    buf = bytearray(wpistruct.packArray([module.ThingB(1), module.ThingB(2)]))
+    u = wpistruct.Unpacker(module.ThingB, buf)
+
+    # the buffer is exported, so it cannot be resized underneath the unpacker
+    with pytest.raises(BufferError):
+        buf.extend(b"\x00")
+
+    buf[1] = 5
+    assert u[1] == module.ThingB(5)
+
+
+#
+# Converter cache
+#
+
+
+def test_user_reassign_wpistruct():
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class Wide:
+        x: int
+
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class Narrow:
+        x: wpistruct.int8
+
+    assert wpistruct.getSize(Wide) == 4
+    assert wpistruct.pack(Wide(1)) == b"\x01\x00\x00\x00"
+
+    # the cached converter must not be used once WPIStruct changes
+    Wide.WPIStruct = Narrow.WPIStruct
+    assert wpistruct.getSize(Wide) == 1
+    assert wpistruct.getTypeString(Wide) == "struct:Narrow"
+
+
+def test_user_cache_attribute():
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class Cached:
+        x: int
+
+    wpistruct.pack(Cached(1))
+
+    # the cache is stored under a dunder name, and only on the type
+    names = [n for n in vars(Cached) if "wpystruct" in n]
+    assert names and all(n.startswith("__") and n.endswith("__") for n in names)
+    assert vars(Cached(1)) == {"x": 1}
+    assert dataclasses.astuple(Cached(1)) == (1,)
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_user_cached_type_is_collected(native: bool):
+    @wpistruct.make_wpistruct(native=native)
+    @dataclasses.dataclass
+    class Temporary:
+        x: int
+
+    assert wpistruct.unpack(Temporary, wpistruct.pack(Temporary(1))) == Temporary(1)
+
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+
+
+#
+# User defined serialization (arrays, enums, bit-fields)
+#
+
+needs_annotated = pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="typing.Annotated requires Python 3.9"
+)
+
+
+class MyEnum(enum.IntEnum):
+    A = 1
+    B = 2
+
+
+@needs_annotated
+def test_user_array():
+    from typing import Annotated, List
+
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class ArrStruct:
+        x: Annotated[List[wpistruct.double], 3]
+        inner: Annotated[List[MyStruct], 2]
+
+    assert wpistruct.getSchema(ArrStruct) == "double x[3]; mystruct inner[2]"
+    assert wpistruct.getSize(ArrStruct) == 8 * 3 + 9 * 2
+
+    v = ArrStruct([1.0, 2.0, 3.0], [MyStruct(1, True, 2.0), MyStruct(3, False, 4.0)])
+    data = wpistruct.pack(v)
+    assert data[:24] == struct.pack("<3d", 1, 2, 3)
+    assert wpistruct.unpack(ArrStruct, data) == v
+
+    v2 = ArrStruct([0.0] * 3, [MyStruct(0, False, 0.0)] * 2)
+    wpistruct.unpackInto(v2, data)
+    assert v2 == v
+
+    with pytest.raises(ValueError, match="error packing data"):
+        wpistruct.pack(ArrStruct([1.0], v.inner))
+
+
+@needs_annotated
+def test_user_enum():
+    from typing import Annotated
+
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class EnumStruct:
+        a: MyEnum
+        b: Annotated[MyEnum, wpistruct.uint8]
+
+    assert wpistruct.getSchema(EnumStruct) == (
+        "enum {A=1, B=2} int32 a; enum {A=1, B=2} uint8 b"
+    )
+
+    v = EnumStruct(MyEnum.A, MyEnum.B)
+    data = wpistruct.pack(v)
+    assert data == b"\x01\x00\x00\x00\x02"
+
+    v2 = wpistruct.unpack(EnumStruct, data)
+    assert v2 == v
+    assert isinstance(v2.b, MyEnum)
+
+    with pytest.raises(ValueError, match="error unpacking data"):
+        wpistruct.unpack(EnumStruct, b"\x01\x00\x00\x00\x03")
+
+
+@needs_annotated
+def test_user_storage_type_requires_enum():
+    from typing import Annotated
+
+    with pytest.raises(TypeError, match="IntEnum"):
+
+        @wpistruct.make_wpistruct
+        @dataclasses.dataclass
+        class NotEnum:
+            a: Annotated[int, wpistruct.uint8]
+
+
+@needs_annotated
+def test_user_bitfield():
+    from typing import Annotated
+
+    @wpistruct.make_wpistruct
+    @dataclasses.dataclass
+    class BitStruct:
+        a: Annotated[bool, wpistruct.bitfield(1)]
+        b: Annotated[wpistruct.uint8, wpistruct.bitfield(3)]
+        c: Annotated[wpistruct.int8, wpistruct.bitfield(3)]
+        d: Annotated[bool, wpistruct.bitfield(1)]
+        e: Annotated[bool, wpistruct.bitfield(1)]
+        x: wpistruct.uint16
+
+    assert wpistruct.getSchema(BitStruct) == (
+        "bool a:1; uint8 b:3; int8 c:3; bool d:1; bool e:1; uint16 x"
+    )
+    assert wpistruct.getSize(BitStruct) == 4
+
+    v = BitStruct(True, 5, -2, False, True, 7)
+    data = wpistruct.pack(v)
+    assert data == bytes([1 | (5 << 1) | (0b110 << 4), 1, 7, 0])
+    assert wpistruct.unpack(BitStruct, data) == v
+
+    # the schema decoder must agree with the generated layout
+    registry = wpistruct.StructRegistry()
+    registry.addType(BitStruct)
+    assert registry.unpack("struct:BitStruct", data) == (True, 5, -2, False, True, 7)
+
+
+@needs_annotated
+def test_user_bitfield_err():
+    from typing import Annotated
+
+    with pytest.raises(ValueError, match="bit-field width"):
+
+        @wpistruct.make_wpistruct
+        @dataclasses.dataclass
+        class BadStruct:
+            a: Annotated[wpistruct.uint8, wpistruct.bitfield(9)]
+
+    with pytest.raises(TypeError, match="bit-fields must be bool or int"):
+
+        @wpistruct.make_wpistruct
+        @dataclasses.dataclass
+        class BadStruct2:
+            a: Annotated[float, wpistruct.bitfield(1)]
+
+
+@needs_annotated
+def test_user_array_not_native():
+    from typing import Annotated, List
+
+    @wpistruct.make_wpistruct(native=True)
+    @dataclasses.dataclass
+    class ArrStruct:
+        x: Annotated[List[int], 2]
+
+    assert ArrStruct.WPIStruct.layout is None
+    assert wpistruct.unpack(ArrStruct, wpistruct.pack(ArrStruct([1, 2]))).x == [1, 2]
+
+
+#
+# User defined serialization (slots/frozen)
+#
+
+
+def test_user_make_dataclass():
+    @wpistruct.make_wpistruct
+    class Plain:
+        x: int
+
+    assert dataclasses.is_dataclass(Plain)
+    assert wpistruct.unpack(Plain, wpistruct.pack(Plain(1))) == Plain(1)
+
+
+def test_user_frozen():
+    @wpistruct.make_wpistruct(frozen=True)
+    class Frozen:
+        x: int
+        y: wpistruct.double
+
+    v = Frozen(1, 2.0)
+    assert wpistruct.unpack(Frozen, wpistruct.pack(v)) == v
+    assert Frozen.WPIStruct.unpackInto is None
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        v.x = 2
+
+
+def test_user_frozen_existing_dataclass():
+    with pytest.raises(TypeError, match="already a dataclass"):
+
+        @wpistruct.make_wpistruct(frozen=True)
+        @dataclasses.dataclass
+        class NotFrozen:
+            x: int
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10")
+def test_user_slots():
+    @wpistruct.make_wpistruct(slots=True, frozen=True)
+    class Slotted:
+        x: int
+        inner: MyStruct
+        y: wpistruct.double = 0.0
+
+    assert not hasattr(Slotted(1, MyStruct(1, True, 2.0)), "__dict__")
+
+    v = Slotted(1, MyStruct(2, True, 3.0), 4.0)
+    v2 = wpistruct.unpack(Slotted, wpistruct.pack(v))
+    assert type(v2) is Slotted
+    assert v2 == v
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10")
+def test_user_slots_post_init():
+    @wpistruct.make_wpistruct(slots=True)
+    class PostInit:
+        x: int
+
+        def __post_init__(self):
+            self.x += 1
+
+    # __post_init__ is still called when unpacking
+    assert wpistruct.unpack(PostInit, b"\x01\x00\x00\x00").x == 2
+
+    v = PostInit(0)
+    wpistruct.unpackInto(v, b"\x05\x00\x00\x00")
+    assert v.x == 5
+
+
+#
+# Schema parsing
+#
+
+
+def test_parse_schema():
+    from wpiutil.wpistruct._schema import SchemaField, parseSchema
+
+    assert parseSchema(
+        "enum {a=1, b=-2} int8 e; double d[4]; uint8 flag:1; bool b:1; ThingA t;"
+    ) == [
+        SchemaField("e", "int8", None, None, {"a": 1, "b": -2}),
+        SchemaField("d", "double", 4, None, None),
+        SchemaField("flag", "uint8", None, 1, None),
+        SchemaField("b", "bool", None, 1, None),
+        SchemaField("t", "ThingA", None, None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        "int32",
+        "int32 x; int32 x",
+        "int8 x:9",
+        "bool x:2",
+        "double x:1",
+        "enum {a=1} double x",
+        "int32 x[0]",
+    ],
+)
+def test_parse_schema_err(schema):
+    from wpiutil.wpistruct._schema import parseSchema
+
+    with pytest.raises(ValueError):
+        parseSchema(schema)
+
+
+#
+# numpy dtype
+#
+
+
+def test_dtype():
+    np = pytest.importorskip("numpy")
+
+    dtype = wpistruct.getDtype(MyStruct)
+    assert dtype == np.dtype([("x", "<i4"), ("y", "?"), ("z", "<f4")])
+    assert dtype.itemsize == wpistruct.getSize(MyStruct)
+
+
+def test_dtype_nested():
+    np = pytest.importorskip("numpy")
+
+    dtype = wpistruct.getDtype(module.Outer)
+    assert dtype == np.dtype([("inner", [("value", "u1")]), ("c", "<i4")])
+
+    data = wpistruct.packArray(
+        [module.Outer(module.ThingA(i), i * 10) for i in range(3)]
+    )
+    arr = np.frombuffer(data, dtype=dtype)
+    assert arr["inner"]["value"].tolist() == [0, 1, 2]
+    assert arr["c"].tolist() == [0, 10, 20]
+
+
+def test_dtype_user_nested():
+    np = pytest.importorskip("numpy")
+
+    v = Outer(2, MyStruct(3, True, 4.0))
+    arr = np.frombuffer(wpistruct.pack(v), dtype=wpistruct.getDtype(Outer))
+    assert arr["x"][0] == 2
+    assert arr["inner"]["x"][0] == 3
+    assert arr["inner"]["y"][0]
+    assert arr["inner"]["z"][0] == 4.0
+
+
+#
+# Dynamic decoding
+#
+
+
+def test_registry_type():
+    registry = wpistruct.StructRegistry()
+    registry.addType(Outer)
+
+    assert registry.hasSchema("struct:mystruct")
+    assert registry.hasSchema("/.schema/struct:Outer")
+
+    data = wpistruct.pack(Outer(2, MyStruct(3, True, 4.0)))
+    assert registry.unpack("struct:Outer", data) == (2, (3, True, 4.0))
+    assert registry.unpackDict("struct:Outer", data) == {
+        "x": 2,
+        "inner": {"x": 3, "y": True, "z": 4.0},
+    }
+    assert registry.unpack("struct:Outer[]", data * 2) == [(2, (3, True, 4.0))] * 2
+
+
+def test_registry_cpp_type():
+    registry = wpistruct.StructRegistry()
+    registry.addType(module.Outer)
+
+    decoder = registry.getDecoder("Outer")
+    assert decoder.size == wpistruct.getSize(module.Outer)
+    assert decoder.unpack(wpistruct.pack(module.Outer(module.ThingA(1), 2))) == (
+        (1,),
+        2,
+    )
+
+
+def test_registry_schema():
+    registry = wpistruct.StructRegistry()
+    registry.addSchema("NT:/.schema/struct:Inner", b"double x; double y")
+    registry.addSchema(
+        "struct:Thing",
+        "enum {a=1, b=2} int8 e; char name[4]; uint8 f:3; int8 g:3; bool b:1; "
+        "double arr[2]; Inner inner[2]",
+    )
+
+    decoder = registry.getDecoder("struct:Thing")
+    assert decoder.fieldNames == ("e", "name", "f", "g", "b", "arr", "inner")
+    assert decoder.size == 1 + 4 + 1 + 16 + 32
+
+    bits = 5 | (0b110 << 3) | (1 << 6)
+    data = struct.pack("<b4sB6d", 2, b"ab\0\0", bits, 1, 2, 3, 4, 5, 6)
+    assert decoder.unpack(data) == (
+        2,
+        "ab",
+        5,
+        -2,
+        True,
+        (1.0, 2.0),
+        ((3.0, 4.0), (5.0, 6.0)),
+    )
+    assert decoder.unpackDict(data)["inner"][1] == {"x": 5.0, "y": 6.0}
+
+
+def test_registry_schema_update():
+    registry = wpistruct.StructRegistry()
+    registry.addSchema("Thing", "int8 x")
+    assert registry.getDecoder("Thing").size == 1
+
+    registry.addSchema("Thing", "int16 x")
+    assert registry.getDecoder("Thing").size == 2
+
+
+def test_registry_errors():
+    registry = wpistruct.StructRegistry()
+    registry.addSchema("Thing", "Missing x")
+
+    with pytest.raises(ValueError, match="schema for struct 'Missing'"):
+        registry.getDecoder("Thing")
+
+    registry.addSchema("Thing", "int8 x")
+    with pytest.raises(ValueError, match="error unpacking data"):
+        registry.unpack("struct:Thing", b"\x01\x02")
+
+
+def test_registry_numpy():
+    np = pytest.importorskip("numpy")
+
+    registry = wpistruct.StructRegistry()
+    registry.addType(MyStruct)
+
+    data = wpistruct.packArray([MyStruct(i, True, i / 2) for i in range(3)])
+    arr = registry.getDecoder("mystruct").unpackNumpy(data)
+    assert arr["x"].tolist() == [0, 1, 2]
+    assert arr["z"].tolist() == [0, 0.5, 1.0]
+
+
+def test_registry_name_is_not_code():
+    # struct names come from the log, and must not be executed
+    name = 'x") from None\nraise SystemExit("injected'
+    registry = wpistruct.StructRegistry()
+    registry.addSchema(name, "int8 x")
+
+    decoder = registry.getDecoder(name)
+    with pytest.raises(ValueError, match="error unpacking data"):
+        decoder.unpack(b"\x01\x02")
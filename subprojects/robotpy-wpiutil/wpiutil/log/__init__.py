@@ -17,6 +17,8 @@ from .._wpiutil.log import (
     StartRecordData,
     StringArrayLogEntry,
     StringLogEntry,
+    StructArrayLogEntry,
+    StructLogEntry,
 )
 
 __all__ = [
@@ -37,4 +39,41 @@ __all__ = [
     "StartRecordData",
     "StringArrayLogEntry",
     "StringLogEntry",
+    "StructArrayLogEntry",
+    "StructLogEntry",
 ]
+
+# The typed entries with update() are subclasses defined in entries.py. They
+# replace the native classes imported above, so that the section above can
+# still be regenerated by create-imports
+from .entries import (
+    BooleanArrayLogEntry,
+    BooleanLogEntry,
+    DoubleArrayLogEntry,
+    DoubleLogEntry,
+    FloatArrayLogEntry,
+    FloatLogEntry,
+    IntegerArrayLogEntry,
+    IntegerLogEntry,
+    RawLogEntry,
+    StringArrayLogEntry,
+    StringLogEntry,
+    StructArrayLogEntry,
+    StructLogEntry,
+)
+
+from .index import DataLogIndex, IndexedEntry
+
+__all__ += ["DataLogIndex", "IndexedEntry"]
+
+from .compress import compressLog, openLog
+
+__all__ += ["compressLog", "openLog"]
+
+from .parallel import readLogColumns
+
+__all__ += ["readLogColumns"]
+
+from .stream import DataLogStreamReader, StreamEntry
+
+__all__ += ["DataLogStreamReader", "StreamEntry"]
@@ -0,0 +1,126 @@
+import os
+import shutil
+import typing
+
+from .._wpiutil.log import DataLogReader
+
+PathType = typing.Union[str, os.PathLike]
+
+_WPILOG_MAGIC = b"WPILOG"
+
+
+def _gzip_open(path: str, mode: str, level: typing.Optional[int]):
+    import gzip
+
+    if level is None:
+        return gzip.open(path, mode)
+    return gzip.open(path, mode, compresslevel=level)
+
+
+def _xz_open(path: str, mode: str, level: typing.Optional[int]):
+    import lzma
+
+    if "w" in mode:
+        return lzma.open(path, mode, preset=level)
+    return lzma.open(path, mode)
+
+
+def _zstd_open(path: str, mode: str, level: typing.Optional[int]):
+    import zstandard
+
+    if "w" in mode:
+        cctx = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return zstandard.open(path, mode, cctx=cctx)
+    return zstandard.open(path, mode)
+
+
+def _lz4_open(path: str, mode: str, level: typing.Optional[int]):
+    import lz4.frame
+
+    if "w" in mode:
+        return lz4.frame.open(path, mode, compression_level=level or 0)
+    return lz4.frame.open(path, mode)
+
+
+#: method: (file extension, magic bytes, open function)
+_methods: typing.Dict[str, typing.Tuple[str, bytes, typing.Callable]] = {
+    "gzip": (".gz", b"\x1f\x8b", _gzip_open),
+    "xz": (".xz", b"\xfd7zXZ\x00", _xz_open),
+    "zstd": (".zst", b"\x28\xb5\x2f\xfd", _zstd_open),
+    "lz4": (".lz4", b"\x04\x22\x4d\x18", _lz4_open),
+}
+
+
+def compressLog(
+    path: PathType,
+    method: str = "gzip",
+    level: typing.Optional[int] = None,
+    remove: bool = False,
+) -> str:
+    """
+    Compresses a data log that is no longer being written, and returns the
+    name of the compressed file (the log's filename with an extension such
+    as ``.gz`` appended). Use :func:`openLog` to read the compressed log.
+
+    :param path:   Log to compress
+    :param method: ``gzip`` or ``xz``, or ``zstd`` or ``lz4`` if the
+                   zstandard or lz4 packages are installed
+    :param level:  Compression level (the default depends on the method)
+    :param remove: Delete the uncompressed log once it has been compressed
+
+    .. note:: Logs compress very well, but compression is CPU intensive, so
+              avoid compressing logs on a robot while it is enabled
+    """
+    try:
+        ext, _, opener = _methods[method]
+    except KeyError:
+        expected = ", ".join(_methods)
+        raise ValueError(
+            f"unknown compression method '{method}' (expected one of {expected})"
+        ) from None
+
+    path = os.fspath(path)
+    dst = path + ext
+    tmp = dst + ".tmp"
+
+    with open(path, "rb") as src:
+        if src.read(len(_WPILOG_MAGIC)) != _WPILOG_MAGIC:
+            raise ValueError(f"{path}: not a data log")
+        src.seek(0)
+
+        # write to a temporary file so a partial file is never left behind
+        try:
+            with opener(tmp, "wb", level) as fp:
+                shutil.copyfileobj(src, fp, 1024 * 1024)
+            os.replace(tmp, dst)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    if remove:
+        os.unlink(path)
+
+    return dst
+
+
+def openLog(path: PathType) -> DataLogReader:
+    """
+    Opens a data log for reading. Logs that were compressed by
+    :func:`compressLog` are detected by their contents and decompressed
+    into memory, other logs are opened normally.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as fp:
+        magic = fp.read(8)
+
+    if not magic.startswith(_WPILOG_MAGIC):
+        for _, cmagic, opener in _methods.values():
+            if magic.startswith(cmagic):
+                with opener(path, "rb", None) as fp:
+                    data = fp.read()
+                return DataLogReader(data, path)
+
+    return DataLogReader(path)
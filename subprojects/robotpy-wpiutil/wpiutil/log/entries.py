@@ -0,0 +1,150 @@
+#
+# Typed log entries with change detection
+#
+# These subclass the entries from the C++ library to add update(), which
+# only appends a record when the value is different from the last value
+# that it appended. update() can also discard values (decimation), and
+# numeric entries can ignore small changes (deadband).
+#
+
+import typing
+
+from .. import wpistruct
+from .._wpiutil import log as _log
+
+_unset = object()
+
+
+class _ChangeDetection:
+    # the comparison key of the last value appended by update()
+    _lastKey: typing.Any = _unset
+
+    # update() only considers every nth value
+    _decimation = 1
+    _count = 0
+
+    @staticmethod
+    def _key(value):
+        return value
+
+    def _changed(self, key) -> bool:
+        return key != self._lastKey
+
+    def update(self, value, timestamp: int = 0) -> None:
+        """
+        Appends a record to the log only if the value is different from the
+        last value appended by this function. Use this instead of append to
+        shrink the log when a value rarely changes.
+
+        Values passed to append are not tracked.
+
+        :param value:     Value to record
+        :param timestamp: Time stamp (may be 0 to indicate now)
+        """
+        if self._decimation != 1:
+            count = self._count
+            self._count = (count + 1) % self._decimation
+            if count != 0:
+                return
+
+        key = self._key(value)
+        if self._changed(key):
+            self.append(value, timestamp)
+            self._lastKey = key
+
+    def hasLastValue(self) -> bool:
+        """Returns True if update() has appended a value"""
+        return self._lastKey is not _unset
+
+    def setDecimation(self, n: int) -> None:
+        """
+        Only consider every nth value passed to update(), starting with the
+        next value. The others are discarded without being compared.
+
+        :param n: 1 considers every value
+        """
+        if n < 1:
+            raise ValueError(f"decimation must be at least 1 (got {n})")
+        self._decimation = n
+        self._count = 0
+
+
+class _NumericChangeDetection(_ChangeDetection):
+    _deadband = 0
+
+    def _changed(self, key) -> bool:
+        last = self._lastKey
+        # written this way so that NaN is always a change
+        return last is _unset or not abs(key - last) <= self._deadband
+
+    def setDeadband(self, deadband: float) -> None:
+        """
+        Only append values passed to update() when they differ from the last
+        appended value by more than the deadband
+
+        :param deadband: 0 appends any change
+        """
+        if not deadband >= 0:
+            raise ValueError(f"deadband must not be negative (got {deadband})")
+        self._deadband = deadband
+
+
+class _SequenceChangeDetection(_ChangeDetection):
+    # copy the contents, so that a mutated list (or numpy array) is detected
+    _key = staticmethod(tuple)
+
+
+class RawLogEntry(_ChangeDetection, _log.RawLogEntry):
+    __doc__ = _log.RawLogEntry.__doc__
+    _key = staticmethod(bytes)
+
+
+class BooleanLogEntry(_ChangeDetection, _log.BooleanLogEntry):
+    __doc__ = _log.BooleanLogEntry.__doc__
+
+
+class IntegerLogEntry(_NumericChangeDetection, _log.IntegerLogEntry):
+    __doc__ = _log.IntegerLogEntry.__doc__
+
+
+class FloatLogEntry(_NumericChangeDetection, _log.FloatLogEntry):
+    __doc__ = _log.FloatLogEntry.__doc__
+
+
+class DoubleLogEntry(_NumericChangeDetection, _log.DoubleLogEntry):
+    __doc__ = _log.DoubleLogEntry.__doc__
+
+
+class StringLogEntry(_ChangeDetection, _log.StringLogEntry):
+    __doc__ = _log.StringLogEntry.__doc__
+
+
+class BooleanArrayLogEntry(_SequenceChangeDetection, _log.BooleanArrayLogEntry):
+    __doc__ = _log.BooleanArrayLogEntry.__doc__
+
+
+class IntegerArrayLogEntry(_SequenceChangeDetection, _log.IntegerArrayLogEntry):
+    __doc__ = _log.IntegerArrayLogEntry.__doc__
+
+
+class FloatArrayLogEntry(_SequenceChangeDetection, _log.FloatArrayLogEntry):
+    __doc__ = _log.FloatArrayLogEntry.__doc__
+
+
+class DoubleArrayLogEntry(_SequenceChangeDetection, _log.DoubleArrayLogEntry):
+    __doc__ = _log.DoubleArrayLogEntry.__doc__
+
+
+class StringArrayLogEntry(_SequenceChangeDetection, _log.StringArrayLogEntry):
+    __doc__ = _log.StringArrayLogEntry.__doc__
+
+
+class StructLogEntry(_ChangeDetection, _log.StructLogEntry):
+    __doc__ = _log.StructLogEntry.__doc__
+    # structs may be mutable, so compare the serialized data
+    _key = staticmethod(wpistruct.pack)
+
+
+class StructArrayLogEntry(_ChangeDetection, _log.StructArrayLogEntry):
+    __doc__ = _log.StructArrayLogEntry.__doc__
+    _key = staticmethod(wpistruct.packArray)
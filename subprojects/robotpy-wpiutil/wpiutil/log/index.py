@@ -0,0 +1,295 @@
+import array
+import bisect
+import heapq
+import json
+import os
+import struct
+import sys
+import typing
+
+from .._wpiutil.log import DataLogReader, DataLogRecord
+
+_MAGIC = b"WPILOGIDX\x01"
+_LEN = struct.Struct("<Q")
+
+
+def _to_le(a: array.array) -> array.array:
+    if sys.byteorder == "big":
+        a = array.array(a.typecode, a)
+        a.byteswap()
+    return a
+
+
+def _from_bytes(typecode: str, b: bytes) -> array.array:
+    a = array.array(typecode)
+    a.frombytes(b)
+    return a
+
+
+class IndexedEntry(typing.NamedTuple):
+    """An entry that was started in an indexed data log"""
+
+    #: Entry ID in the log (these may be reused after an entry is finished)
+    entry: int
+
+    #: Name of the entry
+    name: str
+
+    #: Data type of the entry
+    type: str
+
+    #: Metadata of the entry
+    metadata: str
+
+    #: Byte offset of the start record of the entry
+    startOffset: int
+
+    #: Byte offset of each data record of the entry
+    offsets: array.array
+
+
+class DataLogIndex:
+    """
+    An index of the records in a data log, which allows the data for a
+    single entry (or the data near a timestamp) to be retrieved without
+    decoding every record in the log::
+
+        reader = DataLogReader("match.wpilog")
+        index = DataLogIndex.cached(reader, "match.wpilog")
+
+        for record in index.iterEntry("/SmartDashboard/x"):
+            print(record.getTimestamp(), record.getDouble())
+
+    The index is built in a single pass over the log. It contains the byte
+    offset of every data record of each entry, and a table of (timestamp,
+    offset) checkpoints used by :meth:`seek`.
+    """
+
+    def __init__(
+        self,
+        reader: DataLogReader,
+        entries: typing.List[IndexedEntry],
+        cpTimestamps: array.array,
+        cpOffsets: array.array,
+        count: int,
+        lastOffset: int,
+        interval: int,
+    ):
+        self.reader = reader
+        #: every entry started in the log, in order
+        self.entries = entries
+        self._cpTimestamps = cpTimestamps
+        self._cpOffsets = cpOffsets
+        self._count = count
+        self._lastOffset = lastOffset
+        self._interval = interval
+
+        self._byName: typing.Dict[str, typing.List[IndexedEntry]] = {}
+        for e in entries:
+            self._byName.setdefault(e.name, []).append(e)
+
+    @classmethod
+    def build(cls, reader: DataLogReader, interval: int = 1000000) -> "DataLogIndex":
+        """
+        Scans the log and builds an index
+
+        :param reader:   Log to index
+        :param interval: Approximate interval (in microseconds) between the
+                         checkpoints used by :meth:`seek`
+        """
+        entries, cpTimestamps, cpOffsets, count, lastOffset = reader._scan(interval)
+        return cls(
+            reader,
+            [
+                IndexedEntry(e, name, typ, md, start, _from_bytes("Q", offsets))
+                for e, name, typ, md, start, offsets in entries
+            ],
+            _from_bytes("q", cpTimestamps),
+            _from_bytes("Q", cpOffsets),
+            count,
+            lastOffset,
+            interval,
+        )
+
+    def __len__(self) -> int:
+        """Number of records in the log"""
+        return self._count
+
+    def getEntryNames(self) -> typing.List[str]:
+        """Names of all entries in the log, in the order they were started"""
+        return list(self._byName.keys())
+
+    def getEntries(self, name: str) -> typing.List[IndexedEntry]:
+        """
+        Each time that an entry with the specified name was started. Usually
+        there is only one.
+        """
+        return self._byName.get(name, [])
+
+    def iterEntry(self, name: str) -> typing.Iterator[DataLogRecord]:
+        """
+        Iterates over the data records of the specified entry. Only the
+        records of this entry are read from the log.
+
+        .. warning:: Like iterating over a :class:`DataLogReader`, each
+                     record is only valid until the iterator is advanced
+        """
+        entries = self.getEntries(name)
+        if not entries:
+            raise KeyError(name)
+        elif len(entries) == 1:
+            offsets = entries[0].offsets
+        else:
+            offsets = array.array("Q", heapq.merge(*(e.offsets for e in entries)))
+        return self.reader._iterOffsets(offsets)
+
+    def seek(self, timestamp: int) -> typing.Iterator[DataLogRecord]:
+        """
+        Iterates over the records of the log starting at the specified
+        timestamp (in microseconds). Data records with an earlier timestamp
+        are skipped, but control records (such as entry starts) are not.
+        Records are returned in the order they are in the log; use
+        :attr:`entries` to find entries that were started before the
+        timestamp.
+
+        .. warning:: Like iterating over a :class:`DataLogReader`, each
+                     record is only valid until the iterator is advanced
+        """
+        # the last checkpoint before which all timestamps are earlier
+        i = bisect.bisect_left(self._cpTimestamps, timestamp) - 1
+        if i < 0:
+            return
+        for record in self.reader._iterFrom(self._cpOffsets[i]):
+            if record.isControl() or record.getTimestamp() >= timestamp:
+                yield record
+
+    #
+    # Sidecar files
+    #
+
+    def save(self, path: typing.Union[str, os.PathLike]) -> None:
+        """
+        Writes the index to a file. The index is written to a temporary
+        file that replaces the file when it is complete, so an interrupted
+        write does not leave a truncated index behind.
+        """
+        header = {
+            "extraHeader": self.reader.getExtraHeader(),
+            "count": self._count,
+            "lastOffset": self._lastOffset,
+            "interval": self._interval,
+            "checkpoints": len(self._cpOffsets),
+            "entries": [
+                [e.entry, e.name, e.type, e.metadata, e.startOffset, len(e.offsets)]
+                for e in self.entries
+            ],
+        }
+        hdata = json.dumps(header).encode("utf-8")
+
+        tmppath = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        try:
+            with open(tmppath, "wb") as fp:
+                fp.write(_MAGIC)
+                fp.write(_LEN.pack(len(hdata)))
+                fp.write(hdata)
+                _to_le(self._cpTimestamps).tofile(fp)
+                _to_le(self._cpOffsets).tofile(fp)
+                for e in self.entries:
+                    _to_le(e.offsets).tofile(fp)
+            os.replace(tmppath, path)
+        except BaseException:
+            try:
+                os.unlink(tmppath)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(
+        cls, reader: DataLogReader, path: typing.Union[str, os.PathLike]
+    ) -> "DataLogIndex":
+        """
+        Reads an index written by :meth:`save`. Raises ValueError if the
+        file is not an index or was not created for this log.
+        """
+        with open(path, "rb") as fp:
+            if fp.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a data log index")
+
+            def _read(typecode: str, n: int) -> array.array:
+                a = array.array(typecode)
+                a.fromfile(fp, n)
+                return _to_le(a)
+
+            # a damaged index raises ValueError so that it can be rebuilt
+            try:
+                (hlen,) = _LEN.unpack(fp.read(_LEN.size))
+                header = json.loads(fp.read(hlen).decode("utf-8"))
+
+                ncp = header["checkpoints"]
+                cpTimestamps = _read("q", ncp)
+                cpOffsets = _read("Q", ncp)
+                entries = [
+                    IndexedEntry(e, name, typ, md, start, _read("Q", n))
+                    for e, name, typ, md, start, n in header["entries"]
+                ]
+
+                index = cls(
+                    reader,
+                    entries,
+                    cpTimestamps,
+                    cpOffsets,
+                    header["count"],
+                    header["lastOffset"],
+                    header["interval"],
+                )
+                extraHeader = header["extraHeader"]
+
+                lastOffset = header["lastOffset"]
+                if type(lastOffset) is not int or lastOffset < 0:
+                    raise TypeError("lastOffset must be a non-negative int")
+                # an offset past the end of the log is not the last record
+                isLast = index._isLast(lastOffset)
+            except EOFError:
+                raise ValueError(f"{path} is truncated") from None
+            except (KeyError, TypeError, IndexError, struct.error) as e:
+                raise ValueError(f"{path} is not a valid data log index") from e
+
+        if extraHeader != reader.getExtraHeader() or not isLast:
+            raise ValueError(f"{path} is not an index of this log")
+
+        return index
+
+    @classmethod
+    def cached(
+        cls,
+        reader: DataLogReader,
+        logPath: typing.Union[str, os.PathLike],
+        interval: int = 1000000,
+    ) -> "DataLogIndex":
+        """
+        Loads the index from a sidecar file next to the log (the log's
+        filename with ``.idx`` appended), or builds the index and writes the
+        sidecar file if it does not exist or is out of date.
+        """
+        path = os.fspath(logPath) + ".idx"
+        try:
+            return cls.load(reader, path)
+        except (OSError, ValueError):
+            pass
+
+        index = cls.build(reader, interval)
+        try:
+            index.save(path)
+        except OSError:
+            pass
+        return index
+
+    def _isLast(self, offset: int) -> bool:
+        # the record at the offset must be the last record of the log
+        if self._count == 0:
+            return True
+        it = self.reader._iterFrom(offset)
+        if next(it, None) is None:
+            return False
+        return next(it, None) is None
@@ -0,0 +1,80 @@
+import concurrent.futures
+import os
+import typing
+
+from .compress import openLog
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+    Columns = typing.Dict[str, typing.Tuple[numpy.ndarray, numpy.ndarray]]
+else:
+    Columns = dict
+
+PathType = typing.Union[str, os.PathLike]
+
+
+def _readColumns(path: PathType, names: typing.Optional[typing.List[str]]) -> "Columns":
+    reader = openLog(path)
+    if not reader.isValid():
+        raise ValueError(f"{os.fspath(path)}: not a valid data log")
+    return reader.toColumns(names)
+
+
+def readLogColumns(
+    paths: typing.Iterable[PathType],
+    names: typing.Optional[typing.Sequence[str]] = None,
+    *,
+    maxWorkers: typing.Optional[int] = None,
+    processes: bool = False,
+    ordered: bool = False,
+) -> typing.Iterator[typing.Tuple[PathType, "Columns"]]:
+    """
+    Decodes many data logs in parallel using
+    :meth:`DataLogReader.toColumns`, yielding ``(path, columns)`` for each
+    log as it is decoded::
+
+        for path, columns in readLogColumns(glob.glob("logs/*.wpilog")):
+            ts, voltage = columns["/SystemStats/BatteryVoltage"]
+            print(path, voltage.min())
+
+    Loading and decoding a log releases the GIL, so by default a thread pool
+    is used. If ``processes`` is True, a process pool is used instead, which
+    may be faster if you do additional python processing of the results.
+    Compressed logs are supported (see :func:`openLog`).
+
+    :param paths:      Data logs to decode
+    :param names:      If specified, only decode these entries
+    :param maxWorkers: Number of workers (default is the number of CPUs)
+    :param processes:  Use a process pool instead of a thread pool
+    :param ordered:    Yield results in the order of paths instead of the
+                       order they finish decoding
+
+    If a log cannot be decoded, the exception is raised when its result is
+    reached.
+
+    .. note:: numpy must be installed to use this function
+    """
+    paths = list(paths)
+    if names is not None:
+        names = list(names)
+
+    if processes:
+        executor = concurrent.futures.ProcessPoolExecutor(maxWorkers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(maxWorkers)
+
+    with executor:
+        futures = {executor.submit(_readColumns, path, names): path for path in paths}
+        try:
+            if ordered:
+                it = iter(futures)
+            else:
+                it = concurrent.futures.as_completed(futures)
+
+            for future in it:
+                yield futures[future], future.result()
+        finally:
+            # don't decode remaining logs if the caller stops early
+            for future in futures:
+                future.cancel()
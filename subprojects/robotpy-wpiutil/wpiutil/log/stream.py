@@ -0,0 +1,205 @@
+import os
+import struct
+import time
+import typing
+
+from .._wpiutil.log import DataLogReader, DataLogRecord
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Buffer
+else:
+    Buffer = bytearray
+
+_HEADER = struct.Struct("<6sHI")
+
+
+class StreamEntry(typing.NamedTuple):
+    """An entry that is currently started in a streamed data log"""
+
+    #: Entry ID in the log
+    entry: int
+
+    #: Name of the entry
+    name: str
+
+    #: Data type of the entry
+    type: str
+
+    #: Metadata of the entry
+    metadata: str
+
+
+class DataLogStreamReader:
+    """
+    Reads a data log incrementally as bytes are appended to it, such as
+    a log that is still being written by :class:`DataLogManager`. Only
+    new records are decoded each time data is added::
+
+        stream = DataLogStreamReader()
+
+        for record in stream.follow("/home/lvuser/logs/FRC_TBD.wpilog"):
+            if not record.isControl():
+                entry = stream.entries[record.getEntry()]
+                print(entry.name, record.getTimestamp())
+
+    Records that are only partially written are held back until the rest
+    of the record is added. The entries that are currently started are
+    tracked across chunks in :attr:`entries`.
+    """
+
+    def __init__(self):
+        #: Currently started entries, by entry ID. This is updated before
+        #: a start or set metadata record is yielded, and after a finish
+        #: record is yielded.
+        self.entries: typing.Dict[int, StreamEntry] = {}
+
+        self._header: typing.Optional[bytes] = None
+        self._version = 0
+        self._extraHeader = ""
+        self._pending = bytearray()
+        self._offset = 0
+
+    def hasHeader(self) -> bool:
+        """True once the log header has been read"""
+        return self._header is not None
+
+    def getVersion(self) -> int:
+        """Gets the data log version. Returns 0 if the header has not been read yet"""
+        return self._version
+
+    def getExtraHeader(self) -> str:
+        """Gets the extra header data"""
+        return self._extraHeader
+
+    def getOffset(self) -> int:
+        """Number of bytes of the log that have been consumed"""
+        return self._offset
+
+    def feed(self, data: Buffer) -> typing.Iterator[DataLogRecord]:
+        """
+        Adds bytes that were appended to the log, and returns an iterator
+        over the records that were completed by them. Raises ValueError if
+        the data does not start with a valid log header.
+
+        .. warning:: Like iterating over a :class:`DataLogReader`, each
+                     record is only valid until the iterator is advanced.
+                     The iterator must be exhausted before more data is
+                     added, otherwise :attr:`entries` will not be updated.
+        """
+        self._pending += data
+
+        if self._header is None and not self._readHeader():
+            return iter(())
+
+        end = self._complete()
+        if end == 0:
+            return iter(())
+
+        # The records are decoded by a reader over just the new records,
+        # so the log is never parsed again from the start
+        buf = self._header + self._pending[:end]
+        del self._pending[:end]
+        self._offset += end
+
+        # bytes would be taken as a filename, so pass a memoryview
+        return self._iter(DataLogReader(memoryview(buf)))
+
+    def follow(
+        self,
+        path: typing.Union[str, os.PathLike],
+        interval: float = 0.25,
+        idleTimeout: typing.Optional[float] = None,
+        chunkSize: int = 1024 * 1024,
+    ) -> typing.Iterator[DataLogRecord]:
+        """
+        Follows a log file as it is written, yielding each record as it is
+        appended. The file is read starting from where this reader left off,
+        so a new reader starts at the beginning of the file.
+
+        :param path:        Log file to follow
+        :param interval:    Seconds to wait before checking for new data
+        :param idleTimeout: If not None, stop once no new data has been
+                            written for this many seconds. Otherwise the file
+                            is followed until the iterator is closed.
+        :param chunkSize:   Maximum number of bytes to read at once
+        """
+        with open(path, "rb") as fp:
+            fp.seek(self._offset + len(self._pending))
+            idle = 0.0
+            while True:
+                data = fp.read(chunkSize)
+                if data:
+                    idle = 0.0
+                    yield from self.feed(data)
+                    continue
+
+                if idleTimeout is not None and idle >= idleTimeout:
+                    return
+
+                time.sleep(interval)
+                idle += interval
+
+    def _readHeader(self) -> bool:
+        if len(self._pending) < _HEADER.size:
+            return False
+
+        magic, version, extraLen = _HEADER.unpack_from(self._pending)
+        if magic != b"WPILOG" or version < 0x0100:
+            raise ValueError("data is not a data log")
+
+        hlen = _HEADER.size + extraLen
+        if len(self._pending) < hlen:
+            return False
+
+        self._header = bytes(self._pending[:hlen])
+        self._version = version
+        self._extraHeader = self._header[_HEADER.size :].decode("utf-8", "replace")
+        del self._pending[:hlen]
+        self._offset = hlen
+        return True
+
+    def _complete(self) -> int:
+        # length of the complete records at the start of the pending data
+        buf = self._pending
+        size = len(buf)
+        pos = 0
+        while pos + 4 <= size:
+            h = buf[pos]
+            entryLen = (h & 0x3) + 1
+            sizeLen = ((h >> 2) & 0x3) + 1
+            headerLen = 1 + entryLen + sizeLen + ((h >> 4) & 0x7) + 1
+            if pos + headerLen > size:
+                break
+
+            s = pos + 1 + entryLen
+            recordLen = headerLen + int.from_bytes(buf[s : s + sizeLen], "little")
+            if pos + recordLen > size:
+                break
+
+            pos += recordLen
+
+        return pos
+
+    def _iter(self, reader: DataLogReader) -> typing.Iterator[DataLogRecord]:
+        entries = self.entries
+        for record in reader:
+            if not record.isControl():
+                yield record
+            elif record.isStart():
+                data = record.getStartData()
+                entries[data.entry] = StreamEntry(
+                    data.entry, data.name, data.type, data.metadata
+                )
+                yield record
+            elif record.isSetMetadata():
+                data = record.getSetMetadataData()
+                entry = entries.get(data.entry)
+                if entry is not None:
+                    entries[data.entry] = entry._replace(metadata=data.metadata)
+                yield record
+            elif record.isFinish():
+                entry = record.getFinishEntry()
+                yield record
+                entries.pop(entry, None)
+            else:
+                yield record
@@ -0,0 +1,42 @@
+// This file is autogenerated. DO NOT EDIT
+#include <robotpy_build.h>
+
+
+
+
+#include <wpi/DataLog.h>
+
+
+#include <pybind11/functional.h>
+
+#include <wpi_span_type_caster.h>
+
+#include <wpystruct.h>
+
+
+
+
+
+
+
+
+#include <rpygen/wpi__log__StructLogEntry.hpp>
+#include "DataLog_tmpl.hpp"
+
+namespace rpygen {
+
+using BindType = rpygen::bind_wpi__log__StructLogEntry<WPyStruct, WPyStructInfo>;
+static std::unique_ptr<BindType> inst;
+
+bind_wpi__log__StructLogEntry_0::bind_wpi__log__StructLogEntry_0(py::module &m, const char * clsName)
+{
+    inst = std::make_unique<BindType>(m, clsName);
+}
+
+void bind_wpi__log__StructLogEntry_0::finish(const char *set_doc, const char *add_doc)
+{
+    inst->finish(set_doc, add_doc);
+    inst.reset();
+}
+
+}; // namespace rpygen
@@ -0,0 +1,187 @@
+#include "pydatalog.h"
+
+#include <fmt/format.h>
+#include <wpi/timestamp.h>
+#include <pybind11/stl.h>
+
+#include <span>
+#include <vector>
+
+#include "wpystruct_fns.h"
+
+namespace pywpiutil {
+
+namespace {
+
+// converts a sequence, raising TypeError with a useful message on failure
+template <typename T> T ConvertSequence(py::handle h, const char *what) {
+  using item_caster = py::detail::make_caster<typename T::value_type>;
+  py::detail::make_caster<T> caster;
+  if (!caster.load(h, true)) {
+    throw py::type_error(fmt::format("{} must be a sequence of {}, not {}",
+                                     what, item_caster::name.text,
+                                     pytypename(py::type::of(h))));
+  }
+  return py::detail::cast_op<T &&>(std::move(caster));
+}
+
+// A column of batch values. Buffers (such as numpy arrays) that already
+// have the right item type are used directly, anything else is converted
+// into a vector. The GIL must be held when this is destroyed.
+template <typename T> class BatchColumn {
+public:
+  BatchColumn(py::handle h, const char *what) {
+    if (PyObject_CheckBuffer(h.ptr())) {
+      m_info = py::reinterpret_borrow<py::buffer>(h).request();
+      if (m_info.ndim == 1 && m_info.item_type_is_equivalent_to<T>() &&
+          (m_info.size < 2 || m_info.strides[0] == sizeof(T))) {
+        m_data = std::span(static_cast<const T *>(m_info.ptr), m_info.size);
+        return;
+      }
+    }
+
+    m_vec = ConvertSequence<std::vector<T>>(h, what);
+    m_data = m_vec;
+  }
+
+  BatchColumn(const BatchColumn &) = delete;
+  BatchColumn &operator=(const BatchColumn &) = delete;
+
+  size_t size() const { return m_data.size(); }
+  const T &operator[](size_t i) const { return m_data[i]; }
+
+private:
+  py::buffer_info m_info;
+  std::vector<T> m_vec;
+  std::span<const T> m_data;
+};
+
+void CheckSizes(size_t entries, size_t values) {
+  if (entries != values) {
+    throw py::value_error(
+        fmt::format("entries and values must be the same length ({} != {})",
+                    entries, values));
+  }
+}
+
+// A batch is a single sample, so when the timestamp is 0 the current time
+// is read once for all of the records instead of by each append
+int64_t BatchTimestamp(int64_t timestamp) {
+  return timestamp != 0 ? timestamp : wpi::Now();
+}
+
+template <typename T, typename F>
+void AppendBatch(py::handle entries, py::handle values, F &&append) {
+  BatchColumn<int> e{entries, "entries"};
+  BatchColumn<T> v{values, "values"};
+  CheckSizes(e.size(), v.size());
+
+  py::gil_scoped_release release;
+  for (size_t i = 0; i < e.size(); i++) {
+    append(e[i], v[i]);
+  }
+}
+
+void AppendRawBatch(wpi::log::DataLog &log, const BatchColumn<int> &e,
+                    const std::vector<py::bytes> &data, int64_t timestamp) {
+  std::vector<std::span<const uint8_t>> spans;
+  spans.reserve(data.size());
+  for (auto &b : data) {
+    auto p = reinterpret_cast<const uint8_t *>(PyBytes_AS_STRING(b.ptr()));
+    spans.emplace_back(p, PyBytes_GET_SIZE(b.ptr()));
+  }
+
+  // bytes objects are immutable, so they can be read without the GIL
+  py::gil_scoped_release release;
+  for (size_t i = 0; i < e.size(); i++) {
+    log.AppendRaw(e[i], spans[i], timestamp);
+  }
+}
+
+} // namespace
+
+void DataLogAppendBooleanBatch(wpi::log::DataLog &log, py::handle entries,
+                               py::handle values, int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  BatchColumn<int> e{entries, "entries"};
+
+  // std::vector<bool> cannot be viewed as a span, so BatchColumn isn't used
+  std::vector<uint8_t> converted;
+  py::buffer_info info;
+  std::span<const uint8_t> v;
+  if (PyObject_CheckBuffer(values.ptr())) {
+    info = py::reinterpret_borrow<py::buffer>(values).request();
+  }
+  if (info.ptr && info.ndim == 1 && info.item_type_is_equivalent_to<bool>() &&
+      (info.size < 2 || info.strides[0] == 1)) {
+    v = std::span(static_cast<const uint8_t *>(info.ptr), info.size);
+  } else {
+    auto b = ConvertSequence<std::vector<bool>>(values, "values");
+    converted.assign(b.begin(), b.end());
+    v = converted;
+  }
+
+  CheckSizes(e.size(), v.size());
+
+  py::gil_scoped_release release;
+  for (size_t i = 0; i < e.size(); i++) {
+    log.AppendBoolean(e[i], v[i] != 0, timestamp);
+  }
+}
+
+void DataLogAppendIntegerBatch(wpi::log::DataLog &log, py::handle entries,
+                               py::handle values, int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  AppendBatch<int64_t>(entries, values, [&](int entry, int64_t value) {
+    log.AppendInteger(entry, value, timestamp);
+  });
+}
+
+void DataLogAppendFloatBatch(wpi::log::DataLog &log, py::handle entries,
+                             py::handle values, int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  AppendBatch<float>(entries, values, [&](int entry, float value) {
+    log.AppendFloat(entry, value, timestamp);
+  });
+}
+
+void DataLogAppendDoubleBatch(wpi::log::DataLog &log, py::handle entries,
+                              py::handle values, int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  AppendBatch<double>(entries, values, [&](int entry, double value) {
+    log.AppendDouble(entry, value, timestamp);
+  });
+}
+
+void DataLogAppendStructBatch(wpi::log::DataLog &log, py::handle entries,
+                              const py::sequence &values, int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  BatchColumn<int> e{entries, "entries"};
+  CheckSizes(e.size(), values.size());
+
+  std::vector<py::bytes> data;
+  data.reserve(e.size());
+  for (auto v : values) {
+    data.emplace_back(pack(WPyStruct(py::reinterpret_borrow<py::object>(v))));
+  }
+
+  AppendRawBatch(log, e, data, timestamp);
+}
+
+void DataLogAppendStructArrayBatch(wpi::log::DataLog &log, py::handle entries,
+                                   const py::sequence &values,
+                                   int64_t timestamp) {
+  timestamp = BatchTimestamp(timestamp);
+  BatchColumn<int> e{entries, "entries"};
+  CheckSizes(e.size(), values.size());
+
+  std::vector<py::bytes> data;
+  data.reserve(e.size());
+  for (auto v : values) {
+    data.emplace_back(packArray(v.cast<py::sequence>()));
+  }
+
+  AppendRawBatch(log, e, data, timestamp);
+}
+
+}; // namespace pywpiutil
@@ -0,0 +1,27 @@
+#pragma once
+
+#include <robotpy_build.h>
+#include <wpi/DataLog.h>
+
+namespace pywpiutil {
+
+void DataLogAppendBooleanBatch(wpi::log::DataLog &log, py::handle entries,
+                               py::handle values, int64_t timestamp);
+
+void DataLogAppendIntegerBatch(wpi::log::DataLog &log, py::handle entries,
+                               py::handle values, int64_t timestamp);
+
+void DataLogAppendFloatBatch(wpi::log::DataLog &log, py::handle entries,
+                             py::handle values, int64_t timestamp);
+
+void DataLogAppendDoubleBatch(wpi::log::DataLog &log, py::handle entries,
+                              py::handle values, int64_t timestamp);
+
+void DataLogAppendStructBatch(wpi::log::DataLog &log, py::handle entries,
+                              const py::sequence &values, int64_t timestamp);
+
+void DataLogAppendStructArrayBatch(wpi::log::DataLog &log, py::handle entries,
+                                   const py::sequence &values,
+                                   int64_t timestamp);
+
+}; // namespace pywpiutil
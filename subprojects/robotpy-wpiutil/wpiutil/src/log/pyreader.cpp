@@ -0,0 +1,383 @@
+
+#include "pyreader.h"
+
+#include <fmt/format.h>
+
+#include <algorithm>
+#include <limits>
+#include <string_view>
+#include <unordered_map>
+#include <unordered_set>
+
+namespace pywpiutil {
+
+// Returns a numpy array that takes ownership of the vector contents
+template <typename T> static py::array VectorToArray(std::vector<T> &&v) {
+  auto data = new std::vector<T>(std::move(v));
+  py::capsule owner(data, [](void *p) { delete (std::vector<T> *)p; });
+  return py::array_t<T>({static_cast<py::ssize_t>(data->size())},
+                        {static_cast<py::ssize_t>(sizeof(T))}, data->data(),
+                        owner);
+}
+
+namespace {
+
+enum class ColumnType { Boolean, Int64, Float, Double };
+
+struct Column {
+  ColumnType type;
+  std::vector<int64_t> timestamps;
+  std::vector<uint8_t> b;
+  std::vector<int64_t> i;
+  std::vector<float> f;
+  std::vector<double> d;
+};
+
+std::optional<ColumnType> ScalarColumnType(std::string_view type) {
+  if (type == "double") {
+    return ColumnType::Double;
+  } else if (type == "int64") {
+    return ColumnType::Int64;
+  } else if (type == "float") {
+    return ColumnType::Float;
+  } else if (type == "boolean") {
+    return ColumnType::Boolean;
+  }
+  return std::nullopt;
+}
+
+} // namespace
+
+py::dict DataLogReaderToColumns(const wpi::log::DataLogReader &reader,
+                                std::optional<std::vector<std::string>> names) {
+  // column names are in the order they were first seen in the log
+  std::vector<std::string> order;
+  std::unordered_map<std::string, Column> columns;
+
+  {
+    py::gil_scoped_release release;
+
+    std::unordered_set<std::string_view> wanted;
+    if (names) {
+      wanted.insert(names->begin(), names->end());
+    }
+
+    // entry id -> column for currently started entries
+    std::unordered_map<int, Column *> entries;
+
+    for (const auto &record : reader) {
+      if (record.IsStart()) {
+        wpi::log::StartRecordData data;
+        if (!record.GetStartData(&data)) {
+          continue;
+        }
+
+        auto type = ScalarColumnType(data.type);
+        if (!type || (names && !wanted.contains(data.name))) {
+          entries.erase(data.entry);
+          continue;
+        }
+
+        std::string name{data.name};
+        auto [it, inserted] = columns.try_emplace(name);
+        if (inserted) {
+          it->second.type = *type;
+          order.push_back(name);
+        } else if (it->second.type != *type) {
+          // the same name was restarted with a different type; only the
+          // data matching the first type can be put in the column
+          entries.erase(data.entry);
+          continue;
+        }
+        entries[data.entry] = &it->second;
+      } else if (record.IsFinish()) {
+        int entry;
+        if (record.GetFinishEntry(&entry)) {
+          entries.erase(entry);
+        }
+      } else if (!record.IsControl()) {
+        auto it = entries.find(record.GetEntry());
+        if (it == entries.end()) {
+          continue;
+        }
+
+        auto &col = *it->second;
+        bool ok = false;
+        switch (col.type) {
+        case ColumnType::Boolean: {
+          bool v;
+          if ((ok = record.GetBoolean(&v))) {
+            col.b.push_back(v);
+          }
+          break;
+        }
+        case ColumnType::Int64: {
+          int64_t v;
+          if ((ok = record.GetInteger(&v))) {
+            col.i.push_back(v);
+          }
+          break;
+        }
+        case ColumnType::Float: {
+          float v;
+          if ((ok = record.GetFloat(&v))) {
+            col.f.push_back(v);
+          }
+          break;
+        }
+        case ColumnType::Double: {
+          double v;
+          if ((ok = record.GetDouble(&v))) {
+            col.d.push_back(v);
+          }
+          break;
+        }
+        }
+
+        if (ok) {
+          col.timestamps.push_back(record.GetTimestamp());
+        }
+      }
+    }
+  }
+
+  py::dict result;
+  for (auto &name : order) {
+    auto &col = columns[name];
+    py::object values;
+    switch (col.type) {
+    case ColumnType::Boolean:
+      values = VectorToArray(std::move(col.b)).attr("view")("bool");
+      break;
+    case ColumnType::Int64:
+      values = VectorToArray(std::move(col.i));
+      break;
+    case ColumnType::Float:
+      values = VectorToArray(std::move(col.f));
+      break;
+    case ColumnType::Double:
+      values = VectorToArray(std::move(col.d));
+      break;
+    }
+
+    result[py::str(name)] =
+        py::make_tuple(VectorToArray(std::move(col.timestamps)), values);
+  }
+
+  return result;
+}
+
+
+//
+// Zero-copy views of record data
+//
+
+py::memoryview DataLogRecordGetRawView(const wpi::log::DataLogRecord &record) {
+  auto data = record.GetRaw();
+  return py::memoryview::from_memory(data.data(), data.size());
+}
+
+py::array DataLogRecordGetArrayView(py::handle record, const char *dtype,
+                                    size_t itemsize, const char *what) {
+  auto data = record.cast<const wpi::log::DataLogRecord &>().GetRaw();
+  if (data.size() % itemsize != 0) {
+    throw py::type_error(fmt::format("not {}", what));
+  }
+
+  // the record is the base of the array, which keeps the log alive
+  py::ssize_t n = data.size() / itemsize;
+  py::ssize_t stride = itemsize;
+  py::array arr(py::dtype(dtype), {n}, {stride}, data.data(), record);
+  py::detail::array_proxy(arr.ptr())->flags &=
+      ~py::detail::npy_api::NPY_ARRAY_WRITEABLE_;
+  return arr;
+}
+
+//
+// Index support
+//
+
+namespace {
+
+// The log starts with a 12 byte header followed by the extra header, and
+// iterators identify records by their byte offset from the start
+constexpr size_t kHeaderSize = 12;
+
+const uint8_t *BufferStart(const wpi::log::DataLogReader &reader) {
+  return reinterpret_cast<const uint8_t *>(reader.GetExtraHeader().data()) -
+         kHeaderSize;
+}
+
+uint64_t FirstOffset(const wpi::log::DataLogReader &reader) {
+  return kHeaderSize + reader.GetExtraHeader().size();
+}
+
+template <typename T> py::bytes VectorToBytes(const std::vector<T> &v) {
+  return py::bytes(reinterpret_cast<const char *>(v.data()),
+                   v.size() * sizeof(T));
+}
+
+struct IndexedEntry {
+  int entry;
+  std::string name;
+  std::string type;
+  std::string metadata;
+  uint64_t startOffset;
+  std::vector<uint64_t> offsets;
+};
+
+} // namespace
+
+py::tuple DataLogReaderScan(const wpi::log::DataLogReader &reader,
+                            int64_t interval) {
+  if (!reader.IsValid()) {
+    throw py::value_error("not a valid data log");
+  }
+  if (interval <= 0) {
+    throw py::value_error("interval must be positive");
+  }
+
+  std::vector<IndexedEntry> entries;
+  std::vector<int64_t> cpTimestamps;
+  std::vector<uint64_t> cpOffsets;
+  uint64_t count = 0;
+  uint64_t lastOffset = 0;
+
+  {
+    py::gil_scoped_release release;
+
+    auto base = BufferStart(reader);
+    uint64_t pos = FirstOffset(reader);
+
+    // entry id -> index of currently started entry
+    std::unordered_map<int, size_t> active;
+
+    // maximum timestamp of all records before the current one, so that a
+    // checkpoint (t, offset) guarantees that no record before the offset
+    // has a timestamp greater than t
+    int64_t maxBefore = std::numeric_limits<int64_t>::min();
+
+    for (const auto &record : reader) {
+      uint64_t offset = pos;
+      auto data = record.GetRaw();
+      pos = data.data() + data.size() - base;
+
+      if (cpOffsets.empty() || maxBefore >= cpTimestamps.back() + interval) {
+        cpTimestamps.push_back(maxBefore);
+        cpOffsets.push_back(offset);
+      }
+
+      maxBefore = std::max(maxBefore, record.GetTimestamp());
+      lastOffset = offset;
+      count++;
+
+      if (record.IsStart()) {
+        wpi::log::StartRecordData start;
+        if (record.GetStartData(&start)) {
+          active[start.entry] = entries.size();
+          entries.emplace_back(IndexedEntry{
+              start.entry, std::string{start.name}, std::string{start.type},
+              std::string{start.metadata}, offset, {}});
+        }
+      } else if (record.IsFinish()) {
+        int entry;
+        if (record.GetFinishEntry(&entry)) {
+          active.erase(entry);
+        }
+      } else if (!record.IsControl()) {
+        auto it = active.find(record.GetEntry());
+        if (it != active.end()) {
+          entries[it->second].offsets.push_back(offset);
+        }
+      }
+    }
+  }
+
+  py::list pyentries(entries.size());
+  for (size_t i = 0; i < entries.size(); i++) {
+    auto &e = entries[i];
+    auto t = py::make_tuple(e.entry, e.name, e.type, e.metadata, e.startOffset,
+                            VectorToBytes(e.offsets));
+    PyList_SET_ITEM(pyentries.ptr(), i, t.release().ptr());
+  }
+
+  return py::make_tuple(pyentries, VectorToBytes(cpTimestamps),
+                        VectorToBytes(cpOffsets), count, lastOffset);
+}
+
+py::iterator DataLogReaderIterFrom(const wpi::log::DataLogReader &reader,
+                                   uint64_t offset) {
+  if (!reader.IsValid()) {
+    throw py::value_error("not a valid data log");
+  }
+  if (offset < FirstOffset(reader)) {
+    throw py::index_error("offset is not in the log");
+  }
+
+  // an offset past the end of the log produces no records
+  wpi::log::DataLogIterator begin = reader.end();
+  if (DataLogRecordAt{&reader, offset}.IsValid()) {
+    begin = wpi::log::DataLogIterator{&reader, offset};
+  }
+  return py::make_iterator(begin, reader.end());
+}
+
+py::iterator DataLogReaderIterOffsets(const wpi::log::DataLogReader &reader,
+                                      const py::buffer &offsets) {
+  if (!reader.IsValid()) {
+    throw py::value_error("not a valid data log");
+  }
+
+  auto req = offsets.request();
+  if (req.itemsize != sizeof(uint64_t) || req.ndim != 1 ||
+      (req.size > 1 && req.strides[0] != sizeof(uint64_t))) {
+    throw py::value_error("offsets must be a contiguous buffer of uint64");
+  }
+
+  auto data = static_cast<const uint64_t *>(req.ptr);
+  auto v = std::make_shared<std::vector<uint64_t>>(data, data + req.size);
+
+  auto first = FirstOffset(reader);
+  for (auto offset : *v) {
+    if (offset < first) {
+      throw py::index_error("offset is not in the log");
+    }
+  }
+
+  return py::make_iterator(DataLogOffsetIterator{&reader, v, 0},
+                           DataLogOffsetIterator{&reader, v, v->size()});
+}
+
+py::object DataLogReaderFromMmap(py::object source, std::string name) {
+  auto mmap = py::module_::import("mmap");
+  py::object mm;
+
+  if (py::isinstance(source, mmap.attr("mmap"))) {
+    mm = source;
+  } else {
+    auto os = py::module_::import("os");
+    auto path = os.attr("fspath")(source);
+    if (name.empty()) {
+      name = os.attr("fsdecode")(path).cast<std::string>();
+    }
+
+    // the map holds its own reference to the file, so it can be closed
+    auto fp = py::module_::import("io").attr("open")(path, "rb");
+    try {
+      mm = mmap.attr("mmap")(fp.attr("fileno")(), 0,
+                             py::arg("access") = mmap.attr("ACCESS_READ"));
+    } catch (...) {
+      fp.attr("close")();
+      throw;
+    }
+    fp.attr("close")();
+  }
+
+  // The buffer constructor only keeps its argument alive, and releases the
+  // buffer export right away. A memoryview holds the export for as long as
+  // it exists, which prevents the map from being closed or resized while
+  // the reader is using it.
+  return py::type::of<wpi::log::DataLogReader>()(py::memoryview(mm), name);
+}
+
+}; // namespace pywpiutil
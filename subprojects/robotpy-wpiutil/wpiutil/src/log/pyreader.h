@@ -0,0 +1,85 @@
+
+#pragma once
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+#include <wpi/DataLogReader.h>
+
+#include <iterator>
+#include <memory>
+#include <optional>
+#include <string>
+#include <vector>
+
+namespace pywpiutil {
+
+// Reads the record at an offset, and checks that it is within the log
+class DataLogRecordAt : public wpi::log::DataLogIterator {
+public:
+  using wpi::log::DataLogIterator::DataLogIterator;
+
+  bool IsValid() const {
+    operator*();
+    return m_valid;
+  }
+};
+
+// Iterates over the records at the specified byte offsets of a log
+class DataLogOffsetIterator {
+public:
+  using iterator_category = std::input_iterator_tag;
+  using value_type = wpi::log::DataLogRecord;
+  using difference_type = std::ptrdiff_t;
+  using pointer = const value_type *;
+  using reference = const value_type &;
+
+  DataLogOffsetIterator(const wpi::log::DataLogReader *reader,
+                        std::shared_ptr<const std::vector<uint64_t>> offsets,
+                        size_t idx)
+      : m_reader{reader}, m_offsets{std::move(offsets)}, m_idx{idx} {}
+
+  bool operator==(const DataLogOffsetIterator &oth) const {
+    return m_idx == oth.m_idx;
+  }
+
+  DataLogOffsetIterator &operator++() {
+    ++m_idx;
+    return *this;
+  }
+
+  reference operator*() const {
+    DataLogRecordAt it{m_reader, (*m_offsets)[m_idx]};
+    if (!it.IsValid()) {
+      throw py::index_error("offset is not in the log");
+    }
+    m_value = *it;
+    return m_value;
+  }
+
+private:
+  const wpi::log::DataLogReader *m_reader;
+  std::shared_ptr<const std::vector<uint64_t>> m_offsets;
+  size_t m_idx;
+  mutable wpi::log::DataLogRecord m_value;
+};
+
+py::dict DataLogReaderToColumns(const wpi::log::DataLogReader &reader,
+                                std::optional<std::vector<std::string>> names);
+
+py::memoryview DataLogRecordGetRawView(const wpi::log::DataLogRecord &record);
+
+py::array DataLogRecordGetArrayView(py::handle record, const char *dtype,
+                                    size_t itemsize, const char *what);
+
+py::tuple DataLogReaderScan(const wpi::log::DataLogReader &reader,
+                            int64_t interval);
+
+py::iterator DataLogReaderIterFrom(const wpi::log::DataLogReader &reader,
+                                   uint64_t offset);
+
+py::iterator DataLogReaderIterOffsets(const wpi::log::DataLogReader &reader,
+                                      const py::buffer &offsets);
+
+py::object DataLogReaderFromMmap(py::object source, std::string name);
+
+}; // namespace pywpiutil
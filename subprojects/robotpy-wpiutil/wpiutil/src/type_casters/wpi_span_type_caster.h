@@ -5,11 +5,20 @@
 #include <pybind11/stl.h>
 
 #include <wpi/SmallVector.h>
+#include <cstring>
 #include <span>
+#include <type_traits>
 
 namespace pybind11 {
 namespace detail {
 
+// Releases a view from PyObject_GetBuffer when it goes out of scope, since a
+// buffer_info created from it does not own it
+struct view_release {
+  Py_buffer *view;
+  ~view_release() { PyBuffer_Release(view); }
+};
+
 template <size_t N>
 struct span_name_maker {
   template <typename T>
@@ -84,6 +93,12 @@ template <typename Type> struct type_caster<std::span<Type, std::dynamic_extent>
 
   wpi::SmallVector<value_type, 32> vec;
   bool load(handle src, bool convert) {
+    if constexpr (std::is_arithmetic_v<value_type>) {
+      if (load_buffer(src)) {
+        return true;
+      }
+    }
+
     if (!isinstance<sequence>(src) || isinstance<str>(src))
       return false;
     auto s = reinterpret_borrow<sequence>(src);
@@ -98,6 +113,34 @@ template <typename Type> struct type_caster<std::span<Type, std::dynamic_extent>
     return true;
   }
 
+  // Contiguous 1-d buffers of exactly the element type (numpy arrays,
+  // array.array) are copied directly instead of converting each item.
+  // Anything else falls back to the sequence conversion.
+  bool load_buffer(handle src) {
+    if (!PyObject_CheckBuffer(src.ptr()))
+      return false;
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(src.ptr(), &view, PyBUF_ND | PyBUF_FORMAT) != 0) {
+      // not C contiguous, let the sequence conversion handle it
+      PyErr_Clear();
+      return false;
+    }
+
+    view_release release{&view};
+
+    buffer_info info(&view, false);
+    if (info.ndim != 1 || !info.item_type_is_equivalent_to<value_type>())
+      return false;
+
+    vec.resize_for_overwrite(info.size);
+    if (info.size) {
+      std::memcpy(vec.data(), info.ptr, info.size * sizeof(value_type));
+    }
+    value = span_type(std::data(vec), std::size(vec));
+    return true;
+  }
+
 public:
   template <typename T>
   static handle cast(T &&src, return_value_policy policy, handle parent) {
@@ -1,9 +1,13 @@
 
 #pragma once
 
+#include <cmath>
 #include <functional>
+#include <limits>
 #include <memory>
 #include <string_view>
+#include <utility>
+#include <vector>
 
 #include <fmt/format.h>
 #include <wpi/struct/Struct.h>
@@ -91,12 +95,23 @@ struct WPyStructConverter {
 
   virtual WPyStruct Unpack(std::span<const uint8_t> data) const = 0;
 
-  // virtual void UnpackInto(WPyStruct *pyv,
-  //                         std::span<const uint8_t> data) const = 0;
+  virtual void UnpackInto(WPyStruct *pyv,
+                          std::span<const uint8_t> data) const = 0;
+
+  // unpacks the struct at offset in data, which is the contents of view
+  virtual WPyStruct UnpackFrom(const py::memoryview &view,
+                               std::span<const uint8_t> data,
+                               size_t offset) const {
+    return Unpack(data.subspan(offset, GetSize()));
+  }
 
   virtual void ForEachNested(
       const std::function<void(std::string_view, std::string_view)> &fn)
       const = 0;
+
+  // visits the python objects held by the converter, so that the garbage
+  // collector can find cycles through the converter cache
+  virtual int Traverse(visitproc visit, void *arg) const { return 0; }
 };
 
 // static C++ converter
@@ -122,12 +137,20 @@ template <typename T> struct WPyStructCppConverter : WPyStructConverter {
     return WPyStruct{py::cast(wpi::UnpackStruct<T>(data))};
   }
 
-  // void UnpackInto(WPyStruct *pyv,
-  //                 std::span<const uint8_t> data) const override {
-  //   py::gil_scoped_acquire gil;
-  //   T *v = pyv->py.cast<T *>();
-  //   wpi::UnpackStructInto(v, data);
-  // }
+  void UnpackInto(WPyStruct *pyv,
+                  std::span<const uint8_t> data) const override {
+    py::gil_scoped_acquire gil;
+    // types with const members can't be assigned to
+    if constexpr (wpi::MutableStructSerializable<T> ||
+                  std::is_copy_assignable_v<T>) {
+      T *v = pyv->py.cast<T *>();
+      wpi::UnpackStructInto(v, data);
+    } else {
+      throw py::type_error(
+          fmt::format("{} is immutable and does not support unpackInto",
+                      pytypename(py::type::of(pyv->py))));
+    }
+  }
 
   void ForEachNested(
       const std::function<void(std::string_view, std::string_view)> &fn)
@@ -162,7 +185,8 @@ struct WPyStructPyConverter : WPyStructConverter {
     m_pack = py::reinterpret_borrow<py::function>(o.attr("pack"));
     m_packInto = py::reinterpret_borrow<py::function>(o.attr("packInto"));
     m_unpack = py::reinterpret_borrow<py::function>(o.attr("unpack"));
-    // m_unpackInto = py::reinterpret_borrow<py::function>(o.attr("unpackInto"));
+    m_unpackInto = py::getattr(o, "unpackInto", py::none());
+    m_unpackFrom = py::getattr(o, "unpackFrom", py::none());
     m_forEachNested =
         py::reinterpret_borrow<py::function>(o.attr("forEachNested"));
   }
@@ -175,9 +199,20 @@ struct WPyStructPyConverter : WPyStructConverter {
   py::function m_pack;
   py::function m_packInto;
   py::function m_unpack;
-  // py::function m_unpackInto;
+  py::object m_unpackInto; // might be none
+  py::object m_unpackFrom; // might be none
   py::function m_forEachNested; // might be none
 
+  int Traverse(visitproc visit, void *arg) const override {
+    Py_VISIT(m_pack.ptr());
+    Py_VISIT(m_packInto.ptr());
+    Py_VISIT(m_unpack.ptr());
+    Py_VISIT(m_unpackInto.ptr());
+    Py_VISIT(m_unpackFrom.ptr());
+    Py_VISIT(m_forEachNested.ptr());
+    return 0;
+  }
+
   std::string_view GetTypeString() const override { return m_typestring; }
 
   size_t GetSize() const override { return m_size; }
@@ -205,13 +240,29 @@ struct WPyStructPyConverter : WPyStructConverter {
     return WPyStruct(m_unpack(view));
   }
 
-  // void UnpackInto(WPyStruct *pyv,
-  //                 std::span<const uint8_t> data) const override {
-  //   py::gil_scoped_acquire gil;
-  //   auto view =
-  //       py::memoryview::from_memory((const void *)data.data(), data.size());
-  //   m_unpackInto(pyv->py, view);
-  // }
+  void UnpackInto(WPyStruct *pyv,
+                  std::span<const uint8_t> data) const override {
+    py::gil_scoped_acquire gil;
+    if (m_unpackInto.is_none()) {
+      throw py::type_error(fmt::format("{} does not support unpackInto",
+                                       pytypename(py::type::of(pyv->py))));
+    }
+    auto view =
+        py::memoryview::from_memory((const void *)data.data(), data.size());
+    m_unpackInto(pyv->py, view);
+  }
+
+  // passes the view of the whole buffer, so that a view doesn't need to be
+  // created for each struct
+  WPyStruct UnpackFrom(const py::memoryview &view,
+                       std::span<const uint8_t> data,
+                       size_t offset) const override {
+    if (m_unpackFrom.is_none()) {
+      return Unpack(data.subspan(offset, m_size));
+    }
+    py::gil_scoped_acquire gil;
+    return WPyStruct(m_unpackFrom(view, offset));
+  }
 
   void ForEachNested(
       const std::function<void(std::string_view, std::string_view)> &fn)
@@ -223,41 +274,582 @@ struct WPyStructPyConverter : WPyStructConverter {
   }
 };
 
-// passed as I... to the wpi::Struct methods
-struct WPyStructInfo {
-  WPyStructInfo() = default;
-  WPyStructInfo(const py::type &t) {
-    if (!py::hasattr(t, "WPIStruct")) {
-
-      throw py::type_error(
-          fmt::format("{} is not struct serializable (does not have WPIStruct)",
-                      pytypename(t)));
+inline std::shared_ptr<WPyStructConverter> WPyStructLookup(const py::type &t);
+
+// dynamic python converter that serializes the fields of a python object
+// directly, without calling into python functions. Created from the
+// StructLayout in a StructDescriptor (see make_wpistruct(native=True))
+struct WPyStructNativeConverter : WPyStructConverter {
+
+  enum class Kind {
+    Bool,
+    Int8,
+    UInt8,
+    Int16,
+    UInt16,
+    Int32,
+    UInt32,
+    Int64,
+    UInt64,
+    Float,
+    Double,
+    Struct,
+  };
+
+  struct Field {
+    py::str name;
+    Kind kind;
+    size_t offset;
+    size_t size;
+    // only set for Kind::Struct
+    py::object ntype;
+    // only set when the object is created without calling __init__
+    py::object setter;
+  };
+
+  WPyStructNativeConverter(py::object o, py::object layout) {
+    m_typestring = o.attr("typeString").cast<std::string>();
+    m_schema = o.attr("schema").cast<std::string>();
+    m_size = o.attr("size").cast<size_t>();
+    m_forEachNested =
+        py::reinterpret_borrow<py::function>(o.attr("forEachNested"));
+    m_unpackInto = !py::getattr(o, "unpackInto", py::none()).is_none();
+
+    m_cls = layout.attr("cls");
+
+    size_t offset = 0;
+    for (auto item : layout.attr("fields")) {
+      auto f = item.cast<py::tuple>();
+      auto stype = f[1].cast<std::string>();
+      py::object ntype = f[2];
+
+      // attribute lookups are faster with interned names
+      PyObject *name = f[0].cast<py::str>().release().ptr();
+      PyUnicode_InternInPlace(&name);
+
+      Field field{py::reinterpret_steal<py::str>(name), Kind::Struct, offset};
+      if (!ntype.is_none()) {
+        field.ntype = ntype;
+        field.size = WPyStructLookup(ntype)->GetSize();
+      } else {
+        std::tie(field.kind, field.size) = KindOf(stype);
+      }
+
+      offset += field.size;
+      m_fields.push_back(std::move(field));
     }
 
-    py::object s = t.attr("WPIStruct");
+    if (offset != m_size) {
+      throw py::value_error(
+          fmt::format("{}: layout is {} bytes, expected {}", m_typestring,
+                      offset, m_size));
+    }
 
-    // C++ version
-    void *c = PyCapsule_GetPointer(s.ptr(), "WPyStruct");
-    if (c != NULL) {
-      cvt = *(std::shared_ptr<WPyStructConverter> *)c;
+    // Like the python unpack function, slotted classes are created without
+    // calling __init__ (unless it needs to call __post_init__), and the
+    // slots are set directly
+    if (py::hasattr(m_cls, "__post_init__") ||
+        !m_cls.attr("__dict__").contains("__slots__")) {
       return;
     }
+    for (auto &f : m_fields) {
+      auto desc = py::getattr(m_cls, f.name, py::none());
+      if (Py_TYPE(desc.ptr()) != &PyMemberDescr_Type) {
+        for (auto &f2 : m_fields) {
+          f2.setter = py::object();
+        }
+        return;
+      }
+      f.setter = desc;
+    }
+  }
 
-    PyErr_Clear();
+  // returns the converter for a nested struct. It is looked up on each use,
+  // so that it changes when WPIStruct of the nested type is reassigned
+  std::shared_ptr<WPyStructConverter> Nested(const Field &f) const {
+    auto nested = WPyStructLookup(py::reinterpret_borrow<py::type>(f.ntype));
+    if (nested->GetSize() != f.size) {
+      throw py::value_error(fmt::format(
+          "{}: size of field '{}' changed from {} to {} bytes", m_typestring,
+          f.name.cast<std::string_view>(), f.size, nested->GetSize()));
+    }
+    return nested;
+  }
 
-    // Python version
-    try {
-      cvt = std::make_shared<WPyStructPyConverter>(s);
-    } catch (py::error_already_set &e) {
-      std::string msg = fmt::format(
-          "{} is not struct serializable (invalid WPIStruct)", pytypename(t));
-      py::raise_from(e, PyExc_TypeError, msg.c_str());
+  static std::pair<Kind, size_t> KindOf(std::string_view stype) {
+    if (stype == "bool") {
+      return {Kind::Bool, 1};
+    } else if (stype == "int8") {
+      return {Kind::Int8, 1};
+    } else if (stype == "uint8") {
+      return {Kind::UInt8, 1};
+    } else if (stype == "int16") {
+      return {Kind::Int16, 2};
+    } else if (stype == "uint16") {
+      return {Kind::UInt16, 2};
+    } else if (stype == "int32") {
+      return {Kind::Int32, 4};
+    } else if (stype == "uint32") {
+      return {Kind::UInt32, 4};
+    } else if (stype == "int64") {
+      return {Kind::Int64, 8};
+    } else if (stype == "uint64") {
+      return {Kind::UInt64, 8};
+    } else if (stype == "float") {
+      return {Kind::Float, 4};
+    } else if (stype == "double") {
+      return {Kind::Double, 8};
+    }
+    throw py::value_error(
+        fmt::format("unsupported type '{}' in struct layout", stype));
+  }
+
+  std::string m_typestring;
+  std::string m_schema;
+  size_t m_size;
+
+  py::object m_cls;
+  std::vector<Field> m_fields;
+  py::function m_forEachNested; // might be none
+  bool m_unpackInto;
+
+  int Traverse(visitproc visit, void *arg) const override {
+    Py_VISIT(m_cls.ptr());
+    Py_VISIT(m_forEachNested.ptr());
+    for (const auto &f : m_fields) {
+      Py_VISIT(f.ntype.ptr());
+      Py_VISIT(f.setter.ptr());
+    }
+    return 0;
+  }
+
+  std::string_view GetTypeString() const override { return m_typestring; }
+
+  size_t GetSize() const override { return m_size; }
+
+  std::string_view GetSchema() const override { return m_schema; }
+
+  template <typename T> static T LoadInt(PyObject *o) {
+    if constexpr (std::is_signed_v<T>) {
+      long long v = PyLong_AsLongLong(o);
+      if (v == -1 && PyErr_Occurred()) {
+        throw py::error_already_set();
+      }
+      if (v < std::numeric_limits<T>::min() ||
+          v > std::numeric_limits<T>::max()) {
+        PyErr_SetString(PyExc_OverflowError, "argument out of range");
+        throw py::error_already_set();
+      }
+      return static_cast<T>(v);
+    } else {
+      unsigned long long v = PyLong_AsUnsignedLongLong(o);
+      if (v == (unsigned long long)-1 && PyErr_Occurred()) {
+        throw py::error_already_set();
+      }
+      if (v > std::numeric_limits<T>::max()) {
+        PyErr_SetString(PyExc_OverflowError, "argument out of range");
+        throw py::error_already_set();
+      }
+      return static_cast<T>(v);
+    }
+  }
+
+  static double LoadDouble(PyObject *o) {
+    double v = PyFloat_AsDouble(o);
+    if (v == -1.0 && PyErr_Occurred()) {
+      throw py::error_already_set();
+    }
+    return v;
+  }
+
+  // same overflow behavior as struct.pack('f', ...)
+  static float LoadFloat(PyObject *o) {
+    double v = LoadDouble(o);
+    float f = static_cast<float>(v);
+    if (std::isinf(f) && !std::isinf(v)) {
+      PyErr_SetString(PyExc_OverflowError,
+                      "float too large to pack with f format");
       throw py::error_already_set();
     }
+    return f;
   }
 
+  void PackField(std::span<uint8_t> data, const Field &f, PyObject *o) const {
+    switch (f.kind) {
+    case Kind::Bool: {
+      int v = PyObject_IsTrue(o);
+      if (v == -1) {
+        throw py::error_already_set();
+      }
+      data[0] = v;
+      break;
+    }
+    case Kind::Int8:
+      // wpi::Struct<int8_t> only accepts a fixed extent span
+      data[0] = static_cast<uint8_t>(LoadInt<int8_t>(o));
+      break;
+    case Kind::UInt8:
+      wpi::PackStruct(data, LoadInt<uint8_t>(o));
+      break;
+    case Kind::Int16:
+      wpi::PackStruct(data, LoadInt<int16_t>(o));
+      break;
+    case Kind::UInt16:
+      wpi::PackStruct(data, LoadInt<uint16_t>(o));
+      break;
+    case Kind::Int32:
+      wpi::PackStruct(data, LoadInt<int32_t>(o));
+      break;
+    case Kind::UInt32:
+      wpi::PackStruct(data, LoadInt<uint32_t>(o));
+      break;
+    case Kind::Int64:
+      wpi::PackStruct(data, LoadInt<int64_t>(o));
+      break;
+    case Kind::UInt64:
+      wpi::PackStruct(data, LoadInt<uint64_t>(o));
+      break;
+    case Kind::Float:
+      wpi::PackStruct(data, LoadFloat(o));
+      break;
+    case Kind::Double:
+      wpi::PackStruct(data, LoadDouble(o));
+      break;
+    case Kind::Struct:
+      Nested(f)->Pack(data, WPyStruct(py::reinterpret_borrow<py::object>(o)));
+      break;
+    }
+  }
+
+  // returns a new reference, or nullptr if an error is set
+  PyObject *UnpackField(std::span<const uint8_t> data, const Field &f) const {
+    switch (f.kind) {
+    case Kind::Bool:
+      return PyBool_FromLong(data[0] != 0);
+    case Kind::Int8:
+      return PyLong_FromLong(static_cast<int8_t>(data[0]));
+    case Kind::UInt8:
+      return PyLong_FromLong(data[0]);
+    case Kind::Int16:
+      return PyLong_FromLong(wpi::UnpackStruct<int16_t>(data));
+    case Kind::UInt16:
+      return PyLong_FromLong(wpi::UnpackStruct<uint16_t>(data));
+    case Kind::Int32:
+      return PyLong_FromLong(wpi::UnpackStruct<int32_t>(data));
+    case Kind::UInt32:
+      return PyLong_FromUnsignedLong(wpi::UnpackStruct<uint32_t>(data));
+    case Kind::Int64:
+      return PyLong_FromLongLong(wpi::UnpackStruct<int64_t>(data));
+    case Kind::UInt64:
+      return PyLong_FromUnsignedLongLong(wpi::UnpackStruct<uint64_t>(data));
+    case Kind::Float:
+      return PyFloat_FromDouble(wpi::UnpackStruct<float>(data));
+    case Kind::Double:
+      return PyFloat_FromDouble(wpi::UnpackStruct<double>(data));
+    case Kind::Struct:
+      return Nested(f)->Unpack(data).py.release().ptr();
+    }
+    Py_RETURN_NONE;
+  }
+
+  void Pack(std::span<uint8_t> data, const WPyStruct &value) const override {
+    py::gil_scoped_acquire gil;
+    for (const auto &f : m_fields) {
+      try {
+        auto o = py::reinterpret_steal<py::object>(
+            PyObject_GetAttr(value.py.ptr(), f.name.ptr()));
+        if (!o) {
+          throw py::error_already_set();
+        }
+        PackField(data.subspan(f.offset, f.size), f, o.ptr());
+      } catch (py::error_already_set &e) {
+        std::string msg =
+            fmt::format("{}: error packing data (field '{}')", m_typestring,
+                        f.name.cast<std::string_view>());
+        py::raise_from(e, PyExc_ValueError, msg.c_str());
+        throw py::error_already_set();
+      }
+    }
+  }
+
+  WPyStruct Unpack(std::span<const uint8_t> data) const override {
+    py::gil_scoped_acquire gil;
+    if (!m_fields.empty() && m_fields[0].setter) {
+      return UnpackSlots(data);
+    }
+
+    py::tuple args(m_fields.size());
+    size_t i = 0;
+    for (const auto &f : m_fields) {
+      auto *o = UnpackField(data.subspan(f.offset, f.size), f);
+      if (o == nullptr) {
+        throw py::error_already_set();
+      }
+      PyTuple_SET_ITEM(args.ptr(), i++, o);
+    }
+
+    auto *v = PyObject_Call(m_cls.ptr(), args.ptr(), nullptr);
+    if (v == nullptr) {
+      throw py::error_already_set();
+    }
+    return WPyStruct(py::reinterpret_steal<py::object>(v));
+  }
+
+  WPyStruct UnpackSlots(std::span<const uint8_t> data) const {
+    // same as object.__new__(cls)
+    auto v = py::reinterpret_steal<py::object>(PyBaseObject_Type.tp_new(
+        (PyTypeObject *)m_cls.ptr(), py::tuple().ptr(), nullptr));
+    if (!v) {
+      throw py::error_already_set();
+    }
+
+    for (const auto &f : m_fields) {
+      auto o = py::reinterpret_steal<py::object>(
+          UnpackField(data.subspan(f.offset, f.size), f));
+      if (!o || Py_TYPE(f.setter.ptr())->tp_descr_set(f.setter.ptr(), v.ptr(),
+                                                      o.ptr()) != 0) {
+        throw py::error_already_set();
+      }
+    }
+    return WPyStruct(std::move(v));
+  }
+
+  void UnpackInto(WPyStruct *pyv,
+                  std::span<const uint8_t> data) const override {
+    py::gil_scoped_acquire gil;
+    if (!m_unpackInto) {
+      throw py::type_error(fmt::format("{} does not support unpackInto",
+                                       pytypename(py::type::of(pyv->py))));
+    }
+
+    for (const auto &f : m_fields) {
+      auto fdata = data.subspan(f.offset, f.size);
+      if (f.kind == Kind::Struct) {
+        // nested structs are updated in place
+        WPyStruct nested(pyv->py.attr(f.name));
+        Nested(f)->UnpackInto(&nested, fdata);
+      } else {
+        auto o = py::reinterpret_steal<py::object>(UnpackField(fdata, f));
+        if (!o || PyObject_SetAttr(pyv->py.ptr(), f.name.ptr(), o.ptr()) != 0) {
+          throw py::error_already_set();
+        }
+      }
+    }
+  }
+
+  void ForEachNested(
+      const std::function<void(std::string_view, std::string_view)> &fn)
+      const override {
+    py::gil_scoped_acquire gil;
+    if (!m_forEachNested.is_none()) {
+      m_forEachNested(fn);
+    }
+  }
+};
+
+//
+// Converter cache
+//
+
+// Resolving a converter for a type requires a few attribute lookups and,
+// for python types, constructing a new converter (which reads each field of
+// the StructDescriptor), which is expensive relative to the serialization
+// itself. The resolved converter is stored on the type in a cache object, so
+// it lives exactly as long as the type does, and it is replaced when the
+// WPIStruct attribute of the type is reassigned.
+//
+// The converter refers back to the type (via its functions or the class
+// that it creates), so the cache object participates in garbage collection:
+// the type and its cache object can be collected once the converter is not
+// in use anywhere else. A side table keyed by a weak reference to the type
+// can't do this: the table would hold the converter, and so the type, alive.
+//
+// The cache object is stored in the __dict__ of the type under a dunder
+// name, like copyreg does with __slotnames__. It is visible in vars() of the
+// type and in dir() of the type and its instances, but it is not a field
+// and does not affect the dataclass functions. Each extension module that
+// includes this header stores its converters under its own name (and cache
+// object type), because the header is compiled into each module. Only
+// accessed while the GIL is held.
+#define WPYSTRUCT_CACHE_ATTR                                                   \
+  "__wpystruct_cache_" PYBIND11_TOSTRING(RPYBUILD_MODULE_NAME) "__"
+
+struct WPyStructCacheObject {
+  PyObject_HEAD
+  // WPIStruct attribute that the converter was created from, held here so
+  // that the identity check in WPyStructLookup can't be fooled by a new
+  // object being allocated at the same address
+  PyObject *attr;
+  std::shared_ptr<WPyStructConverter> *cvt;
+};
+
+inline int WPyStructCacheTraverse(PyObject *self, visitproc visit,
+                                  void *arg) {
+  auto *o = (WPyStructCacheObject *)self;
+  Py_VISIT(Py_TYPE(self));
+  Py_VISIT(o->attr);
+  // a converter that is in use elsewhere keeps the type alive
+  if (o->cvt != nullptr && o->cvt->use_count() == 1) {
+    return (*o->cvt)->Traverse(visit, arg);
+  }
+  return 0;
+}
+
+inline int WPyStructCacheClear(PyObject *self) {
+  auto *o = (WPyStructCacheObject *)self;
+  Py_CLEAR(o->attr);
+  delete std::exchange(o->cvt, nullptr);
+  return 0;
+}
+
+inline void WPyStructCacheDealloc(PyObject *self) {
+  PyTypeObject *tp = Py_TYPE(self);
+  PyObject_GC_UnTrack(self);
+  WPyStructCacheClear(self);
+  tp->tp_free(self);
+  Py_DECREF(tp);
+}
+
+inline PyTypeObject *WPyStructCacheType() {
+  // intentionally leaked, it is used until the interpreter is finalized
+  static PyTypeObject *type = [] {
+    static PyType_Slot slots[] = {
+        {Py_tp_traverse, (void *)WPyStructCacheTraverse},
+        {Py_tp_clear, (void *)WPyStructCacheClear},
+        {Py_tp_dealloc, (void *)WPyStructCacheDealloc},
+        {0, nullptr},
+    };
+    static PyType_Spec spec = {
+        "wpiutil._WPyStructCache",
+        sizeof(WPyStructCacheObject),
+        0,
+        Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+        slots,
+    };
+    auto *t = (PyTypeObject *)PyType_FromSpec(&spec);
+    if (t == nullptr) {
+      throw py::error_already_set();
+    }
+    return t;
+  }();
+  return type;
+}
+
+inline std::shared_ptr<WPyStructConverter>
+WPyStructResolve(const py::type &t) {
+  if (!py::hasattr(t, "WPIStruct")) {
+
+    throw py::type_error(
+        fmt::format("{} is not struct serializable (does not have WPIStruct)",
+                    pytypename(t)));
+  }
+
+  py::object s = t.attr("WPIStruct");
+
+  // C++ version
+  void *c = PyCapsule_GetPointer(s.ptr(), "WPyStruct");
+  if (c != NULL) {
+    return *(std::shared_ptr<WPyStructConverter> *)c;
+  }
+
+  PyErr_Clear();
+
+  // Python version
+  try {
+    py::object layout = py::getattr(s, "layout", py::none());
+    if (!layout.is_none()) {
+      return std::make_shared<WPyStructNativeConverter>(s, layout);
+    }
+    return std::make_shared<WPyStructPyConverter>(s);
+  } catch (py::error_already_set &e) {
+    std::string msg = fmt::format(
+        "{} is not struct serializable (invalid WPIStruct)", pytypename(t));
+    py::raise_from(e, PyExc_TypeError, msg.c_str());
+    throw py::error_already_set();
+  }
+}
+
+inline std::shared_ptr<WPyStructConverter> WPyStructLookup(const py::type &t) {
+  py::gil_scoped_acquire gil;
+
+  static PyObject *attrname = PyUnicode_InternFromString("WPIStruct");
+  static PyObject *cachename =
+      PyUnicode_InternFromString(WPYSTRUCT_CACHE_ATTR);
+
+  // Search the dicts of the MRO without invoking descriptors, so this is
+  // just a couple of dict lookups. For C++ types this finds the static
+  // property that holds the capsule, for python types it is the
+  // StructDescriptor itself
+  auto *tp = (PyTypeObject *)t.ptr();
+  PyObject *found = nullptr;
+  PyObject *mro = tp->tp_mro;
+  Py_ssize_t n = mro != nullptr ? PyTuple_GET_SIZE(mro) : 0;
+  for (Py_ssize_t i = 0; i < n && found == nullptr; i++) {
+    auto *base = (PyTypeObject *)PyTuple_GET_ITEM(mro, i);
+    found = PyDict_GetItemWithError(base->tp_dict, attrname);
+    if (found == nullptr && PyErr_Occurred()) {
+      break;
+    }
+  }
+  if (found == nullptr) {
+    PyErr_Clear();
+    // raises the appropriate error
+    return WPyStructResolve(t);
+  }
+
+  if (PyCapsule_IsValid(found, "WPyStruct")) {
+    return *(std::shared_ptr<WPyStructConverter> *)PyCapsule_GetPointer(
+        found, "WPyStruct");
+  }
+
+  // the cache object is only looked up on the type itself; a subclass
+  // gets its own
+  auto *cacheType = WPyStructCacheType();
+  PyObject *cached = PyDict_GetItemWithError(tp->tp_dict, cachename);
+  if (cached == nullptr) {
+    PyErr_Clear();
+  } else if (Py_TYPE(cached) == cacheType) {
+    auto *o = (WPyStructCacheObject *)cached;
+    if (o->attr == found && o->cvt != nullptr) {
+      return *o->cvt;
+    }
+  }
+
+  auto attr = py::reinterpret_borrow<py::object>(found);
+
+  // resolving may run arbitrary python code, which may replace the
+  // attribute; the reference above keeps it alive for the identity check
+  auto cvt = WPyStructResolve(t);
+
+  auto obj =
+      py::reinterpret_steal<py::object>(cacheType->tp_alloc(cacheType, 0));
+  if (!obj) {
+    throw py::error_already_set();
+  }
+  auto *o = (WPyStructCacheObject *)obj.ptr();
+  o->attr = attr.release().ptr();
+  o->cvt = new std::shared_ptr<WPyStructConverter>(cvt);
+
+  if (PyObject_SetAttr(t.ptr(), cachename, obj.ptr()) != 0) {
+    // types that don't allow attributes to be set just aren't cached
+    PyErr_Clear();
+  }
+
+  return cvt;
+}
+
+// passed as I... to the wpi::Struct methods
+struct WPyStructInfo {
+  WPyStructInfo() = default;
+  WPyStructInfo(const py::type &t) : cvt(WPyStructLookup(t)) {}
+
   WPyStructInfo(const WPyStruct &v) : WPyStructInfo(py::type::of(v.py)) {}
 
+  // Moves are copies: the StructLogEntry constructors move the info into
+  // the entry and then use it again to add the schema and start the entry
+  WPyStructInfo(const WPyStructInfo &) = default;
+  WPyStructInfo &operator=(const WPyStructInfo &) = default;
+
   const WPyStructConverter* operator->() const {
     const auto *c = cvt.get();
     if (c == nullptr) {
@@ -292,10 +884,10 @@ template <> struct wpi::Struct<WPyStruct, WPyStructInfo> {
     return info->Unpack(data);
   }
 
-  // static void UnpackInto(WPyStruct *v, std::span<const uint8_t> data,
-  //                        const WPyStructInfo &info) {
-  //   info->UnpackInto(v, data);
-  // }
+  static void UnpackInto(WPyStruct *v, std::span<const uint8_t> data,
+                         const WPyStructInfo &info) {
+    info->UnpackInto(v, data);
+  }
 
   static void Pack(std::span<uint8_t> data, const WPyStruct &value,
                    const WPyStructInfo &info) {
@@ -312,5 +904,5 @@ template <> struct wpi::Struct<WPyStruct, WPyStructInfo> {
 static_assert(wpi::StructSerializable<WPyStruct, WPyStructInfo>);
 static_assert(wpi::HasNestedStruct<WPyStruct, WPyStructInfo>);
 
-// This breaks on readonly structs, so we disable for now
-// static_assert(wpi::MutableStructSerializable<WPyStruct, WPyStructInfo>);
+// readonly C++ structs raise an exception from UnpackInto instead
+static_assert(wpi::MutableStructSerializable<WPyStruct, WPyStructInfo>);
@@ -1,5 +1,41 @@
 
-#include "wpystruct.h"
+#include "wpystruct_fns.h"
+
+// validates that a buffer is a contiguous array of bytes
+static void checkByteBuffer(const py::buffer_info &req) {
+  if (req.itemsize != 1) {
+    throw py::value_error("buffer must only contain bytes");
+  } else if (req.ndim != 1) {
+    throw py::value_error("buffer must only have a single dimension");
+  } else if (req.size > 1 && req.strides[0] != 1) {
+    throw py::value_error("buffer must be contiguous");
+  }
+}
+
+// retrieves the converter for every object in the sequence, which must all
+// be the same type
+static WPyStructInfo getSequenceInfo(const py::sequence &v) {
+  py::handle t = py::type::handle_of(v[0]);
+  for (auto item : v) {
+    if (py::type::handle_of(item).ptr() != t.ptr()) {
+      throw py::type_error(fmt::format(
+          "all objects must be the same type (expected {}, got {})",
+          pytypename(py::reinterpret_borrow<py::type>(t)),
+          pytypename(py::type::of(item))));
+    }
+  }
+
+  return WPyStructInfo(py::reinterpret_borrow<py::type>(t));
+}
+
+// packs the first n objects consecutively into the span, which must be
+// large enough to hold them
+static void packSequence(std::span<uint8_t> s, const py::sequence &v,
+                         size_t n, const WPyStructInfo &info, size_t sz) {
+  for (size_t i = 0; i < n; i++) {
+    wpi::PackStruct(s.subspan(i * sz, sz), WPyStruct(py::object(v[i])), info);
+  }
+}
 
 void forEachNested(
     const py::type &t,
@@ -50,11 +86,7 @@ void packInto(const WPyStruct &v, py::buffer &b) {
   py::ssize_t sz = wpi::GetStructSize<WPyStruct>(info);
 
   auto req = b.request();
-  if (req.itemsize != 1) {
-    throw py::value_error("buffer must only contain bytes");
-  } else if (req.ndim != 1) {
-    throw py::value_error("buffer must only have a single dimension");
-  }
+  checkByteBuffer(req);
 
   if (req.size != sz) {
     throw py::value_error("buffer must be " + std::to_string(sz) + " bytes");
@@ -69,11 +101,7 @@ WPyStruct unpack(const py::type &t, const py::buffer &b) {
   py::ssize_t sz = wpi::GetStructSize<WPyStruct>(info);
 
   auto req = b.request();
-  if (req.itemsize != 1) {
-    throw py::value_error("buffer must only contain bytes");
-  } else if (req.ndim != 1) {
-    throw py::value_error("buffer must only have a single dimension");
-  }
+  checkByteBuffer(req);
 
   if (req.size != sz) {
     throw py::value_error("buffer must be " + std::to_string(sz) + " bytes");
@@ -83,21 +111,129 @@ WPyStruct unpack(const py::type &t, const py::buffer &b) {
   return wpi::UnpackStruct<WPyStruct, WPyStructInfo>(s, info);
 }
 
-// void unpackInto(const py::buffer &b, WPyStruct *v) {
-//   WPyStructInfo info(*v);
-//   py::ssize_t sz = wpi::GetStructSize<WPyStruct>(info);
+py::bytes packArray(const py::sequence &v) {
+  auto n = v.size();
+  if (n == 0) {
+    return py::bytes();
+  }
+
+  auto info = getSequenceInfo(v);
+  auto sz = wpi::GetStructSize<WPyStruct>(info);
+
+  PyObject *b = PyBytes_FromStringAndSize(NULL, sz * n);
+  if (b == NULL) {
+    throw py::error_already_set();
+  }
+
+  auto result = py::reinterpret_steal<py::bytes>(b);
+  auto s = std::span((uint8_t *)PyBytes_AS_STRING(b), sz * n);
+  packSequence(s, v, n, info, sz);
+
+  return result;
+}
+
+size_t packArrayInto(const py::sequence &v, py::buffer &b, size_t offset) {
+  auto req = b.request(true);
+  checkByteBuffer(req);
+
+  auto n = v.size();
+  if (n == 0) {
+    return 0;
+  }
+
+  auto info = getSequenceInfo(v);
+  size_t sz = wpi::GetStructSize<WPyStruct>(info);
+  size_t total = sz * n;
+
+  if (offset > (size_t)req.size || (size_t)req.size - offset < total) {
+    throw py::value_error(fmt::format(
+        "buffer is too small ({} bytes needed at offset {}, buffer is {} bytes)",
+        total, offset, req.size));
+  }
+
+  auto s = std::span((uint8_t *)req.ptr + offset, total);
+  packSequence(s, v, n, info, sz);
+  return total;
+}
+
+py::list unpackArray(const py::type &t, const py::buffer &b) {
+  WPyStructInfo info(t);
+  py::ssize_t sz = wpi::GetStructSize<WPyStruct>(info);
+
+  auto req = b.request();
+  checkByteBuffer(req);
+
+  if (sz == 0 || req.size % sz != 0) {
+    throw py::value_error("buffer size must be a multiple of " +
+                          std::to_string(sz) + " bytes");
+  }
+
+  auto n = req.size / sz;
+  auto data = std::span((const uint8_t *)req.ptr, req.size);
+  py::memoryview view(b);
+
+  py::list l(n);
+  for (py::ssize_t i = 0; i < n; i++) {
+    auto v = info->UnpackFrom(view, data, i * sz);
+    PyList_SET_ITEM(l.ptr(), i, v.py.release().ptr());
+  }
+
+  return l;
+}
+
+void unpackInto(WPyStruct &v, const py::buffer &b) {
+  WPyStructInfo info(v);
+  py::ssize_t sz = wpi::GetStructSize<WPyStruct>(info);
+
+  auto req = b.request();
+  checkByteBuffer(req);
+
+  if (req.size != sz) {
+    throw py::value_error("buffer must be " + std::to_string(sz) + " bytes");
+  }
+
+  auto s = std::span((const uint8_t *)req.ptr, req.size);
+  wpi::UnpackStructInto<WPyStruct, WPyStructInfo>(&v, s, info);
+}
+
+Unpacker::Unpacker(const py::type &t, const py::buffer &b)
+    : m_type(t), m_info(t), m_view(b) {
+  m_structSize = wpi::GetStructSize<WPyStruct>(m_info);
+
+  m_req = b.request();
+  checkByteBuffer(m_req);
+
+  py::ssize_t sz = m_structSize;
+  if (sz == 0 || m_req.size % sz != 0) {
+    throw py::value_error("buffer size must be a multiple of " +
+                          std::to_string(sz) + " bytes");
+  }
+
+  m_count = m_req.size / sz;
+}
+
+size_t Unpacker::offset(py::ssize_t i) const {
+  if (i < 0) {
+    i += m_count;
+  }
+  if (i < 0 || i >= m_count) {
+    throw py::index_error("Unpacker index out of range");
+  }
+
+  return i * m_structSize;
+}
 
-//   auto req = b.request();
-//   if (req.itemsize != 1) {
-//     throw py::value_error("buffer must only contain bytes");
-//   } else if (req.ndim != 1) {
-//     throw py::value_error("buffer must only have a single dimension");
-//   }
+WPyStruct Unpacker::get(py::ssize_t i) const {
+  auto data = std::span((const uint8_t *)m_req.ptr, m_req.size);
+  return m_info->UnpackFrom(m_view, data, offset(i));
+}
 
-//   if (req.size != sz) {
-//     throw py::value_error("buffer must be " + std::to_string(sz) + " bytes");
-//   }
+void Unpacker::unpackInto(py::ssize_t i, WPyStruct &v) const {
+  if (!py::type::handle_of(v.py).is(m_type)) {
+    throw py::type_error(fmt::format("expected {}, got {}", pytypename(m_type),
+                                     pytypename(py::type::of(v.py))));
+  }
 
-//   auto s = std::span((const uint8_t *)req.ptr, req.size);
-//   wpi::UnpackStructInto<WPyStruct, WPyStructInfo>(v, s, info);
-// }
+  auto data = std::span((const uint8_t *)m_req.ptr + offset(i), m_structSize);
+  wpi::UnpackStructInto<WPyStruct, WPyStructInfo>(&v, data, m_info);
+}
@@ -41,8 +41,72 @@ void packInto(const WPyStruct &v, py::buffer &b);
 */
 WPyStruct unpack(const py::type &t, const py::buffer &b);
 
-// /**
-//     Convert byte buffer into passed in object. Buffer must be exact
-//     size.
-// */
-// void unpackInto(const py::buffer &b, WPyStruct *v);
+/**
+    Serialize a sequence of objects of the same type into a single byte buffer
+    containing each packed object in order
+*/
+py::bytes packArray(const py::sequence &v);
+
+/**
+    Serialize a sequence of objects of the same type into a buffer, starting
+    at the specified byte offset. Returns the number of bytes written.
+*/
+size_t packArrayInto(const py::sequence &v, py::buffer &b, size_t offset = 0);
+
+/**
+    Convert byte buffer into a list of objects of the specified type. Buffer
+    size must be a multiple of the struct size.
+*/
+py::list unpackArray(const py::type &t, const py::buffer &b);
+
+/**
+    Convert byte buffer into passed in object. Buffer must be exact
+    size.
+*/
+void unpackInto(WPyStruct &v, const py::buffer &b);
+
+/**
+    Decodes structs of a single type that are packed consecutively in a
+    buffer, such as the contents of a struct array. The buffer is validated
+    once, and record i is decoded from offset i * size when it is indexed.
+
+    The buffer is kept alive (and cannot be resized) while the Unpacker
+    exists.
+
+    Each index costs a method call, so use :func:`unpackArray` instead
+    when all of the structs are needed.
+*/
+class Unpacker {
+public:
+  /**
+      :param t: Type of struct stored in the buffer
+      :param b: Buffer size must be a multiple of the struct size
+  */
+  Unpacker(const py::type &t, const py::buffer &b);
+
+  /**
+      Returns the number of structs in the buffer
+  */
+  py::ssize_t size() const { return m_count; }
+
+  /**
+      Returns the struct at the specified index. Negative indices count
+      from the end of the buffer.
+  */
+  WPyStruct get(py::ssize_t i) const;
+
+  /**
+      Decodes the struct at the specified index into the passed in object
+  */
+  void unpackInto(py::ssize_t i, WPyStruct &v) const;
+
+private:
+  size_t offset(py::ssize_t i) const;
+
+  py::type m_type;
+  WPyStructInfo m_info;
+  py::memoryview m_view;
+  py::buffer_info m_req;
+  size_t m_structSize;
+  py::ssize_t m_count;
+};
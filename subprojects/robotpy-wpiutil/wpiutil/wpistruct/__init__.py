@@ -5,29 +5,42 @@ mechanism to implement your own custom structs using Python (see :func:`wpiutil.
 
 # autogenerated by 'robotpy-build create-imports wpiutil.wpistruct wpiutil._wpiutil.wpistruct'
 from .._wpiutil.wpistruct import (
+    Unpacker,
     forEachNested,
     getSchema,
     getSize,
     getTypeString,
     pack,
+    packArray,
+    packArrayInto,
     packInto,
     unpack,
+    unpackArray,
+    unpackInto,
 )
 
 __all__ = [
+    "Unpacker",
     "forEachNested",
     "getSchema",
     "getSize",
     "getTypeString",
     "pack",
+    "packArray",
+    "packArrayInto",
     "packInto",
     "unpack",
+    "unpackArray",
+    "unpackInto",
 ]
 
-from .desc import StructDescriptor
+from .desc import StructDescriptor, StructLayout
+from .dtype import getDtype
+from .dynamic import StructDecoder, StructRegistry
 
 from .dataclass import (
     make_wpistruct,
+    bitfield,
     int8,
     uint8,
     int16,
@@ -41,7 +54,12 @@ from .dataclass import (
 
 __all__ += [
     "StructDescriptor",
+    "StructLayout",
+    "getDtype",
+    "StructDecoder",
+    "StructRegistry",
     "make_wpistruct",
+    "bitfield",
     "int8",
     "uint8",
     "int16",
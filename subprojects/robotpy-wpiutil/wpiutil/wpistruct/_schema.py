@@ -0,0 +1,220 @@
+#
+# Parser for the schema strings used by WPILib structs
+#
+# The schema is a list of declarations separated by semicolons. Each
+# declaration is a type followed by a name, optionally followed by an
+# array size ([N]) or a bit-field width (: N). Integer declarations may be
+# prefixed with an enum specification (enum {a=1, b=2}).
+#
+
+import re
+import typing
+
+#: builtin type name: (struct format character, size in bytes)
+builtin_types = {
+    "bool": ("?", 1),
+    "char": ("c", 1),
+    "int8": ("b", 1),
+    "int16": ("h", 2),
+    "int32": ("i", 4),
+    "int64": ("q", 8),
+    "uint8": ("B", 1),
+    "uint16": ("H", 2),
+    "uint32": ("I", 4),
+    "uint64": ("Q", 8),
+    "float": ("f", 4),
+    "float32": ("f", 4),
+    "double": ("d", 8),
+    "float64": ("d", 8),
+}
+
+integer_types = {
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+}
+
+
+class SchemaField(typing.NamedTuple):
+    #: Name of the field
+    name: str
+
+    #: Name of the type; either a builtin type or the name of a struct
+    type: str
+
+    #: Number of elements if this is an array, otherwise None
+    arraySize: typing.Optional[int]
+
+    #: Width in bits if this is a bit-field, otherwise None
+    bitWidth: typing.Optional[int]
+
+    #: Enum values if this has an enum specification, otherwise None
+    enum: typing.Optional[typing.Dict[str, int]]
+
+    @property
+    def isBuiltin(self) -> bool:
+        return self.type in builtin_types
+
+
+_decl_re = re.compile(
+    r"""
+    ^
+    (?:enum\s*\{(?P<enum>[^}]*)\}\s*)?
+    (?P<type>[A-Za-z_]\w*)\s+
+    (?P<name>[A-Za-z_]\w*)\s*
+    (?:
+        \[\s*(?P<arraySize>\d+)\s*\]
+        |
+        :\s*(?P<bitWidth>\d+)
+    )?
+    $
+    """,
+    re.VERBOSE,
+)
+
+_enum_re = re.compile(r"^([A-Za-z_]\w*)\s*=\s*(-?\d+)$")
+
+
+def parseSchema(schema: str) -> typing.List[SchemaField]:
+    """
+    Parses a struct schema string into a list of fields. Raises
+    ValueError if the schema is invalid.
+    """
+    fields = []
+    names = set()
+
+    for decl in schema.split(";"):
+        decl = decl.strip()
+        if not decl:
+            continue
+
+        m = _decl_re.match(decl)
+        if m is None:
+            raise ValueError(f"invalid declaration '{decl}'")
+
+        name = m.group("name")
+        typ = m.group("type")
+
+        if name in names:
+            raise ValueError(f"duplicate field name '{name}'")
+        names.add(name)
+
+        arraySize = m.group("arraySize")
+        if arraySize is not None:
+            arraySize = int(arraySize)
+            if arraySize == 0:
+                raise ValueError(f"{name}: array size must be at least 1")
+
+        bitWidth = m.group("bitWidth")
+        if bitWidth is not None:
+            bitWidth = int(bitWidth)
+            if typ == "bool":
+                if bitWidth != 1:
+                    raise ValueError(f"{name}: bool bit-field width must be 1")
+            elif typ in integer_types:
+                maxWidth = builtin_types[typ][1] * 8
+                if bitWidth < 1 or bitWidth > maxWidth:
+                    raise ValueError(
+                        f"{name}: bit-field width must be between 1 and {maxWidth}"
+                    )
+            else:
+                raise ValueError(f"{name}: bit-fields must be bool or integer types")
+
+        enum = m.group("enum")
+        if enum is not None:
+            if typ not in integer_types:
+                raise ValueError(f"{name}: enums must be integer types")
+
+            values = {}
+            for item in enum.split(","):
+                item = item.strip()
+                if not item:
+                    continue
+                em = _enum_re.match(item)
+                if em is None:
+                    raise ValueError(f"{name}: invalid enum value '{item}'")
+                values[em.group(1)] = int(em.group(2))
+            enum = values
+
+        fields.append(SchemaField(name, typ, arraySize, bitWidth, enum))
+
+    return fields
+
+
+def structName(typeString: str) -> str:
+    """Returns the struct name from a type string such as 'struct:Name'"""
+    prefix, sep, name = typeString.partition(":")
+    if not sep or prefix != "struct":
+        raise ValueError(f"'{typeString}' is not a struct type string")
+    return name.strip()
+
+
+#
+# Bit-fields
+#
+
+#: size in bytes: struct format character of the unsigned storage for
+#: bit-fields of that size
+unsigned_fmts = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+def signExtend(v: int, bits: int) -> int:
+    """Sign extends the low bits of v"""
+    sign = 1 << (bits - 1)
+    return (v ^ sign) - sign
+
+
+class BitFieldAllocator:
+    """
+    Assigns consecutive bit-fields to storage units the same way that
+    WPILib does. A bit-field continues the current storage unit if the unit
+    has the same size and enough bits left, otherwise it starts a new one.
+    Bools share the storage of a preceding bit-field if they fit.
+    """
+
+    def __init__(self):
+        # size in bytes of the current storage unit, 0 if there is none
+        self._size = 0
+        self._used = 0
+
+    def reset(self) -> None:
+        """Ends the current storage unit; called for each regular field"""
+        self._size = 0
+
+    def add(self, type: str, width: int) -> typing.Tuple[int, int, bool]:
+        """
+        Allocates a bit-field of the specified builtin type and width.
+        Returns the size in bytes of its storage unit, the shift of the
+        bit-field within the unit, and whether a new unit was started.
+        """
+        if type == "bool" and self._size and self._used < self._size * 8:
+            size = self._size
+        else:
+            size = builtin_types[type][1]
+
+        isNew = size != self._size or self._used + width > size * 8
+        if isNew:
+            self._size = size
+            self._used = 0
+
+        shift = self._used
+        self._used += width
+        return size, shift, isNew
+
+
+def bitFieldExpr(type: str, raw: str, width: int) -> str:
+    """
+    Returns an expression that converts raw (an expression for the unsigned
+    bits of a bit-field) to its value. Signed values are sign extended by
+    calling _sx, which must be :func:`signExtend`.
+    """
+    if type == "bool":
+        return f"({raw} != 0)"
+    elif type.startswith("int"):
+        return f"_sx({raw}, {width})"
+    return raw
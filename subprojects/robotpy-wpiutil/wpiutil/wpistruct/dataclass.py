@@ -1,10 +1,20 @@
 import dataclasses
+import enum
 import inspect
 import struct
+import sys
+import types
 import typing
 
 
-from .desc import StructDescriptor
+from ._schema import (
+    BitFieldAllocator,
+    bitFieldExpr,
+    builtin_types,
+    signExtend,
+    unsigned_fmts,
+)
+from .desc import StructDescriptor, StructLayout
 from .._wpiutil import wpistruct
 
 #
@@ -39,7 +49,27 @@ else:
 # fmt: on
 
 
-def make_wpistruct(cls=None, /, *, name: typing.Optional[str] = None):
+class bitfield(typing.NamedTuple):
+    """
+    Use with ``typing.Annotated`` to store a bool or integer field in the
+    specified number of bits. Adjacent bit-fields share storage::
+
+        a: Annotated[bool, wpistruct.bitfield(1)]
+        b: Annotated[wpistruct.uint8, wpistruct.bitfield(3)]
+    """
+
+    width: int
+
+
+def make_wpistruct(
+    cls=None,
+    /,
+    *,
+    name: typing.Optional[str] = None,
+    native: bool = False,
+    slots: bool = False,
+    frozen: bool = False,
+):
     """
     This decorator allows you to easily define a custom type that can be
     used with wpilib's custom serialization protocol (for use in datalog
@@ -60,10 +90,38 @@ def make_wpistruct(cls=None, /, *, name: typing.Optional[str] = None):
     (either builtin or user defined); one of int, bool, or float; or you can
     use one of the ``wpiutil.wpistruct.[u]int*`` values for explicitly sized
     integer types.
+
+    The following are also supported using ``typing.Annotated`` (requires
+    Python 3.9+):
+
+    * Fixed size arrays of any of the above types, stored as a list:
+      ``Annotated[list[float], 4]``
+    * Bit-fields of bool or integer types: ``Annotated[bool, bitfield(1)]``
+      (see :class:`bitfield`)
+    * ``enum.IntEnum`` fields are stored as int32 by default; the size can be
+      changed with ``Annotated[MyEnum, wpiutil.wpistruct.uint8]``
+
+    If ``native`` is True, the fields of the dataclass are read and written
+    directly by the C++ serialization code instead of going through the
+    generated python functions. This is about a quarter faster for flat
+    structs, and about twice as fast for nested structs and for unpacking
+    slotted classes. The python functions are still generated and remain
+    available on ``WPIStruct``.
+    Structs that contain arrays, enums or bit-fields are always serialized
+    using the python functions.
+
+    If the class is not already a dataclass, it is converted into one. Pass
+    ``slots=True`` (Python 3.10+) and/or ``frozen=True`` to create a
+    dataclass with those options; slotted instances use considerably less
+    memory, which matters when decoding large logs. Slotted instances are
+    created without calling ``__init__`` when unpacking (unless the class
+    defines ``__post_init__``), which is faster. Frozen classes do not
+    support ``unpackInto``.
     """
 
     def wrap(cls):
-        return _process_class(cls, name)
+        cls = _make_dataclass(cls, slots, frozen)
+        return _process_class(cls, name, native)
 
     if cls is None:
         return wrap
@@ -90,9 +148,37 @@ _type_to_fmt = {
     double: ("d", "double"),
 }
 
+if sys.version_info >= (3, 9):
+
+    def _get_type_hints(cls):
+        return typing.get_type_hints(cls, include_extras=True)
+
+else:
+    _get_type_hints = typing.get_type_hints
+
 
-def _process_class(cls, struct_name: typing.Optional[str]):
-    resolved_hints = typing.get_type_hints(cls)
+def _make_dataclass(cls, slots: bool, frozen: bool):
+    if not dataclasses.is_dataclass(cls):
+        kwargs = {"frozen": frozen}
+        if slots:
+            if sys.version_info < (3, 10):
+                raise TypeError("make_wpistruct(slots=True) requires Python 3.10+")
+            kwargs["slots"] = True
+        return dataclasses.dataclass(**kwargs)(cls)
+
+    if frozen and not cls.__dataclass_params__.frozen:
+        raise TypeError(
+            f"{cls.__qualname__} is already a dataclass, use @dataclass(frozen=True) instead"
+        )
+    if slots and "__slots__" not in cls.__dict__:
+        raise TypeError(
+            f"{cls.__qualname__} is already a dataclass, use @dataclass(slots=True) instead"
+        )
+    return cls
+
+
+def _process_class(cls, struct_name: typing.Optional[str], native: bool):
+    resolved_hints = _get_type_hints(cls)
     field_names = [field.name for field in dataclasses.fields(cls)]
     resolved_field_types = {name: resolved_hints[name] for name in field_names}
 
@@ -109,23 +195,160 @@ def _process_class(cls, struct_name: typing.Optional[str]):
 
     fmts = []
     schema = []
-    cvvals = []
-    vvals = []
+    nvals = 0
     packs = []
-    unpacks = []
-    # unpackIntos = []
+    pack_args: typing.List[typing.Union[str, typing.List[str]]] = []
+    unpack_args = []
+    unpackIntos = []
     forEachNested = []
+    layout = []
+    can_native = True
+
+    bits = BitFieldAllocator()
+    # pack expressions of the bit-fields in the current storage unit
+    unit: typing.List[str] = []
+
+    ctx: typing.Dict[str, typing.Any] = {"cls": cls, "_sx": signExtend}
+
+    def _unsupported(name: str):
+        supported_names = ", ".join(t.__name__ for t in _type_to_fmt.keys())
+        return TypeError(
+            f"{cls_name}.{name} is not a wpistruct or does not have a supported type hint "
+            f"(supported: {supported_names}, IntEnum, or Annotated arrays and bit-fields)"
+        )
 
-    ctx: typing.Dict[str, typing.Any] = {"cls": cls}
+    def _enum_schema(name: str, etype, stype: str):
+        values = ", ".join(f"{m.name}={int(m.value)}" for m in etype)
+        return f"enum {{{values}}} {stype} {name}"
 
     for name, ftype in resolved_field_types.items():
-        if ftype in _type_to_fmt:
+        # typing.Annotated
+        metadata = getattr(ftype, "__metadata__", ())
+        if metadata:
+            ftype = ftype.__origin__
+
+        array_size = None
+        bit_width = None
+        enum_fmt = None
+        for m in metadata:
+            if isinstance(m, bitfield):
+                bit_width = m.width
+            elif isinstance(m, int) and not isinstance(m, bool):
+                array_size = m
+            elif isinstance(m, type) and m in _type_to_fmt:
+                enum_fmt = _type_to_fmt[m]
+
+        if array_size is not None:
+            if typing.get_origin(ftype) is not list:
+                raise TypeError(f"{cls_name}.{name}: arrays must be annotated as list")
+            if array_size < 1:
+                raise ValueError(f"{cls_name}.{name}: array size must be at least 1")
+            args = typing.get_args(ftype)
+            if len(args) != 1:
+                raise _unsupported(name)
+            ftype = args[0]
+            # the size of enum arrays can be specified by the element
+            emetadata = getattr(ftype, "__metadata__", ())
+            if emetadata:
+                ftype = ftype.__origin__
+                for m in emetadata:
+                    if isinstance(m, type) and m in _type_to_fmt:
+                        enum_fmt = _type_to_fmt[m]
+
+        is_enum = (
+            isinstance(ftype, type)
+            and issubclass(ftype, enum.Enum)
+            and issubclass(ftype, int)
+        )
+
+        if enum_fmt is not None and not is_enum:
+            raise TypeError(
+                f"{cls_name}.{name}: a storage type can only be specified for IntEnum fields"
+            )
+
+        if bit_width is not None:
+            if array_size is not None or is_enum:
+                raise TypeError(f"{cls_name}.{name}: bit-fields must be bool or int")
+            if ftype is bool:
+                max_width = 1
+            elif ftype in _type_to_fmt and _type_to_fmt[ftype][0] in "bBhHiIqQ":
+                max_width = builtin_types[_type_to_fmt[ftype][1]][1] * 8
+            else:
+                raise TypeError(f"{cls_name}.{name}: bit-fields must be bool or int")
+
+            if bit_width < 1 or bit_width > max_width:
+                raise ValueError(
+                    f"{cls_name}.{name}: bit-field width must be between 1 and {max_width}"
+                )
+
+            stype = _type_to_fmt[ftype][1]
+            size, shift, is_new = bits.add(stype, bit_width)
+            if is_new:
+                unit = []
+                fmts.append(unsigned_fmts[size])
+                pack_args.append(unit)
+                nvals += 1
+
+            mask = (1 << bit_width) - 1
+            unit.append(f"((int(v.{name}) & {mask}) << {shift})")
+
+            raw = f"((_v[{nvals - 1}] >> {shift}) & {mask})"
+            val = bitFieldExpr(stype, raw, bit_width)
+
+            schema.append(f"{stype} {name}:{bit_width}")
+            unpack_args.append(val)
+            unpackIntos.append(f"v.{name} = {val}")
+            can_native = False
+            continue
+
+        bits.reset()
+
+        if is_enum:
+            fmt, stype = enum_fmt or _type_to_fmt[int32]
+            if fmt not in "bBhHiIqQ":
+                raise TypeError(f"{cls_name}.{name}: enum storage must be an int type")
+            enumn = f"enum_{name}"
+            ctx[enumn] = ftype
+            can_native = False
+
+            if array_size is None:
+                fmts.append(fmt)
+                schema.append(_enum_schema(name, ftype, stype))
+                pack_args.append(f"v.{name}")
+                val = f"{enumn}(_v[{nvals}])"
+                nvals += 1
+            else:
+                fmts.append(f"{array_size}{fmt}")
+                schema.append(_enum_schema(f"{name}[{array_size}]", ftype, stype))
+                packs.append(_check_len(name, array_size))
+                pack_args.append(f"*v.{name}")
+                val = f"[{enumn}(x) for x in _v[{nvals}:{nvals + array_size}]]"
+                nvals += array_size
+
+            unpack_args.append(val)
+            unpackIntos.append(f"v.{name} = {val}")
+
+        elif ftype in _type_to_fmt:
             fmt, stype = _type_to_fmt[ftype]
 
-            fmts.append(fmt)
-            schema.append(f"{stype} {name}")
-            cvvals.append(f"arg_{name}")
-            vvals.append(f"v.{name}")
+            if array_size is None:
+                fmts.append(fmt)
+                schema.append(f"{stype} {name}")
+                pack_args.append(f"v.{name}")
+                unpack_args.append(f"_v[{nvals}]")
+                unpackIntos.append(f"v.{name} = _v[{nvals}]")
+                layout.append((name, stype, None))
+                nvals += 1
+            else:
+                fmts.append(f"{array_size}{fmt}")
+                schema.append(f"{stype} {name}[{array_size}]")
+                packs.append(_check_len(name, array_size))
+                pack_args.append(f"*v.{name}")
+                val = f"list(_v[{nvals}:{nvals + array_size}])"
+                unpack_args.append(val)
+                unpackIntos.append(f"v.{name} = {val}")
+                nvals += array_size
+                can_native = False
 
         elif hasattr(ftype, "WPIStruct"):
             # nested struct
@@ -134,31 +357,41 @@ def _process_class(cls, struct_name: typing.Optional[str]):
 
             ctx[typn] = ftype
             ts = wpistruct.getTypeString(ftype).split(":", 1)[1].strip()
-            schema.append(f"{ts} {name}")
             sz = wpistruct.getSize(ftype)
-            fmts.append(f"{sz}s")
-            vvals.append(argn)
-            cvvals.append(argn)
-            packs.append(f"{argn} = wpistruct.pack(v.{name})")
-            unpacks.append(f"{argn} = wpistruct.unpack({typn}, {argn})")
-            # unpackIntos.append(f"wpistruct.unpackInto(v.{name}, {argn})")
             forEachNested.append(f"wpistruct.forEachNested({typn}, fn)")
+            pack_args.append(argn)
+
+            if array_size is None:
+                schema.append(f"{ts} {name}")
+                fmts.append(f"{sz}s")
+                packs.append(f"{argn} = wpistruct.pack(v.{name})")
+                unpack_args.append(f"wpistruct.unpack({typn}, _v[{nvals}])")
+                unpackIntos.append(f"wpistruct.unpackInto(v.{name}, _v[{nvals}])")
+                layout.append((name, ts, ftype))
+            else:
+                schema.append(f"{ts} {name}[{array_size}]")
+                fmts.append(f"{sz * array_size}s")
+                packs.append(_check_len(name, array_size))
+                packs.append(f"{argn} = wpistruct.packArray(v.{name})")
+                val = f"wpistruct.unpackArray({typn}, _v[{nvals}])"
+                unpack_args.append(val)
+                unpackIntos.append(f"v.{name} = {val}")
+                can_native = False
+
+            nvals += 1
 
         else:
-            supported_names = ", ".join(t.__name__ for t in _type_to_fmt.keys())
-            raise TypeError(
-                f"{cls_name}.{name} is not a wpistruct or does not have a supported type hint "
-                f"(supported: {supported_names})"
-            ) from None
+            raise _unsupported(name) from None
 
     s = struct.Struct(f"<{''.join(fmts)}")
-    cvals = ", ".join(cvvals)
-    vals = ", ".join(vvals)
+    pack_vals = ", ".join(
+        a if isinstance(a, str) else f"({' | '.join(a)})" for a in pack_args
+    )
+    unpack_vals = ", ".join(unpack_args)
 
     padding = "\n" + " " * 16
     pack_stmts = padding.join(packs)
-    unpack_stmts = padding.join(unpacks)
-    # unpackInto_stmts = padding.join(unpackIntos)
+    unpackInto_stmts = padding.join(unpackIntos) or "pass"
 
     if not forEachNested:
         forEachNested_stmt = "_forEachNested = None"
@@ -175,6 +408,27 @@ def _process_class(cls, struct_name: typing.Optional[str]):
 
     ctx["_s"] = s
 
+    frozen = cls.__dataclass_params__.frozen
+
+    # Slotted classes have slow constructors (especially when frozen), so
+    # set the slots directly unless __init__ needs to call __post_init__
+    slot_setters = {}
+    if "__slots__" in cls.__dict__ and not hasattr(cls, "__post_init__"):
+        for name in resolved_field_types:
+            desc = inspect.getattr_static(cls, name, None)
+            if not isinstance(desc, types.MemberDescriptorType):
+                slot_setters = {}
+                break
+            slot_setters[f"_set_{name}"] = desc.__set__
+
+    if slot_setters:
+        ctx.update(slot_setters)
+        ctx["_new"] = object.__new__
+        sets = [f"{setn}(_o, {val})" for setn, val in zip(slot_setters, unpack_args)]
+        unpack_stmts = padding.join(["_o = _new(cls)"] + sets + ["return _o"])
+    else:
+        unpack_stmts = f"return cls({unpack_vals})"
+
     # Construct the serialization functions using the same hack NamedTuple uses
     fnsrc = inspect.cleandoc(
         f"""
@@ -183,31 +437,37 @@ def _process_class(cls, struct_name: typing.Optional[str]):
         def _pack(v):
             try:
                 {pack_stmts}
-                return _s.pack({vals})
+                return _s.pack({pack_vals})
             except Exception as e:
                 raise ValueError(f"{err_name}: error packing data") from e
                             
         def _packInto(v, b):
             try:
                 {pack_stmts}
-                return _s.pack_into(b, 0, {vals})
+                return _s.pack_into(b, 0, {pack_vals})
             except Exception as e:
                 raise ValueError(f"{err_name}: error packing data") from e
 
         def _unpack(b):
             try:
-                {cvals} = _s.unpack(b)
+                _v = _s.unpack(b)
                 {unpack_stmts}
-                return cls({cvals})
             except Exception as e:
                 raise ValueError(f"{err_name}: error unpacking data") from e
         
-        #def _unpackInto(v, b):
-        #    try:
-        #        {vals} = _s.unpack(b)
-        #        {{unpackInto_stmts}}
-        #    except Exception as e:
-        #        raise ValueError(f"{err_name}: error unpacking data") from e
+        def _unpackFrom(b, o):
+            try:
+                _v = _s.unpack_from(b, o)
+                {unpack_stmts}
+            except Exception as e:
+                raise ValueError(f"{err_name}: error unpacking data") from e
+
+        def _unpackInto(v, b):
+            try:
+                _v = _s.unpack(b)
+                {unpackInto_stmts}
+            except Exception as e:
+                raise ValueError(f"{err_name}: error unpacking data") from e
 
         {forEachNested_stmt}
     """
@@ -215,6 +475,12 @@ def _process_class(cls, struct_name: typing.Optional[str]):
 
     exec(fnsrc, ctx, ctx)
 
+    # frozen dataclasses cannot be modified in place
+    if frozen:
+        unpackInto = None
+    else:
+        unpackInto = ctx["_unpackInto"]
+
     cls.WPIStruct = StructDescriptor(
         typeString=f"struct:{struct_name}",
         schema="; ".join(schema),
@@ -222,8 +488,17 @@ def _process_class(cls, struct_name: typing.Optional[str]):
         pack=ctx["_pack"],
         packInto=ctx["_packInto"],
         unpack=ctx["_unpack"],
-        # unpackInto=ctx["_unpackInto"],
         forEachNested=ctx["_forEachNested"],
+        unpackInto=unpackInto,
+        layout=StructLayout(cls, tuple(layout)) if native and can_native else None,
+        unpackFrom=ctx["_unpackFrom"],
     )
 
     return cls
+
+
+def _check_len(name: str, size: int) -> str:
+    return (
+        f"if len(v.{name}) != {size}: "
+        f"raise ValueError(f'{name}: expected {size} elements, got {{len(v.{name})}}')"
+    )
@@ -7,6 +7,25 @@ else:
     Buffer = bytearray
 
 
+class StructLayout(typing.NamedTuple):
+    """
+    Describes the fields of a struct so that it can be serialized natively,
+    without calling the pack/unpack functions of its :class:`StructDescriptor`.
+
+    Generated by :func:`wpiutil.wpistruct.make_wpistruct` when ``native=True``
+    """
+
+    #: The type that is created when unpacking; it is called with the value
+    #: of each field as positional arguments. Slotted classes without
+    #: ``__post_init__`` are created without calling ``__init__`` instead
+    cls: type
+
+    #: (name, schema type, nested struct type) for each field in order. The
+    #: nested struct type is None unless the field is a struct. Its WPIStruct
+    #: may be replaced, but its size must not change
+    fields: typing.Sequence[typing.Tuple[str, str, typing.Optional[type]]]
+
+
 class StructDescriptor(typing.NamedTuple):
     """
     To define a type in python that can use the wpilib serialization, the type must
@@ -38,11 +57,20 @@ class StructDescriptor(typing.NamedTuple):
     #: A function that converts bytes to an instance
     unpack: typing.Callable[[Buffer], typing.Any]
 
-    #: A function that updates the given instance using the deserialized bytes
-    #: .. not supported
-    # unpackInto: typing.Callable[[typing.Any, Buffer], None]
-
     #: If this contains nested structs, calls wpiutil.wpistruct.forEachNested for each
     forEachNested: typing.Optional[
         typing.Callable[[typing.Callable[[str, str], None]], None]
     ]
+
+    #: A function that updates the given instance using the deserialized bytes.
+    #: If not present, unpackInto is not supported for this type
+    unpackInto: typing.Optional[typing.Callable[[typing.Any, Buffer], None]] = None
+
+    #: If present, the struct is serialized natively using this layout
+    #: instead of calling pack/unpack
+    layout: typing.Optional[StructLayout] = None
+
+    #: A function that converts the bytes at an offset in a buffer to an
+    #: instance. If present, it is used instead of unpack when decoding
+    #: consecutive structs (such as with unpackArray or Unpacker)
+    unpackFrom: typing.Optional[typing.Callable[[Buffer, int], typing.Any]] = None
@@ -0,0 +1,87 @@
+import typing
+
+from ._schema import builtin_types, parseSchema, structName
+from .._wpiutil import wpistruct
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+
+def getDtype(t: type) -> "numpy.dtype":
+    """
+    Returns a numpy structured dtype that is equivalent to the binary
+    representation of the specified WPIStruct type. Nested structs are
+    represented as nested structured dtypes, and arrays as subarrays.
+
+    This allows a buffer of packed structs to be accessed without
+    unpacking each of them::
+
+        dtype = wpiutil.wpistruct.getDtype(Pose2d)
+        arr = numpy.frombuffer(data, dtype=dtype)
+        xs = arr["translation"]["x"]
+
+    .. note:: numpy must be installed to use this function. Structs that
+              contain bit-fields cannot be represented as a dtype.
+    """
+    import numpy as np
+
+    schemas: typing.Dict[str, str] = {}
+
+    def _fn(typeString: str, schema: str):
+        schemas[structName(typeString)] = schema
+
+    wpistruct.forEachNested(t, _fn)
+
+    name = structName(wpistruct.getTypeString(t))
+    dtype = _make_dtype(np, name, schemas, {})
+
+    size = wpistruct.getSize(t)
+    if dtype.itemsize != size:
+        raise ValueError(
+            f"{name}: schema size ({dtype.itemsize}) does not match struct size ({size})"
+        )
+
+    return dtype
+
+
+def _make_dtype(np, name: str, schemas: typing.Dict[str, str], dtypes: dict):
+    dtype = dtypes.get(name)
+    if dtype is not None:
+        return dtype
+
+    try:
+        schema = schemas[name]
+    except KeyError:
+        raise ValueError(f"schema for struct '{name}' is not available") from None
+
+    try:
+        fields = parseSchema(schema)
+    except ValueError as e:
+        raise ValueError(f"{name}: {e}") from None
+
+    dfields = []
+    for f in fields:
+        if f.bitWidth is not None:
+            raise ValueError(
+                f"{name}.{f.name}: bit-fields cannot be represented as a numpy dtype"
+            )
+
+        if f.type == "char" and f.arraySize is not None:
+            # strings are the only thing you'd reasonably store in a char array
+            dfields.append((f.name, f"S{f.arraySize}"))
+            continue
+
+        if f.isBuiltin:
+            fmt = builtin_types[f.type][0]
+            ft = np.dtype("S1" if fmt == "c" else f"<{fmt}")
+        else:
+            ft = _make_dtype(np, f.type, schemas, dtypes)
+
+        if f.arraySize is not None:
+            ft = np.dtype((ft, (f.arraySize,)))
+
+        dfields.append((f.name, ft))
+
+    dtype = np.dtype(dfields)
+    dtypes[name] = dtype
+    return dtype
@@ -0,0 +1,363 @@
+import struct
+import typing
+
+from ._schema import (
+    BitFieldAllocator,
+    SchemaField,
+    bitFieldExpr,
+    builtin_types,
+    parseSchema,
+    signExtend,
+    structName,
+    unsigned_fmts,
+)
+from .dtype import _make_dtype
+from .._wpiutil import wpistruct
+
+if typing.TYPE_CHECKING:
+    import numpy
+    from typing_extensions import Buffer
+else:
+    Buffer = bytearray
+
+
+class StructDecoder:
+    """
+    Decodes the binary representation of a struct using only its schema,
+    without needing the python type that it was created from.
+
+    The schema is compiled once (including any nested structs) into a single
+    :class:`struct.Struct` and generated conversion functions, so reuse the
+    decoder for each record that you need to decode. Retrieve decoders
+    from a :class:`StructRegistry`.
+
+    Values are converted as follows:
+
+    * nested structs are tuples (or dicts)
+    * arrays are tuples
+    * char arrays are strings
+    * enums and bit-fields are integers (or bool for bool bit-fields)
+    """
+
+    def __init__(self, name: str, schemas: typing.Mapping[str, str]):
+        fmts: typing.List[str] = []
+        compiler = _Compiler(schemas, fmts)
+        fields = compiler.compile(name, ())
+
+        #: Name of the struct
+        self.name = name
+        #: The struct schema
+        self.schema = schemas[name]
+        #: The type string of the struct
+        self.typeString = f"struct:{name}"
+
+        self._schemas = dict(schemas)
+        self._dtype = None
+
+        s = struct.Struct("<" + "".join(fmts))
+
+        #: Size in bytes of the binary representation of the struct
+        self.size = s.size
+
+        #: Names of the fields of the struct
+        self.fieldNames = tuple(f[0] for f in fields)
+
+        texprs = [f[1] for f in fields]
+        tvals = ", ".join(texprs)
+        dvals = ", ".join(f"{n!r}: {d}" for n, _, d in fields)
+
+        # if the struct has no arrays, nested structs, or bit-fields then
+        # the tuple produced by struct.Struct can be returned directly
+        if texprs == [f"v[{i}]" for i in range(compiler.idx)]:
+            unpack_stmt = "return _s.unpack(b)"
+            unpackArray_stmt = "return list(_s.iter_unpack(b))"
+        else:
+            unpack_stmt = f"v = _s.unpack(b)\n        return ({tvals},)"
+            unpackArray_stmt = f"return [({tvals},) for v in _s.iter_unpack(b)]"
+
+        ctx: typing.Dict[str, typing.Any] = {
+            "struct": struct,
+            "_s": s,
+            "_sx": signExtend,
+            "_str": _decode_str,
+            # the name comes from the log, so it is never pasted into the source
+            "_name": name,
+        }
+
+        # Construct the decode functions using the same hack that
+        # make_wpistruct uses
+        fnsrc = f"""
+def unpack(b):
+    try:
+        {unpack_stmt}
+    except struct.error as e:
+        raise ValueError(f"{{_name}}: error unpacking data ({{e}})") from None
+
+def unpackDict(b):
+    try:
+        v = _s.unpack(b)
+        return {{{dvals}}}
+    except struct.error as e:
+        raise ValueError(f"{{_name}}: error unpacking data ({{e}})") from None
+
+def unpackArray(b):
+    try:
+        {unpackArray_stmt}
+    except struct.error as e:
+        raise ValueError(f"{{_name}}: error unpacking data ({{e}})") from None
+
+def unpackArrayDict(b):
+    try:
+        return [{{{dvals}}} for v in _s.iter_unpack(b)]
+    except struct.error as e:
+        raise ValueError(f"{{_name}}: error unpacking data ({{e}})") from None
+"""
+        exec(fnsrc, ctx, ctx)
+
+        self._unpack = ctx["unpack"]
+        self._unpackDict = ctx["unpackDict"]
+        self._unpackArray = ctx["unpackArray"]
+        self._unpackArrayDict = ctx["unpackArrayDict"]
+
+    def __repr__(self) -> str:
+        return f"<StructDecoder {self.typeString}>"
+
+    def unpack(self, data: Buffer) -> tuple:
+        """Decodes a single struct into a tuple. data must be exactly the size of the struct"""
+        return self._unpack(data)
+
+    def unpackDict(self, data: Buffer) -> typing.Dict[str, typing.Any]:
+        """Decodes a single struct into a dict. data must be exactly the size of the struct"""
+        return self._unpackDict(data)
+
+    def unpackArray(self, data: Buffer) -> typing.List[tuple]:
+        """Decodes an array of structs into a list of tuples"""
+        return self._unpackArray(data)
+
+    def unpackArrayDict(
+        self, data: Buffer
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Decodes an array of structs into a list of dicts"""
+        return self._unpackArrayDict(data)
+
+    @property
+    def dtype(self) -> "numpy.dtype":
+        """
+        numpy structured dtype equivalent to this struct. See
+        :func:`wpiutil.wpistruct.getDtype`
+        """
+        if self._dtype is None:
+            import numpy as np
+
+            self._dtype = _make_dtype(np, self.name, self._schemas, {})
+        return self._dtype
+
+    def unpackNumpy(self, data: Buffer) -> "numpy.ndarray":
+        """
+        Returns a numpy record array that views one or more packed structs
+        without copying them
+        """
+        import numpy as np
+
+        return np.frombuffer(data, dtype=self.dtype)
+
+
+class StructRegistry:
+    """
+    Holds struct schemas and creates :class:`StructDecoder` objects for
+    them, which allows decoding struct data when the python types are not
+    available (such as when reading a data log)::
+
+        registry = StructRegistry()
+
+        for record in reader:
+            ...
+            if entry.type == "structschema":
+                registry.addSchema(entry.name, record.getRaw())
+            elif entry.type.startswith("struct:"):
+                value = registry.unpack(entry.type, record.getRaw())
+
+    Decoders are cached until a schema they depend on is changed.
+    """
+
+    def __init__(self):
+        self._schemas: typing.Dict[str, str] = {}
+        self._decoders: typing.Dict[str, StructDecoder] = {}
+
+    def addSchema(self, name: str, schema: typing.Union[str, Buffer]) -> None:
+        """
+        Adds or replaces a struct schema
+
+        :param name:   Name of the struct. Can be the type string
+                       (``struct:Name``), the name of a schema entry
+                       (``/.schema/struct:Name``), or just the name
+        :param schema: The struct schema. If it is bytes, it must be UTF-8
+        """
+        name = self._normalize(name)
+        if not isinstance(schema, str):
+            schema = bytes(schema).decode("utf-8")
+
+        if self._schemas.get(name) != schema:
+            self._schemas[name] = schema
+            # any decoder could depend on this schema
+            self._decoders.clear()
+
+    def addType(self, t: type) -> None:
+        """Adds the schemas of a WPIStruct type and any structs it contains"""
+        wpistruct.forEachNested(t, self.addSchema)
+
+    def hasSchema(self, name: str) -> bool:
+        return self._normalize(name) in self._schemas
+
+    def getSchema(self, name: str) -> str:
+        return self._schemas[self._normalize(name)]
+
+    def getDecoder(self, name: str) -> StructDecoder:
+        """
+        Retrieves the decoder for a struct. Raises ValueError if the schema
+        for the struct or any of its nested structs has not been added, or
+        if a schema is invalid.
+
+        :param name: Name or type string of the struct
+        """
+        name = self._normalize(name)
+        decoder = self._decoders.get(name)
+        if decoder is None:
+            decoder = StructDecoder(name, self._schemas)
+            self._decoders[name] = decoder
+        return decoder
+
+    def unpack(
+        self, typeString: str, data: Buffer
+    ) -> typing.Union[tuple, typing.List[tuple]]:
+        """
+        Decodes struct data into tuples. If the type string is for a struct
+        array (``struct:Name[]``), a list is returned
+        """
+        if typeString.endswith("[]"):
+            return self.getDecoder(typeString[:-2]).unpackArray(data)
+        return self.getDecoder(typeString).unpack(data)
+
+    def unpackDict(
+        self, typeString: str, data: Buffer
+    ) -> typing.Union[typing.Dict[str, typing.Any], typing.List[typing.Dict]]:
+        """
+        Decodes struct data into dicts. If the type string is for a struct
+        array (``struct:Name[]``), a list is returned
+        """
+        if typeString.endswith("[]"):
+            return self.getDecoder(typeString[:-2]).unpackArrayDict(data)
+        return self.getDecoder(typeString).unpackDict(data)
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        # NT and datalog schema entries are named .../.schema/struct:Name
+        name = name.rpartition(".schema/")[2]
+        if ":" in name:
+            return structName(name)
+        return name.strip()
+
+
+#
+# Internals
+#
+
+
+def _decode_str(v: bytes) -> str:
+    return v.rstrip(b"\0").decode("utf-8", "replace")
+
+
+class _Compiler:
+    """
+    Flattens a struct and all nested structs into a list of format
+    characters, and produces an expression for each field that retrieves
+    the value of that field from the tuple (v) that the format unpacks to
+    """
+
+    def __init__(self, schemas: typing.Mapping[str, str], fmts: typing.List[str]):
+        self.schemas = schemas
+        self.fmts = fmts
+        self.idx = 0
+
+    def _add(self, fmt: str, count: int) -> int:
+        idx = self.idx
+        self.fmts.append(fmt)
+        self.idx += count
+        return idx
+
+    def compile(
+        self, name: str, stack: typing.Tuple[str, ...]
+    ) -> typing.List[typing.Tuple[str, str, str]]:
+        """Returns (name, tuple expression, dict expression) for each field"""
+        if name in stack:
+            raise ValueError(f"{name}: struct cannot contain itself")
+
+        try:
+            schema = self.schemas[name]
+        except KeyError:
+            raise ValueError(f"schema for struct '{name}' is not available") from None
+
+        try:
+            fields = parseSchema(schema)
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}") from None
+
+        if not fields:
+            raise ValueError(f"{name}: schema has no fields")
+
+        stack = stack + (name,)
+
+        out = []
+
+        bits = BitFieldAllocator()
+        # index of the current bit-field storage unit
+        unitIdx = 0
+
+        for f in fields:
+            if f.bitWidth is not None:
+                size, shift, isNew = bits.add(f.type, f.bitWidth)
+                if isNew:
+                    unitIdx = self._add(unsigned_fmts[size], 1)
+
+                raw = f"((v[{unitIdx}] >> {shift}) & {(1 << f.bitWidth) - 1})"
+                expr = bitFieldExpr(f.type, raw, f.bitWidth)
+                out.append((f.name, expr, expr))
+                continue
+
+            bits.reset()
+
+            if f.isBuiltin:
+                texpr = self._builtin(f)
+                out.append((f.name, texpr, texpr))
+            else:
+                count = f.arraySize or 1
+                elems = [self.compile(f.type, stack) for _ in range(count)]
+                texprs = ["(" + ", ".join(e[1] for e in el) + ",)" for el in elems]
+                dexprs = [
+                    "{" + ", ".join(f"{e[0]!r}: {e[2]}" for e in el) + "}"
+                    for el in elems
+                ]
+                if f.arraySize is None:
+                    out.append((f.name, texprs[0], dexprs[0]))
+                else:
+                    out.append(
+                        (
+                            f.name,
+                            "(" + ", ".join(texprs) + ",)",
+                            "(" + ", ".join(dexprs) + ",)",
+                        )
+                    )
+
+        return out
+
+    def _builtin(self, f: SchemaField) -> str:
+        fmt = builtin_types[f.type][0]
+        if fmt == "c":
+            idx = self._add(f"{f.arraySize or 1}s", 1)
+            return f"_str(v[{idx}])"
+        elif f.arraySize is None:
+            idx = self._add(fmt, 1)
+            return f"v[{idx}]"
+        else:
+            idx = self._add(f"{f.arraySize}{fmt}", f.arraySize)
+            return f"v[{idx}:{idx + f.arraySize}]"